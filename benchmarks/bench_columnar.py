@@ -0,0 +1,72 @@
+"""
+Micro-benchmark: bulk calculation payloads as JSON versus Arrow IPC and Parquet.
+
+Each case decodes a request of ``rows`` amounts, calculates it against a
+three-bracket rule and encodes the response, as the batch endpoints do: JSON
+through ``BatchCalculationRequest`` and the per-amount table walk, columnar
+payloads through ``columnar_io`` and the vector kernel. Requires numpy and
+pyarrow.
+
+Run from the repository root:
+    python -m benchmarks.bench_columnar [rows]
+"""
+import json
+import sys
+import timeit
+
+import numpy as np
+
+from src.application.services import columnar_io
+from src.application.services.bracket_table import CompiledBracketTable
+from src.application.services.vector_kernel import VectorTable, round_cents
+from src.presentation.api.v1.schemas.request.batch_calculation_request import BatchCalculationRequest
+
+BRACKETS = [
+    {"min_amount": 0, "max_amount": 10000, "rate": 10},
+    {"min_amount": 10000, "max_amount": 50000, "rate": 20},
+    {"min_amount": 50000, "max_amount": None, "rate": 40},
+]
+
+
+def main(count: int = 100000) -> None:
+    import pyarrow as pa
+
+    table = CompiledBracketTable.from_brackets(BRACKETS)
+    vector_table = VectorTable.from_table(table)
+    amounts = np.round(np.random.default_rng(0).uniform(0, 200000, count), 2)
+
+    json_body = json.dumps({"amounts": amounts.tolist()}).encode()
+    columnar_bodies = {
+        fmt: columnar_io.write_table(pa.table({"amount": amounts}), fmt)
+        for fmt in (columnar_io.FORMAT_ARROW, columnar_io.FORMAT_PARQUET)
+    }
+
+    def run_json():
+        request = BatchCalculationRequest(**json.loads(json_body))
+        taxes = [round(table.tax_for(a), 2) for a in request.amounts]
+        return json.dumps({"tax_amounts": taxes}).encode()
+
+    def run_columnar(fmt):
+        request = columnar_io.read_table(columnar_bodies[fmt], fmt)
+        column = round_cents(columnar_io.amount_column(request, "amount"))
+        tax, effective = vector_table.evaluate(column)
+        return columnar_io.write_table(columnar_io.with_results(request, tax, effective, "2024.1"), fmt)
+
+    cases = {
+        "JSON": (json_body, run_json),
+        "Arrow IPC": (columnar_bodies[columnar_io.FORMAT_ARROW], lambda: run_columnar(columnar_io.FORMAT_ARROW)),
+        "Parquet": (columnar_bodies[columnar_io.FORMAT_PARQUET], lambda: run_columnar(columnar_io.FORMAT_PARQUET)),
+    }
+
+    print(f"{count} rows, best of 3")
+    baseline = None
+    for name, (body, run) in cases.items():
+        seconds = min(timeit.repeat(run, number=1, repeat=3))
+        response_bytes = len(run())
+        baseline = baseline or seconds
+        print(f"  {name:<10} request {len(body) / 1e6:7.2f} MB  response {response_bytes / 1e6:7.2f} MB"
+              f"  {seconds * 1e3:8.1f} ms  {baseline / seconds:6.1f}x")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100000)
@@ -0,0 +1,70 @@
+"""
+Micro-benchmark: per-row cost of building TaxRuleResponse objects.
+
+Compares the former BaseSettings-derived DTO (which reads the environment and
+settings sources on every instantiation) with the plain model built from
+keyword arguments, with ``model_construct``, and validated from the entity's
+attributes, the path ``TaxRuleMapper.to_tax_rule_response`` uses.
+
+Run from the repository root:
+    python -m benchmarks.bench_rule_response [rows]
+"""
+import sys
+import timeit
+from typing import Any, Dict, Optional
+
+from pydantic_settings import BaseSettings
+
+from src.application.mappers.tax_rule_mapper import TaxRuleMapper
+from src.presentation.api.v1.schemas.response.rule_response import TaxRuleResponse
+
+
+class LegacyTaxRuleResponse(BaseSettings):
+    """The DTO as it was before: a settings class used as a response model."""
+    id: int
+    rule_type: str
+    version: str
+    is_active: bool
+    tax_rule: Dict[str, Any]
+    country_code: Optional[str] = None
+
+
+def _rows(count: int):
+    brackets = {"brackets": [
+        {"min_amount": 0, "max_amount": 10000, "rate": 10},
+        {"min_amount": 10000, "max_amount": 50000, "rate": 20},
+        {"min_amount": 50000, "max_amount": None, "rate": 40},
+    ]}
+    return [TaxRuleMapper.from_dict({
+        "id": i, "rule_type": "income_tax", "version": f"2024.{i}", "tax_rule": brackets,
+        "is_active": i == 0, "country_code": "US"
+    }) for i in range(count)]
+
+
+def _fields(rule):
+    return dict(
+        id=rule.id, rule_type=rule.rule_type, version=rule.version, is_active=rule.is_active,
+        tax_rule=rule.tax_rule, country_code=rule.country_code
+    )
+
+
+def main(count: int = 10000) -> None:
+    rows = _rows(count)
+    cases = {
+        "BaseSettings (before)": lambda: [LegacyTaxRuleResponse(**_fields(r)) for r in rows],
+        "BaseModel, keyword arguments": lambda: [TaxRuleResponse(**_fields(r)) for r in rows],
+        "BaseModel, model_construct": lambda: [TaxRuleResponse.model_construct(**_fields(r)) for r in rows],
+        "BaseModel, from attributes": lambda: [TaxRuleMapper.to_tax_rule_response(r) for r in rows],
+    }
+
+    print(f"{count} rows, best of 3")
+    baseline = None
+    for name, build in cases.items():
+        seconds = min(timeit.repeat(build, number=1, repeat=3))
+        per_row_us = seconds / count * 1e6
+        baseline = baseline or per_row_us
+        print(f"  {name:<30} {per_row_us:9.2f} us/row  {baseline / per_row_us:7.1f}x")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10000)
@@ -0,0 +1,78 @@
+"""
+Startup benchmark: cold import time of ``src.main`` and time to the first
+successful request, checked against ``startup_budget.json``.
+
+Each run is a fresh interpreter. The first request goes through the real
+lifespan (settings, database tables, services), so that measurement needs the
+configured database; use ``--import-only`` without one.
+
+Run from the repository root:
+    python -m benchmarks.bench_startup [--runs 5] [--import-only] [--check]
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+BUDGET_PATH = os.path.join(os.path.dirname(__file__), "startup_budget.json")
+
+_PROBE = """
+import json, time
+started = time.perf_counter()
+import src.main
+imported = time.perf_counter() - started
+result = {"import_seconds": imported}
+if %(first_request)s:
+    from fastapi.testclient import TestClient
+    with TestClient(src.main.app) as client:  # Runs the lifespan, as a server would
+        response = client.get("/api/v1/health/")
+        result["first_request_seconds"] = time.perf_counter() - started
+        result["status_code"] = response.status_code
+print(json.dumps(result))
+"""
+
+
+def _run_once(first_request: bool) -> dict:
+    completed = subprocess.run(
+        [sys.executable, "-c", _PROBE % {"first_request": first_request}],
+        capture_output=True, text=True, check=False
+    )
+    if completed.returncode != 0:
+        raise RuntimeError(f"Startup probe failed:\n{completed.stderr.strip()}")
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--import-only", action="store_true", help="Skip the first request (no database needed)")
+    parser.add_argument("--check", action="store_true", help="Exit with status 1 if a median exceeds the budget")
+    args = parser.parse_args()
+
+    runs = [_run_once(not args.import_only) for _ in range(args.runs)]
+    if any(run.get("status_code", 200) != 200 for run in runs):
+        print(f"First request failed: {[run.get('status_code') for run in runs]}")
+        return 1
+
+    with open(BUDGET_PATH) as f:
+        budget = json.load(f)
+
+    over_budget = False
+    print(f"{args.runs} runs, median")
+    for metric in ("import_seconds", "first_request_seconds"):
+        values = [run[metric] for run in runs if metric in run]
+        if not values:
+            continue
+        median = statistics.median(values)
+        limit = budget[metric]
+        status = "ok" if median <= limit else "OVER BUDGET"
+        over_budget = over_budget or median > limit
+        print(f"  {metric:<24} {median * 1000:8.1f} ms  (budget {limit * 1000:.0f} ms)  {status}")
+
+    return 1 if args.check and over_budget else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
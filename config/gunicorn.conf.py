@@ -0,0 +1,29 @@
+"""
+Gunicorn configuration for production.
+
+The application is imported once in the master (``preload_app``), which also
+loads and compiles the active rules before forking, so the four workers boot
+without a database round trip per rule and share the compiled tables
+copy-on-write. Database connections are never carried across the fork: the
+master closes its pool after the preload, and each worker discards any
+inherited pool (see DatabaseConfig).
+
+    gunicorn -c config/gunicorn.conf.py src.main:app
+"""
+import os
+
+bind = os.getenv("GUNICORN_BIND", "0.0.0.0:8000")
+workers = int(os.getenv("GUNICORN_WORKERS", "4"))
+worker_class = "uvicorn.workers.UvicornWorker"
+preload_app = os.getenv("GUNICORN_PRELOAD", "true").lower() == "true"
+accesslog = "-"
+errorlog = "-"
+
+
+def when_ready(server):
+    """Runs in the master after the application is imported, before any worker is forked."""
+    if not preload_app:
+        return
+    from src.infrastructure.configuration.preload import preload_rule_index
+    loaded = preload_rule_index()
+    server.log.info(f"Preloaded {loaded} active rules before forking workers")
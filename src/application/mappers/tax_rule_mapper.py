@@ -1,6 +1,17 @@
 # src/application/mappers/tax_rule_mapper.py
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional, Tuple
 from src.domain.entities.tax_rule import TaxRule
+from src.presentation.api.v1.schemas.response.batch_calculation_response import BatchCalculationResponse
+from src.presentation.api.v1.schemas.response.calculation_job_response import (
+    CalculationJobResponse,
+    CalculationJobResultsResponse
+)
+from src.presentation.api.v1.schemas.response.inverse_calculation_response import (
+    InverseCalculationResponse,
+    InverseCalculationResult
+)
+from src.presentation.api.v1.schemas.response.rule_response import TaxRuleResponse
+from src.presentation.api.v1.schemas.response.scenario_response import TaxScenarioPoint, TaxScenarioResponse
 from src.presentation.api.v1.schemas.response.tax_calculation_response import TaxCalculationResponse
 
 class TaxRuleMapper:
@@ -12,19 +23,150 @@ class TaxRuleMapper:
             rule_type=data["rule_type"],
             version=data["version"],
             tax_rule=data["tax_rule"],
-            is_active=data["is_active"]
+            is_active=data["is_active"],
+            country_code=data.get("country_code")
         )
 
+    @staticmethod
+    def to_tax_rule_response(rule: TaxRule) -> TaxRuleResponse:
+        """
+        Map a stored rule to API response, validated straight from the entity's
+        attributes. This is cheaper per row than building keyword arguments, and
+        than ``model_construct``, which runs in Python rather than pydantic-core.
+        """
+        return TaxRuleResponse.model_validate(rule, from_attributes=True)
+
     @staticmethod
     def to_tax_calculation_response(
         amount: float,
         result: Dict[str, Any],
-        rule_version: str
+        rule_version: str,
+        country_code: Optional[str] = None,
+        residency: Optional[str] = None,
+        rule_stale_seconds: Optional[float] = None
     ) -> TaxCalculationResponse:
         """Map calculation result to API response."""
         return TaxCalculationResponse(
             income=amount,
             tax_amount=result["tax_amount"],
             rule_version=rule_version,
-            breakdown=result.get("breakdown", {})
+            country_code=country_code,
+            residency=residency,
+            rule_stale_seconds=rule_stale_seconds,
+            breakdown=result.get("breakdown")
+        )
+
+    @staticmethod
+    def to_tax_scenario_response(
+        points: List[Tuple[float, float, float]],
+        rule_type: str,
+        rule_version: str,
+        country_code: Optional[str] = None,
+        residency: Optional[str] = None,
+        rule_stale_seconds: Optional[float] = None
+    ) -> TaxScenarioResponse:
+        """Map (amount, tax_amount, marginal_rate) tuples to API response."""
+        return TaxScenarioResponse(
+            success=True,
+            message="",
+            rule_type=rule_type,
+            rule_version=rule_version,
+            country_code=country_code,
+            residency=residency,
+            rule_stale_seconds=rule_stale_seconds,
+            points=[
+                TaxScenarioPoint(
+                    amount=amount,
+                    tax_amount=tax_amount,
+                    marginal_rate=round(marginal_rate * 100, 2),
+                    effective_rate=round(tax_amount / amount * 100, 2) if amount else 0.0
+                )
+                for amount, tax_amount, marginal_rate in points
+            ]
+        )
+
+    @staticmethod
+    def to_inverse_calculation_response(
+        results: List[Tuple[float, float, float]],
+        rule_type: str,
+        rule_version: str,
+        country_code: Optional[str] = None,
+        residency: Optional[str] = None,
+        rule_stale_seconds: Optional[float] = None
+    ) -> InverseCalculationResponse:
+        """Map (net_amount, gross_amount, tax_amount) tuples to API response."""
+        return InverseCalculationResponse(
+            success=True,
+            message="",
+            rule_type=rule_type,
+            rule_version=rule_version,
+            country_code=country_code,
+            residency=residency,
+            rule_stale_seconds=rule_stale_seconds,
+            results=[
+                InverseCalculationResult(net_amount=net, gross_amount=gross, tax_amount=tax)
+                for net, gross, tax in results
+            ]
+        )
+
+    @staticmethod
+    def to_batch_calculation_response(
+        tax_amounts: List[float],
+        rule_type: str,
+        rule_version: str,
+        country_code: Optional[str] = None,
+        residency: Optional[str] = None,
+        rule_stale_seconds: Optional[float] = None
+    ) -> BatchCalculationResponse:
+        """Map batch tax amounts to API response."""
+        return BatchCalculationResponse(
+            success=True,
+            message="",
+            rule_type=rule_type,
+            rule_version=rule_version,
+            country_code=country_code,
+            residency=residency,
+            rule_stale_seconds=rule_stale_seconds,
+            tax_amounts=tax_amounts
+        )
+
+    @staticmethod
+    def to_calculation_job_response(job: Dict[str, Any]) -> CalculationJobResponse:
+        """Map a stored calculation job to API response."""
+        return CalculationJobResponse(
+            success=True,
+            message="",
+            job_id=job["job_id"],
+            status=job["status"],
+            rule_type=job["rule_type"],
+            country_code=job["country_code"],
+            residency=job["residency"],
+            rule_version=job.get("rule_version"),
+            total_count=job["total_count"],
+            processed_count=job["processed_count"],
+            error=job.get("error"),
+            created_at=job["created_at"].isoformat() if job.get("created_at") else None,
+            started_at=job["started_at"].isoformat() if job.get("started_at") else None,
+            completed_at=job["completed_at"].isoformat() if job.get("completed_at") else None
+        )
+
+    @staticmethod
+    def to_calculation_job_results_response(
+        job: Dict[str, Any],
+        offset: int,
+        tax_amounts: List[float]
+    ) -> CalculationJobResultsResponse:
+        """Map one page of a job's results to API response."""
+        end = offset + len(tax_amounts)
+        return CalculationJobResultsResponse(
+            success=True,
+            message="",
+            job_id=job["job_id"],
+            status=job["status"],
+            rule_version=job.get("rule_version"),
+            offset=offset,
+            total_count=job["total_count"],
+            processed_count=job["processed_count"],
+            next_offset=end if end < job["processed_count"] else None,
+            tax_amounts=tax_amounts
         )
@@ -0,0 +1,169 @@
+"""
+Application Service: AdmissionController
+Adaptive concurrency limit with priority admission, for shedding load early.
+"""
+import asyncio
+import heapq
+import itertools
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+PRIORITY_CRITICAL = 0  # Interactive calculations
+PRIORITY_NORMAL = 1    # Rule reads and writes
+PRIORITY_BULK = 2      # Batches, job submissions, audit exports
+
+PRIORITY_NAMES = {PRIORITY_CRITICAL: "critical", PRIORITY_NORMAL: "normal", PRIORITY_BULK: "bulk"}
+
+# Share of the concurrency limit each priority may fill; the rest stays free for higher priorities
+PRIORITY_SHARES = {PRIORITY_CRITICAL: 1.0, PRIORITY_NORMAL: 0.75, PRIORITY_BULK: 0.5}
+
+
+class AdmissionController:
+    """
+    Per-worker admission control with an AIMD concurrency limit.
+
+    A request is admitted while the requests in flight are below its
+    priority's share of the limit. Otherwise it waits in a priority queue for
+    at most its queue budget (critical requests longest, bulk requests not at
+    all) and is shed if no slot frees up in time, so overload is answered
+    immediately instead of by a timeout deep in the service.
+
+    The limit adapts to observed latency: every critical or normal request
+    completing within ``latency_target_seconds`` grows it by ``1/limit``
+    (about one per full window), and one completing above the target shrinks
+    it by ``backoff_ratio``, at most once per target interval. Bulk requests
+    are slow by design and do not move the limit.
+    """
+
+    def __init__(
+        self,
+        initial_limit: int = 64,
+        min_limit: int = 8,
+        max_limit: int = 1024,
+        latency_target_seconds: float = 0.25,
+        backoff_ratio: float = 0.9,
+        max_queue_wait_seconds: float = 0.2,
+        max_waiters: int = 1000,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Args:
+            initial_limit: Concurrency limit before any latency is observed
+            min_limit: Floor of the adaptive limit
+            max_limit: Ceiling of the adaptive limit
+            latency_target_seconds: Service time above which the limit backs off
+            backoff_ratio: Factor applied to the limit when the target is exceeded
+            max_queue_wait_seconds: Queue budget of critical requests; normal requests get a quarter, bulk none
+            max_waiters: Requests allowed to wait at once before new ones are shed
+            clock: Monotonic clock, replaceable in tests
+        """
+        self.limit = float(initial_limit)
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.latency_target_seconds = latency_target_seconds
+        self.backoff_ratio = backoff_ratio
+        self.max_queue_wait = {
+            PRIORITY_CRITICAL: max_queue_wait_seconds,
+            PRIORITY_NORMAL: max_queue_wait_seconds / 4,
+            PRIORITY_BULK: 0.0,
+        }
+        self.max_waiters = max_waiters
+        self._clock = clock
+
+        self.in_flight = 0
+        self._waiters: List[Tuple[int, int, asyncio.Future]] = []
+        self._sequence = itertools.count()
+        self._last_backoff = float("-inf")
+
+        self.admitted: Dict[int, int] = {p: 0 for p in PRIORITY_NAMES}
+        self.shed: Dict[int, int] = {p: 0 for p in PRIORITY_NAMES}
+        self.max_queue_time_seconds = 0.0
+
+    def capacity(self, priority: int) -> int:
+        return max(1, int(self.limit * PRIORITY_SHARES[priority]))
+
+    async def admit(self, priority: int) -> Optional[float]:
+        """
+        Take a slot for a request of ``priority``.
+
+        Returns:
+            Seconds spent queued, or None if the request is shed
+        """
+        if self.in_flight < self.capacity(priority) and not self._has_waiters(priority):
+            self.in_flight += 1
+            self.admitted[priority] += 1
+            return 0.0
+
+        budget = self.max_queue_wait[priority]
+        if budget <= 0 or len(self._waiters) >= self.max_waiters:
+            self.shed[priority] += 1
+            return None
+
+        started = self._clock()
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (priority, next(self._sequence), future))
+        try:
+            await asyncio.wait({future}, timeout=budget)
+        except asyncio.CancelledError:
+            # The client went away while queued; hand back a slot granted in the meantime
+            if future.done():
+                self.in_flight -= 1
+                self._wake_waiters()
+            else:
+                future.cancel()
+            raise
+        if not future.done():
+            future.cancel()  # Skipped when it reaches the head of the queue
+            self.shed[priority] += 1
+            return None
+
+        queue_time = self._clock() - started
+        self.max_queue_time_seconds = max(self.max_queue_time_seconds, queue_time)
+        self.admitted[priority] += 1
+        return queue_time
+
+    def release(self, priority: int, latency_seconds: float) -> None:
+        """Give back a slot and feed the request's service time into the limit."""
+        self.in_flight -= 1
+        if priority != PRIORITY_BULK:
+            self._adapt(latency_seconds)
+        self._wake_waiters()
+
+    def stats(self) -> Dict[str, object]:
+        return {
+            "limit": round(self.limit, 2),
+            "in_flight": self.in_flight,
+            "queued": sum(1 for _, _, future in self._waiters if not future.done()),
+            "max_queue_time_seconds": round(self.max_queue_time_seconds, 4),
+            "admitted": {PRIORITY_NAMES[p]: n for p, n in self.admitted.items()},
+            "shed": {PRIORITY_NAMES[p]: n for p, n in self.shed.items()},
+        }
+
+    def _has_waiters(self, priority: int) -> bool:
+        """Whether requests of the same or a higher priority are already queued ahead."""
+        while self._waiters and self._waiters[0][2].done():
+            heapq.heappop(self._waiters)
+        return bool(self._waiters) and self._waiters[0][0] <= priority
+
+    def _adapt(self, latency_seconds: float) -> None:
+        if latency_seconds > self.latency_target_seconds:
+            now = self._clock()
+            # One backoff per target interval, so a burst of slow completions does not collapse the limit
+            if now - self._last_backoff >= self.latency_target_seconds:
+                self.limit = max(float(self.min_limit), self.limit * self.backoff_ratio)
+                self._last_backoff = now
+        elif self.in_flight + 1 >= self.limit / 2:
+            # Only grow while the limit is actually in use
+            self.limit = min(float(self.max_limit), self.limit + 1.0 / self.limit)
+
+    def _wake_waiters(self) -> None:
+        while self._waiters:
+            priority, _, future = self._waiters[0]
+            if future.done():
+                heapq.heappop(self._waiters)
+                continue
+            if self.in_flight >= self.capacity(priority):
+                return
+            heapq.heappop(self._waiters)
+            self.in_flight += 1
+            future.set_result(True)
@@ -0,0 +1,194 @@
+"""
+Application Service: AuditLog
+Buffers calculation audit records in memory and writes them in batches.
+"""
+import asyncio
+import logging
+import math
+import time
+from collections import deque
+from datetime import datetime
+from typing import Deque, List, NamedTuple, Optional, Sequence
+
+from ...shared.exceptions.base_exceptions import ServiceUnavailableException
+
+logger = logging.getLogger(__name__)
+
+OVERFLOW_BLOCK = "block"
+OVERFLOW_DROP = "drop"
+
+
+class AuditEntry(NamedTuple):
+    """
+    Audit record for one calculation call: the shared context once, plus the
+    amounts it calculated. The repository expands it into one row per amount.
+    """
+    calculated_at: datetime
+    operation: str
+    rule_type: str
+    country_code: str
+    residency: str
+    days_resident: Optional[int]
+    rule_version: str
+    amounts: Sequence[float]
+    tax_amounts: Sequence[float]
+
+
+class AuditLog:
+    """
+    Bounded in-memory audit buffer drained by a background flush task.
+
+    Calculations only append to the buffer; a single background task writes
+    the buffered rows in batches of about ``batch_size`` through the audit
+    repository, so no request waits on an INSERT. When the buffer holds
+    ``max_buffered_rows`` rows the overflow policy applies: ``block`` makes
+    callers wait for the flusher (backpressure, nothing is lost) and ``drop``
+    discards the new entry and counts it. A blocked caller gives up after
+    ``max_block_seconds`` with ServiceUnavailableException, so a database
+    outage fails calculations instead of hanging them. Failed writes are
+    retried up to ``max_write_attempts`` times, after which the batch is
+    discarded and counted. ``stop`` flushes whatever is still buffered.
+    """
+
+    def __init__(
+        self,
+        audit_repository,
+        max_buffered_rows: int = 200000,
+        batch_size: int = 5000,
+        flush_interval_seconds: float = 1.0,
+        overflow_policy: str = OVERFLOW_BLOCK,
+        retry_delay_seconds: float = 1.0,
+        max_block_seconds: float = 5.0,
+        max_write_attempts: int = 10
+    ):
+        """
+        Args:
+            audit_repository: Repository with ``insert_entries(entries) -> int``
+            max_buffered_rows: Rows held in memory before the overflow policy applies
+            batch_size: Rows written per transaction
+            flush_interval_seconds: Longest time a row waits before being written
+            overflow_policy: ``block`` or ``drop``
+            retry_delay_seconds: Pause after a failed write before retrying
+            max_block_seconds: Longest a ``block`` caller waits for buffer space
+            max_write_attempts: Writes of one batch before it is discarded
+        """
+        if overflow_policy not in (OVERFLOW_BLOCK, OVERFLOW_DROP):
+            raise ValueError(f"Unsupported audit overflow policy '{overflow_policy}'")
+
+        self.audit_repository = audit_repository
+        self.max_buffered_rows = max_buffered_rows
+        self.batch_size = batch_size
+        self.flush_interval_seconds = flush_interval_seconds
+        self.overflow_policy = overflow_policy
+        self.retry_delay_seconds = retry_delay_seconds
+        self.max_block_seconds = max_block_seconds
+        self.max_write_attempts = max_write_attempts
+
+        self._buffer: Deque[AuditEntry] = deque()
+        self._buffered_rows = 0
+        self._batch_ready = asyncio.Event()
+        self._space_freed = asyncio.Event()
+        self._flusher: Optional[asyncio.Task] = None
+        self._stopping = False
+        self._failed_attempts = 0  # Consecutive failed writes of the batch at the head of the buffer
+
+        self.written_rows = 0
+        self.dropped_rows = 0
+        self.failed_rows = 0  # Discarded after max_write_attempts failed writes
+
+    @property
+    def buffered_rows(self) -> int:
+        return self._buffered_rows
+
+    def start(self) -> None:
+        self._stopping = False
+        self._flusher = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Write everything still buffered, then stop the flush task."""
+        if self._flusher is None:
+            return
+        self._stopping = True
+        self._batch_ready.set()
+        await self._flusher
+        self._flusher = None
+
+    async def record(self, entry: AuditEntry) -> None:
+        """
+        Buffer an entry, applying the overflow policy when the buffer is full.
+
+        Raises:
+            ServiceUnavailableException: If a ``block`` caller waited ``max_block_seconds`` without space freeing up
+        """
+        rows = len(entry.amounts)
+        deadline = time.monotonic() + self.max_block_seconds
+        # An entry larger than the whole buffer is still accepted once the buffer is empty
+        while self._buffered_rows and self._buffered_rows + rows > self.max_buffered_rows:
+            if self.overflow_policy == OVERFLOW_DROP or self._flusher is None:
+                self.dropped_rows += rows
+                logger.warning(f"Audit buffer full, dropped {rows} audit rows")
+                return
+            self._space_freed.clear()
+            try:
+                await asyncio.wait_for(self._space_freed.wait(), timeout=max(deadline - time.monotonic(), 0))
+            except asyncio.TimeoutError:
+                raise ServiceUnavailableException(
+                    "Audit log is not keeping up, retry later",
+                    retry_after=max(1, math.ceil(self.retry_delay_seconds))
+                )
+
+        self._buffer.append(entry)
+        self._buffered_rows += rows
+        if self._buffered_rows >= self.batch_size:
+            self._batch_ready.set()
+
+    async def _run(self) -> None:
+        while True:
+            interval_elapsed = False
+            try:
+                await asyncio.wait_for(self._batch_ready.wait(), timeout=self.flush_interval_seconds)
+            except asyncio.TimeoutError:
+                interval_elapsed = True
+            self._batch_ready.clear()
+
+            # Full batches are written as soon as they fill; a partial batch waits for the interval or shutdown
+            while self._buffered_rows >= self.batch_size or (self._buffer and (interval_elapsed or self._stopping)):
+                if not await self._write_batch() and self._stopping:
+                    logger.error(f"Audit log stopped with {self._buffered_rows} rows unwritten")
+                    return
+            if self._stopping:
+                return
+
+    async def _write_batch(self) -> bool:
+        batch: List[AuditEntry] = []
+        rows = 0
+        while self._buffer and rows < self.batch_size:
+            entry = self._buffer.popleft()
+            batch.append(entry)
+            rows += len(entry.amounts)
+
+        try:
+            await asyncio.to_thread(self.audit_repository.insert_entries, batch)
+        except Exception as e:
+            self._failed_attempts += 1
+            if self._failed_attempts >= self.max_write_attempts:
+                logger.error(
+                    f"Discarding {rows} audit rows after {self._failed_attempts} failed writes: {str(e)}"
+                )
+                self._failed_attempts = 0
+                self._buffered_rows -= rows
+                self.failed_rows += rows
+                self._space_freed.set()
+                return True
+            logger.error(f"Failed to write {rows} audit rows (attempt {self._failed_attempts}): {str(e)}")
+            # Keep the batch at the head of the buffer so ordering and backpressure are preserved
+            self._buffer.extendleft(reversed(batch))
+            if not self._stopping:
+                await asyncio.sleep(self.retry_delay_seconds)
+            return False
+
+        self._failed_attempts = 0
+        self._buffered_rows -= rows
+        self.written_rows += rows
+        self._space_freed.set()
+        return True
@@ -0,0 +1,83 @@
+"""
+Application Service: AuditQueryService
+Keyset-paginated queries over the calculation audit log.
+"""
+import base64
+import binascii
+import json
+from datetime import datetime
+from decimal import Decimal
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+from src.presentation.api.v1.schemas.request.audit_query_request import AuditQueryRequest
+
+from ...shared.exceptions.base_exceptions import ValidationException
+
+
+class AuditQueryService:
+    """
+    Serves audit queries as NDJSON, one record per line.
+
+    Pages are keyset-paginated on ``(calculated_at, id)`` rather than offset,
+    so fetching page N costs the same as fetching the first page. The last line
+    of every page is ``{"next_cursor": ...}``; it is null when there are no more
+    records, and a stream without it was cut short.
+    """
+
+    def __init__(self, audit_repository):
+        self.audit_repository = audit_repository
+
+    def stream_ndjson(self, query: AuditQueryRequest) -> Iterator[str]:
+        """
+        Return an iterator over the NDJSON lines of one page.
+
+        Raises:
+            ValidationException: If the cursor is malformed (before anything is streamed)
+        """
+        after = self.decode_cursor(query.cursor) if query.cursor else None
+        return self._lines(query, after)
+
+    def _lines(self, query: AuditQueryRequest, after: Optional[Tuple[datetime, int]]) -> Iterator[str]:
+        count = 0
+        last = None
+        for record in self.audit_repository.stream_records(
+            query.start,
+            query.end,
+            query.limit,
+            after=after,
+            rule_type=query.rule_type,
+            country_code=query.country_code,
+            rule_version=query.rule_version,
+            min_amount=query.min_amount,
+            max_amount=query.max_amount
+        ):
+            count += 1
+            last = record
+            yield json.dumps(self._serialize(record)) + "\n"
+
+        next_cursor = None
+        if count == query.limit and last is not None:
+            next_cursor = self.encode_cursor(last["calculated_at"], last["id"])
+        yield json.dumps({"next_cursor": next_cursor}) + "\n"
+
+    @staticmethod
+    def encode_cursor(calculated_at: datetime, record_id: int) -> str:
+        raw = f"{calculated_at.isoformat()}|{record_id}".encode()
+        return base64.urlsafe_b64encode(raw).decode()
+
+    @staticmethod
+    def decode_cursor(cursor: str) -> Tuple[datetime, int]:
+        try:
+            calculated_at, record_id = base64.urlsafe_b64decode(cursor.encode()).decode().split("|")
+            return datetime.fromisoformat(calculated_at), int(record_id)
+        except (binascii.Error, UnicodeDecodeError, ValueError):
+            raise ValidationException("Invalid audit cursor")
+
+    @staticmethod
+    def _serialize(record: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            key: value.isoformat() if isinstance(value, datetime)
+            else float(value) if isinstance(value, Decimal)
+            else value
+            for key, value in record.items()
+        }
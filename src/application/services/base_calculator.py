@@ -1,8 +1,40 @@
 from abc import ABC, abstractmethod
-from typing import Dict, Any
+from typing import Dict, Any, List
+
+from .bracket_table import CompiledBracketTable
+
 
 class BaseTaxCalculator(ABC):
     @abstractmethod
-    def calculate(self, amount: float, rule_data: Dict[str, Any]) -> Dict[str, Any]:
+    def compile(self, rule_data: Dict[str, Any]) -> CompiledBracketTable:
+        """Compile rule_data into a bracket table once per rule version"""
+        pass
+
+    def calculate(self, amount: float, rule_data: Dict[str, Any], include_breakdown: bool = False) -> Dict[str, Any]:
         """Calculate tax based on rule_data"""
-        pass
\ No newline at end of file
+        return self.calculate_compiled(amount, self.compile(rule_data), include_breakdown)
+
+    def calculate_compiled(
+        self,
+        amount: float,
+        table: CompiledBracketTable,
+        include_breakdown: bool = False
+    ) -> Dict[str, Any]:
+        """Calculate tax against a precompiled bracket table; the breakdown is only built on request"""
+        result = {"tax_amount": round(table.tax_for(amount), 2)}
+        if include_breakdown:
+            result["breakdown"] = self.breakdown(amount, table)
+        return result
+
+    def breakdown(self, amount: float, table: CompiledBracketTable) -> List[Dict[str, Any]]:
+        """Numeric per-bracket breakdown for amount, read from the compiled table"""
+        return [
+            {
+                "min_amount": min_amount,
+                "max_amount": max_amount,
+                "rate": round(rate * 100, 4),
+                "taxable_amount": round(taxable, 2),
+                "tax": round(bracket_tax, 2)
+            }
+            for (min_amount, max_amount), rate, taxable, bracket_tax in table.segments(amount)
+        ]
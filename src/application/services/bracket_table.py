@@ -0,0 +1,174 @@
+"""
+Application Service: CompiledBracketTable
+Precompiled, piecewise-linear form of a tax rule's brackets.
+"""
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+
+@dataclass(frozen=True)
+class CompiledBracketTable:
+    """
+    Immutable bracket table compiled once per rule version.
+
+    The brackets are normalised into contiguous segments starting at 0: gaps
+    between brackets (e.g. 500 -> 501) and the range above a capped top bracket
+    become zero-rate segments. ``cumulative_tax[i]`` is the tax accrued below
+    ``lower_bounds[i]``, so the tax for any amount is one bisect plus one
+    multiply-add instead of a walk over every bracket. ``net_at_bounds[i]`` is
+    the net amount at each lower bound, which makes the inverse (net-to-gross)
+    just as cheap.
+    """
+    lower_bounds: Tuple[float, ...]
+    rates: Tuple[float, ...]  # Decimal rates, e.g. 0.15 for 15%
+    cumulative_tax: Tuple[float, ...]
+    brackets: Tuple[Optional[Tuple[Any, Any]], ...]  # Source (min, max) per segment, None for gaps
+    net_at_bounds: Tuple[float, ...]
+
+    @classmethod
+    def from_brackets(cls, brackets: List[Dict[str, Any]]) -> 'CompiledBracketTable':
+        """
+        Compile a list of ``{"min_amount", "max_amount", "rate"}`` brackets.
+
+        Raises:
+            ValueError: If the brackets are empty, overlap or have invalid values
+        """
+        if not brackets:
+            raise ValueError("No tax brackets defined in rule")
+
+        segments: List[Tuple[float, float, Optional[Tuple[Any, Any]]]] = []
+        position = 0.0
+        for bracket in sorted(brackets, key=lambda x: x.get("min_amount", 0)):
+            min_amount = bracket.get("min_amount", 0)
+            max_amount = bracket.get("max_amount")
+            rate = cls._validate_rate(bracket.get("rate", 0))
+
+            if min_amount < 0:
+                raise ValueError("Bracket min_amount cannot be negative")
+            if min_amount < position:
+                raise ValueError("Tax brackets must not overlap")
+            if max_amount is not None and max_amount < min_amount:
+                raise ValueError("Bracket max_amount cannot be below min_amount")
+
+            if min_amount > position:
+                segments.append((position, 0.0, None))
+            segments.append((float(min_amount), rate, (min_amount, max_amount)))
+            position = float("inf") if max_amount is None else float(max_amount)
+
+        if position != float("inf"):
+            # Income above a capped top bracket is not taxed
+            segments.append((position, 0.0, None))
+
+        return cls._from_segments(segments)
+
+    @classmethod
+    def flat(cls, rate: float) -> 'CompiledBracketTable':
+        """Compile a single flat rate given as a percentage (e.g. 15 for 15%)."""
+        return cls._from_segments([(0.0, cls._validate_rate(rate), (0, None))])
+
+    @classmethod
+    def _from_segments(cls, segments: List[Tuple[float, float, Optional[Tuple[Any, Any]]]]) -> 'CompiledBracketTable':
+        lower_bounds = tuple(s[0] for s in segments)
+        rates = tuple(s[1] for s in segments)
+        cumulative = [0.0]
+        for i in range(1, len(segments)):
+            cumulative.append(cumulative[-1] + rates[i - 1] * (lower_bounds[i] - lower_bounds[i - 1]))
+        return cls(
+            lower_bounds,
+            rates,
+            tuple(cumulative),
+            tuple(s[2] for s in segments),
+            tuple(b - c for b, c in zip(lower_bounds, cumulative)),
+        )
+
+    @staticmethod
+    def _validate_rate(rate: Any) -> float:
+        if not 0 <= rate <= 100:
+            raise ValueError("Tax rate must be between 0 and 100 percent")
+        return rate / 100  # Convert percentage to decimal
+
+    def segment_index(self, amount: float) -> int:
+        """Index of the segment containing ``amount``, or -1 below the first bound."""
+        return bisect_right(self.lower_bounds, amount) - 1
+
+    def tax_for(self, amount: float) -> float:
+        """Unrounded tax for ``amount``."""
+        i = bisect_right(self.lower_bounds, amount) - 1
+        if i < 0:
+            return 0.0
+        return self.cumulative_tax[i] + self.rates[i] * (amount - self.lower_bounds[i])
+
+    def marginal_rate(self, amount: float) -> float:
+        """Decimal rate applied to the next unit of ``amount``."""
+        i = bisect_right(self.lower_bounds, amount) - 1
+        return self.rates[i] if i >= 0 else 0.0
+
+    def segments(self, amount: float) -> Iterator[Tuple[Tuple[Any, Any], float, float, float]]:
+        """Yield ``(bracket, rate, taxable_amount, tax)`` for each bracket ``amount`` reaches."""
+        last = self.segment_index(amount)
+        for i in range(last + 1):
+            bracket = self.brackets[i]
+            if bracket is None:
+                continue
+            upper = self.lower_bounds[i + 1] if i < last else amount
+            taxable = upper - self.lower_bounds[i]
+            if taxable > 0:
+                yield bracket, self.rates[i], taxable, taxable * self.rates[i]
+
+    def prorated(self, year_fraction: float) -> 'CompiledBracketTable':
+        """Table with every threshold scaled by ``year_fraction`` for partial-year residency."""
+        return CompiledBracketTable(
+            tuple(b * year_fraction for b in self.lower_bounds),
+            self.rates,
+            tuple(c * year_fraction for c in self.cumulative_tax),
+            tuple(
+                None if b is None else (
+                    round(b[0] * year_fraction, 2),
+                    None if b[1] is None else round(b[1] * year_fraction, 2)
+                )
+                for b in self.brackets
+            ),
+            tuple(n * year_fraction for n in self.net_at_bounds),
+        )
+
+    def gross_for_net(self, net: float) -> float:
+        """
+        Smallest unrounded amount whose net of tax equals ``net``.
+
+        Net income is piecewise linear and non-decreasing in the amount, so the
+        segment is found by bisecting ``net_at_bounds`` and solved in closed form.
+
+        Raises:
+            ValueError: If ``net`` cannot be reached (top rate of 100%)
+        """
+        if net <= 0:
+            return 0.0
+
+        i = bisect_left(self.net_at_bounds, net)
+        if i < len(self.net_at_bounds) and self.net_at_bounds[i] == net:
+            return self.lower_bounds[i]
+
+        i -= 1
+        if self.rates[i] >= 1.0:
+            raise ValueError(f"Net amount {net} is not reachable under this rule")
+        return self.lower_bounds[i] + (net - self.net_at_bounds[i]) / (1.0 - self.rates[i])
+
+    def solve_gross(self, net: float) -> Tuple[float, float]:
+        """
+        Cent-exact inverse: ``(gross, tax)`` for the smallest gross amount in cents
+        whose net after the cent-rounded tax equals ``net`` rounded to cents.
+        """
+        target = round(net * 100)
+        cents = round(self.gross_for_net(target / 100) * 100)
+
+        def net_cents(gross_cents: int) -> int:
+            # Round the tax exactly as the calculators do before converting to cents
+            return gross_cents - round(round(self.tax_for(gross_cents / 100), 2) * 100)
+
+        # Net moves by at most one cent per cent of gross, so this is a step or two
+        while net_cents(cents) < target:
+            cents += 1
+        while cents > 0 and net_cents(cents - 1) >= target:
+            cents -= 1
+        return cents / 100, round(self.tax_for(cents / 100), 2)
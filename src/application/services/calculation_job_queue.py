@@ -0,0 +1,232 @@
+"""
+Application Service: CalculationJobQueue
+Persistent background queue for calculation runs too large for one request.
+"""
+import asyncio
+import logging
+import os
+import socket
+import uuid
+from typing import List, Optional
+
+from src.application.mappers.tax_rule_mapper import TaxRuleMapper
+from src.presentation.api.v1.schemas.response.calculation_job_response import (
+    CalculationJobResponse,
+    CalculationJobResultsResponse
+)
+
+from ...domain.value_objects.residency_status import ResidencyStatus, ResidencyType
+from ...shared.exceptions.base_exceptions import (
+    BusinessException,
+    CapacityExceededException,
+    NotFoundException,
+    ValidationException
+)
+from .tax_calculation_service import TaxCalculationService
+
+logger = logging.getLogger(__name__)
+
+
+class CalculationJobQueue:
+    """
+    Submit, poll and page through large calculation runs.
+
+    Jobs and their results are persisted through the job repository: each
+    processed chunk is stored together with the job's progress in one
+    transaction, so a job interrupted by a restart resumes from its last stored
+    chunk. A bounded set of worker tasks drains the queue, and submissions are
+    rejected once ``max_pending_jobs`` jobs are queued or running.
+
+    A running job is leased to the worker process that claimed it, and a
+    heartbeat renews the leases of this process every third of
+    ``lease_seconds``. The same heartbeat re-queues jobs whose lease has
+    expired, so a job is taken over only once its owner has stopped renewing
+    it; other live processes keep theirs. A worker whose lease was taken over
+    abandons the job at its next chunk without storing it.
+    """
+
+    def __init__(
+        self,
+        job_repository,
+        tax_calculation_service: TaxCalculationService,
+        max_workers: int = 2,
+        max_pending_jobs: int = 100,
+        chunk_size: int = 10000,
+        retry_after_seconds: int = 30,
+        lease_seconds: float = 60,
+        worker_id: Optional[str] = None
+    ):
+        """
+        Args:
+            job_repository: Repository for job and result persistence
+            tax_calculation_service: Service evaluating each chunk
+            max_workers: Jobs processed concurrently by this process
+            max_pending_jobs: Queued plus running jobs before submissions are rejected
+            chunk_size: Amounts evaluated and stored per progress step
+            retry_after_seconds: Retry-After hint returned when the queue is full
+            lease_seconds: How long a job stays with this process without a heartbeat
+            worker_id: Lease owner name; unique per process by default
+        """
+        self.job_repository = job_repository
+        self.service = tax_calculation_service
+        self.max_workers = max_workers
+        self.max_pending_jobs = max_pending_jobs
+        self.chunk_size = chunk_size
+        self.retry_after_seconds = retry_after_seconds
+        self.lease_seconds = lease_seconds
+        self.worker_id = worker_id or f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self._queue: "asyncio.Queue[str]" = asyncio.Queue()
+        self._workers: List[asyncio.Task] = []
+        self._heartbeat: Optional[asyncio.Task] = None
+
+    async def start(self) -> None:
+        """Queue persisted jobs, taking over those whose lease has expired, and start the workers."""
+        await asyncio.to_thread(self.job_repository.requeue_expired_jobs)
+        for job_id in await asyncio.to_thread(self.job_repository.list_queued_jobs):
+            self._queue.put_nowait(job_id)
+        self._workers = [asyncio.create_task(self._worker()) for _ in range(self.max_workers)]
+        self._heartbeat = asyncio.create_task(self._renew_leases())
+
+    async def stop(self) -> None:
+        """Stop the workers and hand their jobs back to the queue; a job cut short resumes after its last stored chunk."""
+        tasks = self._workers + ([self._heartbeat] if self._heartbeat else [])
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._workers = []
+        self._heartbeat = None
+        try:
+            await asyncio.to_thread(self.job_repository.release_leases, self.worker_id)
+        except Exception as e:
+            # The leases then expire on their own
+            logger.warning(f"Could not release calculation job leases: {str(e)}")
+
+    async def _renew_leases(self) -> None:
+        while True:
+            await asyncio.sleep(self.lease_seconds / 3)
+            try:
+                await asyncio.to_thread(self.job_repository.renew_leases, self.worker_id, self.lease_seconds)
+                for job_id in await asyncio.to_thread(self.job_repository.requeue_expired_jobs):
+                    logger.warning(f"Calculation job {job_id} lost its worker; re-queued")
+                    self._queue.put_nowait(job_id)
+            except Exception as e:
+                logger.error(f"Calculation job heartbeat failed: {str(e)}")
+
+    async def submit(
+        self,
+        amounts: List[float],
+        rule_type: str,
+        country_code: Optional[str] = None,
+        residency: Optional[ResidencyStatus] = None,
+        days_resident: Optional[int] = None
+    ) -> CalculationJobResponse:
+        """Persist a job and queue it for the workers."""
+        residency = residency or ResidencyStatus.tax_resident()
+
+        # Fail fast on an unknown rule or invalid residency input rather than
+        # queueing a job that can only fail
+        country = await self.service.validate_calculation(rule_type, country_code, residency, days_resident)
+
+        pending = await asyncio.to_thread(self.job_repository.count_pending_jobs)
+        if pending >= self.max_pending_jobs:
+            raise CapacityExceededException(
+                f"Calculation queue is full ({pending} jobs pending)", retry_after=self.retry_after_seconds
+            )
+
+        job = await asyncio.to_thread(self.job_repository.create_job, {
+            "job_id": str(uuid.uuid4()),
+            "rule_type": rule_type,
+            "country_code": country,
+            "residency": residency.status_type.value,
+            "days_resident": days_resident,
+            "amounts": amounts,
+            "total_count": len(amounts),
+            "chunk_size": self.chunk_size
+        })
+        self._queue.put_nowait(job["job_id"])
+        return TaxRuleMapper.to_calculation_job_response(job)
+
+    async def get_status(self, job_id: str) -> CalculationJobResponse:
+        return TaxRuleMapper.to_calculation_job_response(await self._get_job(job_id))
+
+    async def get_results(self, job_id: str, offset: int = 0, limit: int = 1000) -> CalculationJobResultsResponse:
+        """One page of the results processed so far, in submission order."""
+        job = await self._get_job(job_id)
+        tax_amounts = []
+        if offset < job["processed_count"]:
+            tax_amounts = await asyncio.to_thread(
+                self.job_repository.get_results,
+                job_id,
+                job["chunk_size"],
+                offset,
+                min(limit, job["processed_count"] - offset)
+            )
+        return TaxRuleMapper.to_calculation_job_results_response(job, offset, tax_amounts)
+
+    async def _get_job(self, job_id: str) -> dict:
+        job = await asyncio.to_thread(self.job_repository.get_job, job_id)
+        if not job:
+            raise NotFoundException(f"Calculation job {job_id} not found")
+        return job
+
+    async def _worker(self) -> None:
+        while True:
+            job_id = await self._queue.get()
+            try:
+                await self._run_job(job_id)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Calculation job {job_id} could not be processed: {str(e)}", exc_info=True)
+            finally:
+                self._queue.task_done()
+
+    async def _run_job(self, job_id: str) -> None:
+        if not await asyncio.to_thread(self.job_repository.claim_job, job_id, self.worker_id, self.lease_seconds):
+            return  # Already taken by another worker
+
+        job = await asyncio.to_thread(self.job_repository.get_job, job_id, True)
+        amounts = job["amounts"]
+        size = job["chunk_size"]
+        residency = ResidencyStatus(status_type=ResidencyType(job["residency"]))
+        version = job["rule_version"]
+
+        try:
+            # Progress is always a whole number of chunks, so this resumes after the last stored one
+            for start in range(job["processed_count"], job["total_count"], size):
+                chunk = amounts[start:start + size]
+                result = await self.service.calculate_batch(
+                    chunk,
+                    job["rule_type"],
+                    country_code=job["country_code"],
+                    residency=residency,
+                    days_resident=job["days_resident"]
+                )
+                # Every chunk of a run must use the same rule version
+                if version is None:
+                    version = result.rule_version
+                elif result.rule_version != version:
+                    raise BusinessException(
+                        f"Tax rule changed from version {version} to {result.rule_version} during the run"
+                    )
+
+                saved = await asyncio.to_thread(
+                    self.job_repository.save_chunk, job_id, start // size, result.tax_amounts,
+                    start + len(chunk), version, self.worker_id
+                )
+                if not saved:
+                    logger.warning(f"Calculation job {job_id} was taken over by another worker; abandoning it")
+                    return
+        except (ValidationException, BusinessException) as e:
+            await asyncio.to_thread(self.job_repository.finish_job, job_id, "failed", self.worker_id, str(e.detail))
+            return
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"Unexpected error in calculation job {job_id}: {str(e)}", exc_info=True)
+            await asyncio.to_thread(
+                self.job_repository.finish_job, job_id, "failed", self.worker_id, "Calculation failed"
+            )
+            return
+
+        await asyncio.to_thread(self.job_repository.finish_job, job_id, "completed", self.worker_id)
@@ -0,0 +1,100 @@
+"""
+Application Service: CalculationPool
+Runs large batch calculations on a managed process pool.
+"""
+import asyncio
+import logging
+import math
+from typing import TYPE_CHECKING, List, Optional, Tuple
+
+from .bracket_table import CompiledBracketTable
+
+if TYPE_CHECKING:
+    from concurrent.futures import ProcessPoolExecutor
+
+logger = logging.getLogger(__name__)
+
+def _evaluate_chunk(
+    table: CompiledBracketTable,
+    amounts: List[float],
+    with_marginal: bool
+) -> List[Tuple[float, float]]:
+    """Worker entry point: ``(tax_amount, marginal_rate)`` for every amount of the chunk."""
+    if with_marginal:
+        return [(round(table.tax_for(a), 2), table.marginal_rate(a)) for a in amounts]
+    return [(round(table.tax_for(a), 2), 0.0) for a in amounts]
+
+
+class CalculationPool:
+    """
+    Process pool for CPU-heavy batch work, so bulk jobs use every core and do
+    not block the event loop serving interactive requests.
+
+    Each task carries its compiled table with its chunk of amounts. A table
+    is a few brackets, small next to a chunk, so the workers hold no rule
+    state: a new rule or version needs nothing from them and the pool is
+    started once and kept for the life of the process.
+    """
+
+    def __init__(
+        self,
+        max_workers: int,
+        threshold: int = 20000,
+        min_chunk_size: int = 2000,
+        max_chunk_size: int = 50000
+    ):
+        """
+        Args:
+            max_workers: Worker processes; 0 disables offloading
+            threshold: Minimum batch size worth sending to the pool
+            min_chunk_size: Lower bound for a task's share of the batch
+            max_chunk_size: Upper bound for a task's share of the batch
+        """
+        self.max_workers = max_workers
+        self.threshold = threshold
+        self.min_chunk_size = min_chunk_size
+        self.max_chunk_size = max_chunk_size
+        self._executor: Optional["ProcessPoolExecutor"] = None
+
+    def should_offload(self, batch_size: int) -> bool:
+        return self.max_workers > 0 and batch_size >= self.threshold
+
+    def chunk_size(self, batch_size: int) -> int:
+        """About four tasks per worker, so stragglers even out, within the configured bounds."""
+        target = math.ceil(batch_size / (self.max_workers * 4))
+        return max(self.min_chunk_size, min(self.max_chunk_size, target))
+
+    async def evaluate(
+        self,
+        table: CompiledBracketTable,
+        amounts: List[float],
+        with_marginal: bool = False
+    ) -> List[Tuple[float, float]]:
+        """Evaluate ``amounts`` against ``table`` across the pool, preserving order."""
+        executor = self._get_executor()
+        size = self.chunk_size(len(amounts))
+        loop = asyncio.get_running_loop()
+
+        parts = await asyncio.gather(*(
+            loop.run_in_executor(executor, _evaluate_chunk, table, amounts[i:i + size], with_marginal)
+            for i in range(0, len(amounts), size)
+        ))
+        return [item for part in parts for item in part]
+
+    def _get_executor(self) -> "ProcessPoolExecutor":
+        if self._executor is None:
+            # Imported on first offload; most workers never start a pool
+            import multiprocessing
+            from concurrent.futures import ProcessPoolExecutor
+
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                # spawn: never fork a process that is running an event loop and DB pools
+                mp_context=multiprocessing.get_context("spawn")
+            )
+        return self._executor
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
@@ -0,0 +1,104 @@
+"""
+Application Service: CircuitBreaker
+Fails fast while a dependency is unhealthy instead of queueing calls on it.
+"""
+import math
+import threading
+import time
+from typing import Callable, Dict
+
+from src.shared.exceptions.base_exceptions import ServiceUnavailableException
+
+STATE_CLOSED = "closed"
+STATE_OPEN = "open"
+STATE_HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """
+    Consecutive-failure circuit breaker.
+
+    Closed, every call goes through. After ``failure_threshold`` failures in
+    a row the circuit opens and calls are rejected with
+    ServiceUnavailableException for ``reset_timeout_seconds``, so requests
+    stop piling timed-out queries onto a dependency that cannot answer them.
+    Then one trial call is let through (half open): it closes the circuit
+    if it succeeds and reopens it if it fails.
+
+    Thread safe; repositories call it from worker threads.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = 5,
+        reset_timeout_seconds: float = 10.0,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Args:
+            name: Dependency name, used in error messages and stats
+            failure_threshold: Consecutive failures that open the circuit
+            reset_timeout_seconds: Time the circuit stays open before a trial call
+            clock: Monotonic clock, replaceable in tests
+        """
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout_seconds = reset_timeout_seconds
+        self._clock = clock
+        self._lock = threading.Lock()
+
+        self.state = STATE_CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._trial_in_flight = False
+
+        self.rejected = 0
+        self.times_opened = 0
+
+    def before_call(self) -> None:
+        """
+        Admit a call, or reject it while the circuit is open.
+
+        Raises:
+            ServiceUnavailableException: If the circuit is open, or half open with a trial call running
+        """
+        with self._lock:
+            if self.state == STATE_CLOSED:
+                return
+
+            remaining = self._opened_at + self.reset_timeout_seconds - self._clock()
+            if self.state == STATE_OPEN and remaining <= 0:
+                self.state = STATE_HALF_OPEN
+            if self.state == STATE_HALF_OPEN and not self._trial_in_flight:
+                self._trial_in_flight = True
+                return
+
+            self.rejected += 1
+            raise ServiceUnavailableException(
+                f"{self.name} is unavailable, retry later", retry_after=max(1, math.ceil(remaining))
+            )
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._failures = 0
+            self._trial_in_flight = False
+            self.state = STATE_CLOSED
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            self._trial_in_flight = False
+            if self.state == STATE_HALF_OPEN or self._failures >= self.failure_threshold:
+                if self.state != STATE_OPEN:
+                    self.times_opened += 1
+                self.state = STATE_OPEN
+                self._opened_at = self._clock()
+
+    def stats(self) -> Dict[str, object]:
+        return {
+            "state": self.state,
+            "consecutive_failures": self._failures,
+            "times_opened": self.times_opened,
+            "rejected": self.rejected,
+        }
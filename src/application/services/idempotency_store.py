@@ -0,0 +1,84 @@
+"""
+Application Service: IdempotencyStore
+Bounded store of responses keyed by Idempotency-Key, for replaying retries.
+"""
+import asyncio
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Optional, Set, Tuple
+
+
+@dataclass(frozen=True)
+class StoredResponse:
+    """A completed response and the fingerprint of the request that produced it."""
+    fingerprint: str
+    status_code: int
+    headers: Tuple[Tuple[bytes, bytes], ...]
+    body: bytes
+    expires_at: float  # Unix time
+
+
+class IdempotencyStore:
+    """
+    In-memory LRU of stored responses, optionally backed by a repository.
+
+    Lookups hit the LRU first and fall back to the repository, so a retry that
+    lands on another worker process (or after a restart) is still replayed when
+    persistence is enabled. ``begin``/``release`` mark keys whose first request
+    is still running, so a concurrent duplicate is refused instead of executed.
+    """
+
+    def __init__(self, repository=None, max_entries: int = 10000, ttl_seconds: float = 86400.0):
+        """
+        Args:
+            repository: Optional persistence with ``get(key)`` and ``save(key, response)``
+            max_entries: Responses kept in memory before the least recently used is evicted
+            ttl_seconds: How long a stored response can be replayed
+        """
+        self.repository = repository
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[str, StoredResponse]" = OrderedDict()
+        self._in_flight: Set[str] = set()
+
+    async def get(self, key: str) -> Optional[StoredResponse]:
+        response = self._entries.get(key)
+        if response is None and self.repository is not None:
+            response = await asyncio.to_thread(self.repository.get, key)
+            if response is not None:
+                self._remember(key, response)
+
+        if response is None:
+            return None
+        if response.expires_at <= time.time():
+            self._entries.pop(key, None)
+            return None
+        self._entries.move_to_end(key)
+        return response
+
+    def begin(self, key: str) -> bool:
+        """Claim a key for a new request; False while another request holds it."""
+        if key in self._in_flight:
+            return False
+        self._in_flight.add(key)
+        return True
+
+    def release(self, key: str) -> None:
+        self._in_flight.discard(key)
+
+    async def put(self, key: str, fingerprint: str, status_code: int, headers, body: bytes) -> None:
+        """Store a completed response and release the key."""
+        response = StoredResponse(fingerprint, status_code, tuple(headers), body, time.time() + self.ttl_seconds)
+        try:
+            self._remember(key, response)
+            if self.repository is not None:
+                await asyncio.to_thread(self.repository.save, key, response)
+        finally:
+            self.release(key)
+
+    def _remember(self, key: str, response: StoredResponse) -> None:
+        self._entries[key] = response
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
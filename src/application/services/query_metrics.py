@@ -0,0 +1,100 @@
+"""
+Application Service: QueryMetrics
+Database cost (queries, rows, time) per request, per repository method and per process.
+"""
+import contextvars
+import threading
+from typing import Dict, List, Optional
+
+# Cost of the current request, set by ServerTimingMiddleware; worker threads share the same object
+current_query_cost: contextvars.ContextVar[Optional["QueryCost"]] = contextvars.ContextVar(
+    "current_query_cost", default=None
+)
+
+UNATTRIBUTED = "unattributed"
+
+
+class _MethodCost:
+    __slots__ = ("queries", "rows", "seconds", "max_seconds")
+
+    def __init__(self):
+        self.queries = 0
+        self.rows = 0
+        self.seconds = 0.0
+        self.max_seconds = 0.0
+
+
+class QueryCost:
+    """
+    Queries, rows and seconds spent on the database, in total and per
+    repository method. One is created per request, and one per process
+    accumulates everything; thread safe, as queries run in worker threads.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._methods: Dict[str, _MethodCost] = {}
+        self.queries = 0
+        self.rows = 0
+        self.seconds = 0.0
+
+    def add(self, method: Optional[str], rows: int, seconds: float) -> None:
+        with self._lock:
+            self.queries += 1
+            self.rows += rows
+            self.seconds += seconds
+            cost = self._methods.get(method or UNATTRIBUTED)
+            if cost is None:
+                cost = self._methods[method or UNATTRIBUTED] = _MethodCost()
+            cost.queries += 1
+            cost.rows += rows
+            cost.seconds += seconds
+            cost.max_seconds = max(cost.max_seconds, seconds)
+
+    def server_timing(self, detailed: bool = False) -> str:
+        """
+        ``Server-Timing`` value, in milliseconds: a ``db`` total, followed by
+        one entry per repository method when ``detailed``.
+        """
+        with self._lock:
+            entries: List[str] = [_timing_entry("db", self.queries, self.rows, self.seconds)]
+            if detailed:
+                for method, cost in self._methods.items():
+                    entries.append(_timing_entry(f"db.{method}", cost.queries, cost.rows, cost.seconds))
+        return ", ".join(entries)
+
+    def stats(self) -> Dict[str, object]:
+        with self._lock:
+            return {
+                "queries": self.queries,
+                "rows": self.rows,
+                "seconds": round(self.seconds, 6),
+                "methods": {
+                    method: {
+                        "queries": cost.queries,
+                        "rows": cost.rows,
+                        "seconds": round(cost.seconds, 6),
+                        "max_seconds": round(cost.max_seconds, 6),
+                    }
+                    for method, cost in self._methods.items()
+                },
+            }
+
+
+class QueryMetrics(QueryCost):
+    """Process-wide database cost, plus slow query counts; reported by the health endpoint."""
+
+    def __init__(self):
+        super().__init__()
+        self.slow_queries = 0
+
+    def record_slow(self) -> None:
+        with self._lock:
+            self.slow_queries += 1
+
+    def stats(self) -> Dict[str, object]:
+        return {**super().stats(), "slow_queries": self.slow_queries}
+
+
+def _timing_entry(name: str, queries: int, rows: int, seconds: float) -> str:
+    return f'{name};dur={seconds * 1000:.2f};desc="{queries} queries, {rows} rows"'
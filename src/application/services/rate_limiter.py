@@ -0,0 +1,176 @@
+"""
+Application Service: RateLimiter
+Token-bucket rate limits and concurrency caps per client and traffic class.
+"""
+import logging
+import math
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, Dict, Optional, Tuple
+
+from src.shared.exceptions.base_exceptions import CapacityExceededException
+
+try:
+    import redis.asyncio as redis_asyncio
+except ImportError:  # redis is optional; only needed for the shared backend
+    redis_asyncio = None
+
+logger = logging.getLogger(__name__)
+
+BUCKET_CALCULATE = "calculate"
+BUCKET_BULK = "bulk"
+
+
+@dataclass(frozen=True)
+class RateLimitPolicy:
+    """Limits for one traffic class, applied to each client separately."""
+    requests_per_second: float
+    burst: int
+    max_concurrent: int
+
+
+class InMemoryRateLimitBackend:
+    """
+    Token buckets held in this process, bounded to ``max_clients`` buckets
+    (least recently used are evicted, which only ever refills them).
+    """
+
+    def __init__(self, max_clients: int = 100000, clock: Callable[[], float] = time.monotonic):
+        self.max_clients = max_clients
+        self._clock = clock
+        self._buckets: "OrderedDict[str, Tuple[float, float]]" = OrderedDict()
+
+    async def take(self, key: str, rate: float, burst: int) -> float:
+        """Take one token; returns 0 when granted, otherwise the seconds until one is available."""
+        now = self._clock()
+        tokens, updated = self._buckets.pop(key, (float(burst), now))
+        tokens = min(float(burst), tokens + (now - updated) * rate)
+
+        wait = 0.0
+        if tokens >= 1.0:
+            tokens -= 1.0
+        else:
+            wait = (1.0 - tokens) / rate
+
+        self._buckets[key] = (tokens, now)
+        if len(self._buckets) > self.max_clients:
+            self._buckets.popitem(last=False)
+        return wait
+
+
+# Refill and take in one atomic step; the server clock keeps all workers consistent
+_REDIS_TOKEN_BUCKET = """
+local rate = tonumber(ARGV[1])
+local burst = tonumber(ARGV[2])
+local time = redis.call('TIME')
+local now = tonumber(time[1]) + tonumber(time[2]) / 1000000
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'updated')
+local tokens = tonumber(state[1]) or burst
+local updated = tonumber(state[2]) or now
+tokens = math.min(burst, tokens + math.max(0, now - updated) * rate)
+local wait = 0
+if tokens >= 1 then
+    tokens = tokens - 1
+else
+    wait = (1 - tokens) / rate
+end
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'updated', tostring(now))
+redis.call('EXPIRE', KEYS[1], math.ceil(burst / rate) + 1)
+return tostring(wait)
+"""
+
+
+class RedisRateLimitBackend:
+    """
+    Token buckets shared by every worker through Redis.
+
+    If Redis cannot be reached the limit is enforced per process by the
+    fallback backend instead, so an outage of the limiter never rejects or
+    blocks traffic on its own.
+    """
+
+    def __init__(self, url: str, key_prefix: str = "ratelimit:", fallback: Optional[InMemoryRateLimitBackend] = None):
+        if redis_asyncio is None:
+            raise RuntimeError("The shared rate limit backend requires the 'redis' package")
+        self._client = redis_asyncio.from_url(url)
+        self._script = self._client.register_script(_REDIS_TOKEN_BUCKET)
+        self.key_prefix = key_prefix
+        self.fallback = fallback or InMemoryRateLimitBackend()
+
+    async def take(self, key: str, rate: float, burst: int) -> float:
+        try:
+            return float(await self._script(keys=[self.key_prefix + key], args=[rate, burst]))
+        except Exception as e:
+            logger.warning(f"Shared rate limit backend unavailable, limiting per process: {str(e)}")
+            return await self.fallback.take(key, rate, burst)
+
+    async def close(self) -> None:
+        await self._client.aclose()
+
+
+class RateLimiter:
+    """
+    Applies a token bucket and a concurrency cap per client and traffic class.
+
+    Each class (e.g. ``calculate`` and ``bulk``) has its own buckets, so a
+    client exhausting its bulk allowance can still calculate. Token buckets
+    live in the backend, which may be shared between workers; in-flight
+    counts are always per process, since what they protect is this worker.
+    """
+
+    def __init__(self, policies: Dict[str, RateLimitPolicy], backend=None):
+        """
+        Args:
+            policies: Limits per traffic class; classes without a policy are not limited
+            backend: Token bucket storage with ``take(key, rate, burst)``; in process by default
+        """
+        self.policies = policies
+        self.backend = backend or InMemoryRateLimitBackend()
+        self._in_flight: Dict[Tuple[str, str], int] = {}
+
+    async def acquire(self, client_id: str, bucket: str) -> bool:
+        """
+        Admit one request, reserving a concurrency slot that must be given back
+        with ``release``. Returns False when the class is not limited.
+
+        Raises:
+            CapacityExceededException: If the client is over its rate or concurrency limit
+        """
+        policy = self.policies.get(bucket)
+        if policy is None:
+            return False
+
+        slot = (client_id, bucket)
+        if self._in_flight.get(slot, 0) >= policy.max_concurrent:
+            raise CapacityExceededException(
+                detail=f"Too many concurrent {bucket} requests (limit {policy.max_concurrent})",
+                retry_after=1
+            )
+        # Reserve the slot before awaiting the backend, so concurrent requests cannot all pass the check
+        self._in_flight[slot] = self._in_flight.get(slot, 0) + 1
+
+        try:
+            wait = await self.backend.take(f"{bucket}:{client_id}", policy.requests_per_second, policy.burst)
+        except BaseException:
+            self.release(client_id, bucket)
+            raise
+        if wait > 0:
+            self.release(client_id, bucket)
+            raise CapacityExceededException(
+                detail=f"Rate limit for {bucket} requests exceeded ({policy.requests_per_second:g}/s)",
+                retry_after=max(1, math.ceil(wait))
+            )
+        return True
+
+    def release(self, client_id: str, bucket: str) -> None:
+        slot = (client_id, bucket)
+        remaining = self._in_flight.get(slot, 0) - 1
+        if remaining > 0:
+            self._in_flight[slot] = remaining
+        else:
+            self._in_flight.pop(slot, None)
+
+    async def close(self) -> None:
+        if hasattr(self.backend, "close"):
+            await self.backend.close()
@@ -0,0 +1,131 @@
+"""
+Application Service: RuleCompiler
+Compiles stored tax rules into per-residency dispatch tables.
+"""
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional
+
+from src.domain.value_objects.residency_status import ResidencyType
+
+from .SalesTaxCalculator import SalesTaxCalculator
+from .base_calculator import BaseTaxCalculator
+from .bracket_table import CompiledBracketTable
+from .income_tax_calculator import IncomeTaxCalculator
+from .withholding_tax_calculator import WithholdingTaxCalculator
+
+
+@dataclass(frozen=True)
+class RuleVariant:
+    """Calculator and compiled table selected for one residency type."""
+    calculator: BaseTaxCalculator
+    table: CompiledBracketTable
+    prorated: bool = False
+
+    def table_for(self, year_fraction: float = 1.0) -> CompiledBracketTable:
+        """Table to evaluate, with thresholds scaled for partial-year residency."""
+        if self.prorated and year_fraction < 1.0:
+            return self.table.prorated(year_fraction)
+        return self.table
+
+    def calculate(self, amount: float, year_fraction: float = 1.0, include_breakdown: bool = False) -> Dict[str, Any]:
+        """Calculate tax, scaling the thresholds for partial-year residency."""
+        return self.calculator.calculate_compiled(amount, self.table_for(year_fraction), include_breakdown)
+
+
+@dataclass(frozen=True)
+class CompiledTaxRule:
+    """
+    An active tax rule together with its precompiled residency dispatch table.
+
+    ``data`` is the repository dict the rule was compiled from. When the rule
+    cannot be calculated (no calculator for its type, malformed brackets) the
+    variants are empty and ``compile_error`` says why, so the rule can still be
+    served by the rule endpoints.
+    """
+    data: Dict[str, Any]
+    variants: Dict[ResidencyType, RuleVariant] = field(default_factory=dict)
+    compile_error: Optional[str] = None
+
+    @property
+    def version(self) -> str:
+        return self.data["version"]
+
+
+class RuleCompiler:
+    """
+    Builds a ``ResidencyType -> RuleVariant`` table for every rule version.
+
+    The rule's ``tax_rule`` JSON is the resident variant. It may override other
+    residency types under ``residency_variants``, e.g.::
+
+        "residency_variants": {
+            "non_resident": {"calculation_type": "flat", "rate": 25},
+            "partial_resident": {"prorate": true}
+        }
+
+    Residency types without an override share the resident table; partial
+    residents are prorated by default. Selecting a variant at calculation time
+    is then a single dictionary lookup.
+    """
+
+    def __init__(
+        self,
+        calculators: Dict[str, BaseTaxCalculator],
+        variant_calculators: Dict[str, BaseTaxCalculator]
+    ):
+        """
+        Args:
+            calculators: Calculator per rule type, used for the resident variant
+            variant_calculators: Calculator per ``calculation_type`` for overrides
+        """
+        self.calculators = calculators
+        self.variant_calculators = variant_calculators
+
+    @classmethod
+    def default(cls) -> 'RuleCompiler':
+        """Compiler with the built-in calculators, as used by the service and the embeddable engine."""
+        income_tax = IncomeTaxCalculator()
+        return cls(
+            {"income_tax": income_tax, "sales_tax": SalesTaxCalculator()},
+            {"brackets": income_tax, "flat": WithholdingTaxCalculator()}
+        )
+
+    def compile(self, rule_data: Dict[str, Any]) -> CompiledTaxRule:
+        calculator = self.calculators.get(rule_data["rule_type"])
+        if calculator is None:
+            return CompiledTaxRule(
+                rule_data, compile_error=f"Calculator not implemented for rule type '{rule_data['rule_type']}'"
+            )
+
+        try:
+            return CompiledTaxRule(rule_data, self._compile_variants(calculator, rule_data["tax_rule"]))
+        except (ValueError, TypeError, AttributeError) as e:
+            return CompiledTaxRule(rule_data, compile_error=f"Invalid tax rule: {str(e)}")
+
+    def _compile_variants(
+        self,
+        calculator: BaseTaxCalculator,
+        tax_rule: Dict[str, Any]
+    ) -> Dict[ResidencyType, RuleVariant]:
+        resident_table = calculator.compile(tax_rule)
+        overrides = tax_rule.get("residency_variants") or {}
+
+        unknown = set(overrides) - {r.value for r in ResidencyType}
+        if unknown:
+            raise ValueError(f"Unknown residency types: {', '.join(sorted(unknown))}")
+
+        variants = {}
+        for residency in ResidencyType:
+            spec = overrides.get(residency.value, {})
+            prorated = spec.get("prorate", residency is ResidencyType.PARTIAL_RESIDENT)
+
+            calculation_type = spec.get("calculation_type")
+            if calculation_type is None:
+                variants[residency] = RuleVariant(calculator, resident_table, prorated)
+                continue
+
+            variant_calculator = self.variant_calculators.get(calculation_type)
+            if variant_calculator is None:
+                raise ValueError(f"Unsupported calculation_type '{calculation_type}' for {residency.value}")
+            variants[residency] = RuleVariant(variant_calculator, variant_calculator.compile(spec), prorated)
+        return variants
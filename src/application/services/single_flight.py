@@ -0,0 +1,47 @@
+"""
+Application Service: SingleFlight
+Coalesces concurrent calls for the same key into one execution.
+"""
+import asyncio
+from typing import Awaitable, Callable, Dict, Hashable, TypeVar
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """
+    Runs at most one call per key at a time; callers arriving while it runs
+    await the same result (or exception) instead of starting their own.
+
+    The shared call is shielded, so a caller that is cancelled (e.g. its
+    client disconnected) does not cancel the load the other callers wait on.
+    Once the call finishes the key is free again; results are not cached here.
+    """
+
+    def __init__(self):
+        self._calls: Dict[Hashable, asyncio.Future] = {}
+
+    @property
+    def in_flight(self) -> int:
+        return len(self._calls)
+
+    async def do(self, key: Hashable, call: Callable[[], Awaitable[T]]) -> T:
+        future = self._calls.get(key)
+        if future is None:
+            future = asyncio.ensure_future(call())
+            self._calls[key] = future
+            future.add_done_callback(lambda done: self._finished(key, done))
+        return await asyncio.shield(future)
+
+    def is_running(self, key: Hashable) -> bool:
+        return key in self._calls
+
+    def forget(self, key: Hashable) -> None:
+        """Let the next call for ``key`` start fresh even if one is still running."""
+        self._calls.pop(key, None)
+
+    def _finished(self, key: Hashable, future: asyncio.Future) -> None:
+        if self._calls.get(key) is future:
+            del self._calls[key]
+        if not future.cancelled():
+            future.exception()  # Retrieved here too, so an unobserved failure is not logged as lost
@@ -2,20 +2,42 @@
 Application Service: TaxCalculationService
 Orchestrates tax calculation use cases and coordinates between domain and infrastructure.
 """
+import asyncio
+import hashlib
+import logging
+import time
 import uuid
-from datetime import date
-from typing import List, Optional, Dict, Any
+from datetime import date, datetime
+from typing import List, Optional, Dict, Any, Set, Tuple
 
 from src.application.mappers.tax_rule_mapper import TaxRuleMapper
-from src.application.services.SalesTaxCalculator import SalesTaxCalculator
-from src.application.services.income_tax_calculator import IncomeTaxCalculator
+from src.application.services.audit_log import AuditEntry, AuditLog
+from src.application.services.calculation_pool import CalculationPool
+from src.application.services.rule_compiler import CompiledTaxRule, RuleCompiler, RuleVariant
+from src.application.services.single_flight import SingleFlight
+from src.application.services.tax_rule_index import TaxRuleIndex
+from src.application.services.tracing import traced, tracer
+from src.presentation.api.v1.schemas.response.batch_calculation_response import BatchCalculationResponse
+from src.presentation.api.v1.schemas.response.inverse_calculation_response import InverseCalculationResponse
+from src.presentation.api.v1.schemas.response.scenario_response import TaxScenarioResponse
 from src.presentation.api.v1.schemas.response.tax_calculation_response import TaxCalculationResponse
 from src.domain.entities.tax_rule import TaxRule
 
 
 from ...domain.value_objects.country_code import CountryCode
+from ...domain.value_objects.residency_status import ResidencyStatus, ResidencyType
 from ...domain.value_objects.version_number import VersionNumber
-from ...shared.exceptions.base_exceptions import BusinessException, ValidationException
+from ...shared.exceptions.base_exceptions import BusinessException, ServiceUnavailableException, ValidationException
+
+logger = logging.getLogger(__name__)
+
+DAYS_IN_YEAR = 365
+
+# Pause after a failed background reload before the next request retries it
+REVALIDATION_RETRY_SECONDS = 1.0
+
+# Fields of a rule listing that can be selected with a projection
+RULE_LISTING_FIELDS = ("id", "country_code", "rule_type", "version", "is_active", "tax_rule")
 
 
 class TaxCalculationService:
@@ -26,57 +48,388 @@ class TaxCalculationService:
     
     def __init__(
         self,
-        tax_rule_repository
+        tax_rule_repository,
+        default_country_code: str = "US",
+        rule_index: Optional[TaxRuleIndex] = None,
+        calculation_pool: Optional[CalculationPool] = None,
+        audit_log: Optional[AuditLog] = None
     ):
         """
         Initialize the service with required dependencies.
         
         Args:
             tax_rule_repository: Repository for tax rule persistence
-            audit_repository: Repository for audit record persistence
-            mapper: Mapper for DTO transformations
+            default_country_code: Jurisdiction used when a request names none
+            rule_index: In-memory index of active rules keyed by (country, rule_type)
+            calculation_pool: Process pool for large batch and scenario runs
+            audit_log: Buffered audit log recording every calculated amount
         """
         self.tax_rule_repository = tax_rule_repository
-        # self.audit_repository = audit_repository
-        self.calculators = {
-            "income_tax": IncomeTaxCalculator(),
-            "sales_tax": SalesTaxCalculator()
-        }
+        self.default_country_code = default_country_code
+        self.rule_index = rule_index or TaxRuleIndex()
+        self.calculation_pool = calculation_pool
+        self.audit_log = audit_log
+        # Coalesces concurrent index misses; the generation changes whenever a rule is created
+        self._rule_loads = SingleFlight()
+        self._rule_generation = 0
+        # Background reloads of expired rules that are served stale meanwhile
+        self._revalidations: Set[asyncio.Task] = set()
+        self._revalidate_after: Dict[Tuple[str, str], float] = {}
+        self.stale_served = 0
+        self.revalidation_failures = 0
+        # (computed_at, etag) of the last full rule listing, dropped when a rule is created
+        self._catalog_etag: Optional[Tuple[float, str]] = None
+        # Residency variants are compiled once per rule version into a dispatch table
+        self.rule_compiler = RuleCompiler.default()
+        self.calculators = self.rule_compiler.calculators
     
 
+    @traced("TaxCalculationService.calculate_tax")
     async def calculate_tax(
         self,
         amount: float,
-        rule_type: str
+        rule_type: str,
+        country_code: Optional[str] = None,
+        residency: Optional[ResidencyStatus] = None,
+        days_resident: Optional[int] = None,
+        include_breakdown: bool = False
     ) -> TaxCalculationResponse:
         try:
-            tax_data = self.tax_rule_repository.get_active_tax_rule(rule_type)
+            country = self._normalize_country_code(country_code)
+            residency_type = residency.status_type if residency else ResidencyType.TAX_RESIDENT
+            rule = await self._get_active_rule(rule_type, country)
+
+            if not rule or not rule.data.get("tax_rule"):
+                raise BusinessException(f"No applicable tax rule found for {rule_type} in {country}")
+
+            result = self._calculate_with_rule(amount, rule, residency_type, days_resident, include_breakdown)
+            await self._audit(
+                "calculate", rule, country, residency_type, days_resident, [amount], [result["tax_amount"]]
+            )
+            return TaxRuleMapper.to_tax_calculation_response(
+                amount, result, rule.version, country, residency_type.value,
+                rule_stale_seconds=self._staleness(country, rule_type)
+            )
+
+        except (ValidationException, BusinessException, ServiceUnavailableException):
+            raise
+        except Exception as e:
+            raise BusinessException(f"Tax calculation failed: {str(e)}")
+
+    async def calculate_tax_multi_jurisdiction(
+        self,
+        amount: float,
+        rule_type: str,
+        country_codes: List[str],
+        residency: Optional[ResidencyStatus] = None,
+        days_resident: Optional[int] = None,
+        include_breakdown: bool = False
+    ) -> List[TaxCalculationResponse]:
+        """
+        Calculate the liability for the same amount in several jurisdictions.
+
+        Rules missing from the index are loaded with a single repository query
+        for all countries instead of one round trip per jurisdiction.
+        """
+        try:
+            countries = list(dict.fromkeys(self._normalize_country_code(c) for c in country_codes))
+            residency_type = residency.status_type if residency else ResidencyType.TAX_RESIDENT
+            rules = await self._get_active_rules(rule_type, countries)
 
-            if not tax_data or not tax_data.get("tax_rule"):
-                raise BusinessException(f"No applicable tax rule found for {rule_type}")
+            missing = [c for c in countries if not rules.get(c) or not rules[c].data.get("tax_rule")]
+            if missing:
+                raise BusinessException(
+                    f"No applicable tax rule found for {rule_type} in {', '.join(missing)}"
+                )
 
-            result = self.calculate_tax_by_rule_type(amount, rule_type, tax_data["tax_rule"])
-            return TaxRuleMapper.to_tax_calculation_response(amount, result, tax_data["version"])
+            responses = []
+            for country in countries:
+                result = self._calculate_with_rule(
+                    amount, rules[country], residency_type, days_resident, include_breakdown
+                )
+                await self._audit(
+                    "multi_jurisdiction", rules[country], country, residency_type, days_resident,
+                    [amount], [result["tax_amount"]]
+                )
+                responses.append(TaxRuleMapper.to_tax_calculation_response(
+                    amount, result, rules[country].version, country, residency_type.value,
+                    rule_stale_seconds=self._staleness(country, rule_type)
+                ))
+            return responses
 
-        except (ValidationException, BusinessException):
+        except (ValidationException, BusinessException, ServiceUnavailableException):
             raise
         except Exception as e:
             raise BusinessException(f"Tax calculation failed: {str(e)}")
 
-    async def get_active_tax_rule(self, tax_type: str) -> TaxRule:
+    async def calculate_scenarios(
+        self,
+        amounts: List[float],
+        rule_type: str,
+        country_code: Optional[str] = None,
+        residency: Optional[ResidencyStatus] = None,
+        days_resident: Optional[int] = None
+    ) -> TaxScenarioResponse:
+        """
+        Evaluate many what-if amounts against one rule in a single call.
+
+        The rule and its residency variant are resolved once; every point is
+        then a bisect into the compiled table's prefix sums.
+        """
+        try:
+            country = self._normalize_country_code(country_code)
+            residency_type = residency.status_type if residency else ResidencyType.TAX_RESIDENT
+            rule = await self._get_active_rule(rule_type, country)
+
+            if not rule or not rule.data.get("tax_rule"):
+                raise BusinessException(f"No applicable tax rule found for {rule_type} in {country}")
+
+            evaluated = await self._evaluate_many(
+                amounts, rule, residency_type, days_resident, with_marginal=True
+            )
+            points = [(amount, tax, marginal) for amount, (tax, marginal) in zip(amounts, evaluated)]
+            return TaxRuleMapper.to_tax_scenario_response(
+                points, rule_type, rule.version, country, residency_type.value,
+                rule_stale_seconds=self._staleness(country, rule_type)
+            )
+
+        except (ValidationException, BusinessException, ServiceUnavailableException):
+            raise
+        except Exception as e:
+            raise BusinessException(f"Tax scenario calculation failed: {str(e)}")
+
+    async def calculate_batch(
+        self,
+        amounts: List[float],
+        rule_type: str,
+        country_code: Optional[str] = None,
+        residency: Optional[ResidencyStatus] = None,
+        days_resident: Optional[int] = None
+    ) -> BatchCalculationResponse:
+        """Calculate the tax for many amounts against one rule."""
+        try:
+            country = self._normalize_country_code(country_code)
+            residency_type = residency.status_type if residency else ResidencyType.TAX_RESIDENT
+            rule = await self._get_active_rule(rule_type, country)
+
+            if not rule or not rule.data.get("tax_rule"):
+                raise BusinessException(f"No applicable tax rule found for {rule_type} in {country}")
+
+            evaluated = await self._evaluate_many(
+                amounts, rule, residency_type, days_resident, with_marginal=False
+            )
+            tax_amounts = [tax for tax, _ in evaluated]
+            await self._audit("batch", rule, country, residency_type, days_resident, amounts, tax_amounts)
+            return TaxRuleMapper.to_batch_calculation_response(
+                tax_amounts, rule_type, rule.version, country, residency_type.value,
+                rule_stale_seconds=self._staleness(country, rule_type)
+            )
+
+        except (ValidationException, BusinessException, ServiceUnavailableException):
+            raise
+        except Exception as e:
+            raise BusinessException(f"Batch tax calculation failed: {str(e)}")
+
+    async def calculate_columns(
+        self,
+        amounts: Any,
+        rule_type: str,
+        country_code: Optional[str] = None,
+        residency: Optional[ResidencyStatus] = None,
+        days_resident: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """
+        Calculate a float64 NumPy column of amounts against one rule in a
+        single vectorized pass, for Arrow and Parquet payloads.
+
+        Returns:
+            ``tax_amount`` and ``effective_rate`` arrays, plus the rule version,
+            country code and residency they were calculated with, and the rule's staleness
+        """
+        from src.application.services.vector_kernel import VectorTable, round_cents
+
         try:
-            data = self.tax_rule_repository.get_active_tax_rule(tax_type)
-            return TaxRuleMapper.from_dict(data)
+            if amounts.size == 0:
+                raise ValidationException("At least one amount is required")
+            if amounts.min() < 0:
+                raise ValidationException("Amounts cannot be negative")
+            if amounts.max() != amounts.max():  # NaN propagates through max; one check covers nulls
+                raise ValidationException("Amounts cannot be null")
+
+            country = self._normalize_country_code(country_code)
+            residency_type = residency.status_type if residency else ResidencyType.TAX_RESIDENT
+            rule = await self._get_active_rule(rule_type, country)
+
+            if not rule or not rule.data.get("tax_rule"):
+                raise BusinessException(f"No applicable tax rule found for {rule_type} in {country}")
+
+            variant, year_fraction = self._variant_for(rule, residency_type, days_resident)
+            # Amounts are rounded to cents like the JSON batch request rounds them
+            amounts = round_cents(amounts)
+            tax_amounts, effective_rates = VectorTable.from_table(variant.table_for(year_fraction)).evaluate(amounts)
+
+            await self._audit("batch", rule, country, residency_type, days_resident, amounts, tax_amounts)
+            return {
+                "tax_amount": tax_amounts,
+                "effective_rate": effective_rates,
+                "rule_version": rule.version,
+                "country_code": country,
+                "residency": residency_type.value,
+                "rule_stale_seconds": self._staleness(country, rule_type),
+            }
+
+        except (ValidationException, BusinessException, ServiceUnavailableException):
+            raise
+        except Exception as e:
+            raise BusinessException(f"Columnar tax calculation failed: {str(e)}")
+
+    async def get_active_rule_etag(self, rule_type: str, country_code: Optional[str] = None) -> Optional[str]:
+        """
+        Weak ETag of the active rule, derived from its id and version.
+
+        Every read of the active rule, and every calculation against it, is
+        deterministic for a given rule version, so this validates all of them.
+        It is served from the rule index: while the rule is cached, answering
+        If-None-Match needs no repository call.
+        """
+        country = self._normalize_country_code(country_code)
+        rule = await self._get_active_rule(rule_type, country)
+        if not rule:
+            return None
+        return f'W/"{country}-{rule.data["id"]}-{rule.version}"'
+
+    def warm_rule_index(self) -> int:
+        """
+        Load and compile every active rule into the index up front. Runs
+        synchronously, before the event loop starts (e.g. in a preloading
+        gunicorn master), so the first requests never miss.
+
+        Returns:
+            The number of rules loaded
+        """
+        rules = self.tax_rule_repository.get_all_active_rules()
+        for data in rules:
+            self.rule_index.put(data["country_code"], data["rule_type"], self.rule_compiler.compile(data))
+        return len(rules)
+
+    def _remember_catalog(self, data_list: List[Dict[str, Any]]) -> None:
+        digest = hashlib.sha1(
+            "\n".join(f"{d['id']}:{d['version']}:{d['is_active']}" for d in data_list).encode()
+        ).hexdigest()[:16]
+        self._catalog_etag = (time.monotonic(), f'W/"rules-{digest}"')
+
+    def get_rules_catalog_etag(self) -> Optional[str]:
+        """ETag of the last rule listing, if it is recent enough to trust without a repository call."""
+        if self._catalog_etag is None:
+            return None
+        computed_at, etag = self._catalog_etag
+        if time.monotonic() - computed_at > self.rule_index.ttl_seconds:
+            return None
+        return etag
+
+    async def validate_calculation(
+        self,
+        rule_type: str,
+        country_code: Optional[str] = None,
+        residency: Optional[ResidencyStatus] = None,
+        days_resident: Optional[int] = None
+    ) -> str:
+        """
+        Check that a calculation could run, without calculating or auditing.
+
+        Returns:
+            The normalized country code
+        """
+        country = self._normalize_country_code(country_code)
+        residency_type = residency.status_type if residency else ResidencyType.TAX_RESIDENT
+        rule = await self._get_active_rule(rule_type, country)
+
+        if not rule or not rule.data.get("tax_rule"):
+            raise BusinessException(f"No applicable tax rule found for {rule_type} in {country}")
+        self._variant_for(rule, residency_type, days_resident)
+        return country
+
+    async def calculate_gross_from_net(
+        self,
+        net_amounts: List[float],
+        rule_type: str,
+        country_code: Optional[str] = None,
+        residency: Optional[ResidencyStatus] = None,
+        days_resident: Optional[int] = None
+    ) -> InverseCalculationResponse:
+        """
+        Solve the gross amount that leaves each target net amount after tax.
+
+        Each target is solved in closed form on the compiled table's net
+        breakpoints and is exact to the cent.
+        """
+        try:
+            country = self._normalize_country_code(country_code)
+            residency_type = residency.status_type if residency else ResidencyType.TAX_RESIDENT
+            rule = await self._get_active_rule(rule_type, country)
+
+            if not rule or not rule.data.get("tax_rule"):
+                raise BusinessException(f"No applicable tax rule found for {rule_type} in {country}")
+
+            variant, year_fraction = self._variant_for(rule, residency_type, days_resident)
+            table = variant.table_for(year_fraction)
+            try:
+                results = [(net, *table.solve_gross(net)) for net in net_amounts]
+            except ValueError as e:
+                raise BusinessException(str(e))
+
+            return TaxRuleMapper.to_inverse_calculation_response(
+                results, rule_type, rule.version, country, residency_type.value,
+                rule_stale_seconds=self._staleness(country, rule_type)
+            )
+
+        except (ValidationException, BusinessException, ServiceUnavailableException):
+            raise
+        except Exception as e:
+            raise BusinessException(f"Inverse tax calculation failed: {str(e)}")
+
+    async def get_active_tax_rule(self, tax_type: str, country_code: Optional[str] = None) -> TaxRule:
+        try:
+            rule = await self._get_active_rule(tax_type, self._normalize_country_code(country_code))
+            return TaxRuleMapper.from_dict(rule.data if rule else None)
+        except (ValidationException, ServiceUnavailableException):
+            raise
         except Exception as e:
             raise BusinessException(f"Failed to retrieve rule versions: {str(e)}")
 
     async def get_available_rules(self) -> List[TaxRule]:
         try:
             data_list = self.tax_rule_repository.get_all_versions()
+            self._remember_catalog(data_list)
             return [TaxRuleMapper.from_dict(d) for d in data_list]
         except Exception as e:
             raise BusinessException(f"Failed to retrieve rule versions: {str(e)}")
 
+    async def get_available_rules_projection(self, fields: List[str]) -> List[Dict[str, Any]]:
+        """
+        List every rule with only ``fields``; the projection is applied in the
+        repository query, so unrequested columns are never loaded.
+
+        Raises:
+            ValidationException: If a field is not part of the rule listing
+        """
+        unknown = [f for f in fields if f not in RULE_LISTING_FIELDS]
+        if unknown:
+            raise ValidationException(
+                f"Unknown fields: {', '.join(unknown)}. Allowed: {', '.join(RULE_LISTING_FIELDS)}"
+            )
+
+        requested = list(dict.fromkeys(fields))
+        # The listing ETag needs id, version and is_active; all three are small columns
+        selected = list(dict.fromkeys(requested + ["id", "version", "is_active"]))
+        try:
+            data_list = self.tax_rule_repository.get_all_versions(fields=selected)
+        except Exception as e:
+            raise BusinessException(f"Failed to retrieve rule versions: {str(e)}")
+
+        self._remember_catalog(data_list)
+        return [{f: d[f] for f in requested} for d in data_list]
+
     async def create_tax_rule(
         self,
         rule_type: str,
@@ -84,10 +437,13 @@ class TaxCalculationService:
         tax_date,
         tax_rule: Dict[str, Any],
         is_active: bool,
-        created_by: str
+        created_by: str,
+        country_code: Optional[str] = None
     ) -> TaxRule:
         try:
+            country = self._normalize_country_code(country_code)
             rule_data = {
+                "country_code": country,
                 "rule_type": rule_type,
                 "version": version,
                 "tax_date": tax_date,
@@ -98,16 +454,235 @@ class TaxCalculationService:
                 "updated_by": created_by
             }
             created = self.tax_rule_repository.create_rule(rule_data)
+            # The previous active rule of this type was just deactivated
+            self.rule_index.invalidate(country, rule_type)
+            self._rule_generation += 1
+            self._rule_loads.forget((country, rule_type))
+            self._catalog_etag = None
             return TaxRuleMapper.from_dict(created)
-        except (ValidationException, BusinessException):
+        except (ValidationException, BusinessException, ServiceUnavailableException):
             raise
         except Exception as e:
             raise BusinessException(f"Tax rule adding failed: {str(e)}")
 
-    def calculate_tax_by_rule_type(self, amount: float, rule_type: str, rule_data: Dict[str, Any]):
+    def calculate_tax_by_rule_type(
+        self,
+        amount: float,
+        rule_type: str,
+        rule_data: Dict[str, Any],
+        include_breakdown: bool = False
+    ):
         calculator = self.calculators.get(rule_type)
         if not calculator:
             raise BusinessException(f"Calculator not implemented for rule type '{rule_type}'")
         if not hasattr(calculator, "calculate"):
             raise BusinessException(f"Calculator for '{rule_type}' has no 'calculate' method")
-        return calculator.calculate(amount, rule_data)
+        return calculator.calculate(amount, rule_data, include_breakdown)
+
+    def _normalize_country_code(self, country_code: Optional[str]) -> str:
+        """Validate a country code, falling back to the service default."""
+        if not country_code:
+            return self.default_country_code
+        try:
+            return CountryCode.from_string(country_code).code
+        except ValueError as e:
+            raise ValidationException(str(e))
+
+    def _calculate_with_rule(
+        self,
+        amount: float,
+        rule: CompiledTaxRule,
+        residency_type: ResidencyType,
+        days_resident: Optional[int],
+        include_breakdown: bool = False
+    ) -> Dict[str, Any]:
+        """Dispatch to the precompiled variant for the residency type."""
+        variant, year_fraction = self._variant_for(rule, residency_type, days_resident)
+        with tracer.start_span("calculator.calculate") as span:
+            if span is not None:
+                self._describe_calculation(span, rule, residency_type)
+            return variant.calculate(amount, year_fraction, include_breakdown)
+
+    @staticmethod
+    def _describe_calculation(span, rule: CompiledTaxRule, residency_type: ResidencyType) -> None:
+        span.set_attribute("tax.rule_type", rule.data["rule_type"])
+        span.set_attribute("tax.rule_version", rule.version)
+        span.set_attribute("tax.residency", residency_type.value)
+
+    def _variant_for(
+        self,
+        rule: CompiledTaxRule,
+        residency_type: ResidencyType,
+        days_resident: Optional[int]
+    ) -> Tuple[RuleVariant, float]:
+        """Select the precompiled variant and the share of the year it applies to."""
+        if rule.compile_error:
+            raise BusinessException(rule.compile_error)
+
+        variant = rule.variants[residency_type]
+        if not variant.prorated:
+            return variant, 1.0
+
+        if days_resident is None:
+            raise ValidationException(f"days_resident is required for {residency_type.value} calculations")
+        return variant, min(days_resident / DAYS_IN_YEAR, 1.0)
+
+    async def _evaluate_many(
+        self,
+        amounts: List[float],
+        rule: CompiledTaxRule,
+        residency_type: ResidencyType,
+        days_resident: Optional[int],
+        with_marginal: bool
+    ) -> List[Tuple[float, float]]:
+        """
+        ``(tax_amount, marginal_rate)`` for every amount; batches above the pool
+        threshold run on the process pool instead of the event loop.
+        """
+        variant, year_fraction = self._variant_for(rule, residency_type, days_resident)
+        offload = bool(self.calculation_pool and self.calculation_pool.should_offload(len(amounts)))
+
+        with tracer.start_span("calculator.evaluate_many") as span:
+            if span is not None:
+                self._describe_calculation(span, rule, residency_type)
+                span.set_attribute("tax.amount_count", len(amounts))
+                span.set_attribute("tax.offloaded", offload)
+
+            table = variant.table_for(year_fraction)
+            if offload:
+                return await self.calculation_pool.evaluate(table, amounts, with_marginal)
+
+            if with_marginal:
+                return [(round(table.tax_for(a), 2), table.marginal_rate(a)) for a in amounts]
+            return [(round(table.tax_for(a), 2), 0.0) for a in amounts]
+
+    async def _audit(
+        self,
+        operation: str,
+        rule: CompiledTaxRule,
+        country: str,
+        residency_type: ResidencyType,
+        days_resident: Optional[int],
+        amounts: List[float],
+        tax_amounts: List[float]
+    ) -> None:
+        """Hand the calculated amounts to the audit log; written later in batches."""
+        if self.audit_log is None:
+            return
+        await self.audit_log.record(AuditEntry(
+            datetime.utcnow(), operation, rule.data["rule_type"], country, residency_type.value,
+            days_resident, rule.version, amounts, tax_amounts
+        ))
+
+    async def _get_active_rule(self, rule_type: str, country_code: str) -> Optional[CompiledTaxRule]:
+        """
+        Look up the active rule in the index, loading and compiling it on a miss.
+        Concurrent misses for the same rule share one repository query.
+
+        An expired rule still within the index's stale window is served as is
+        while it is reloaded in the background, so a slow or failing database
+        does not fail calculations against rules it already answered for.
+        """
+        rule = self.rule_index.get(country_code, rule_type)
+        if rule is not None:
+            return rule
+
+        stale = self.rule_index.get_stale(country_code, rule_type)
+        if stale is not None:
+            self._revalidate(rule_type, country_code)
+            return stale[0]
+
+        return await self._rule_loads.do(
+            (country_code, rule_type), lambda: self._load_active_rule(rule_type, country_code)
+        )
+
+    def _revalidate(self, rule_type: str, country_code: str) -> None:
+        """Reload an expired rule in the background; at most one reload per rule runs at a time."""
+        self.stale_served += 1
+        key = (country_code, rule_type)
+        if self._rule_loads.is_running(key) or time.monotonic() < self._revalidate_after.get(key, 0.0):
+            return
+        task = asyncio.ensure_future(self._rule_loads.do(key, lambda: self._load_active_rule(rule_type, country_code)))
+        self._revalidations.add(task)
+        task.add_done_callback(lambda done: self._revalidated(key, done))
+
+    def _revalidated(self, key: Tuple[str, str], task: asyncio.Task) -> None:
+        self._revalidations.discard(task)
+        if task.cancelled():
+            return
+        error = task.exception()
+        if error is None:
+            self._revalidate_after.pop(key, None)
+            return
+        # The stale rule keeps being served until the stale window closes
+        self.revalidation_failures += 1
+        self._revalidate_after[key] = time.monotonic() + REVALIDATION_RETRY_SECONDS
+        logger.warning(f"Revalidating the {key[1]} rule for {key[0]} failed, serving it stale: {error}")
+
+    def _staleness(self, country_code: str, rule_type: str) -> Optional[float]:
+        """Seconds the served rule is past its TTL, or None when it is fresh."""
+        staleness = self.rule_index.staleness(country_code, rule_type)
+        return round(staleness, 3) if staleness > 0 else None
+
+    def rule_cache_stats(self) -> Dict[str, object]:
+        return {
+            **self.rule_index.stats(),
+            "stale_served": self.stale_served,
+            "revalidations_running": len(self._revalidations),
+            "revalidation_failures": self.revalidation_failures,
+        }
+
+    async def _load_active_rule(self, rule_type: str, country_code: str) -> Optional[CompiledTaxRule]:
+        generation = self._rule_generation
+        data = await asyncio.to_thread(self.tax_rule_repository.get_active_tax_rule, rule_type, country_code)
+        if not data:
+            # Deactivated since it was cached: stop serving the stale copy
+            if generation == self._rule_generation:
+                self.rule_index.invalidate(country_code, rule_type)
+            return None
+        rule = self.rule_compiler.compile(data)
+        # A rule created while the query ran may already have replaced this one; serve it, but do not cache it
+        if generation == self._rule_generation:
+            self.rule_index.put(country_code, rule_type, rule)
+        return rule
+
+    async def _get_active_rules(self, rule_type: str, country_codes: List[str]) -> Dict[str, CompiledTaxRule]:
+        """Batch variant of _get_active_rule; misses are loaded with one query, shared by identical lookups."""
+        found: Dict[str, CompiledTaxRule] = {}
+        misses: List[str] = []
+        for country in country_codes:
+            rule = self.rule_index.get(country, rule_type)
+            if rule is not None:
+                found[country] = rule
+                continue
+            stale = self.rule_index.get_stale(country, rule_type)
+            if stale is not None:
+                self._revalidate(rule_type, country)
+                found[country] = stale[0]
+            else:
+                misses.append(country)
+
+        if misses:
+            misses.sort()
+            # Keyed by generation: a batch started before a rule was created is not joined after it
+            found.update(await self._rule_loads.do(
+                (tuple(misses), rule_type, self._rule_generation), lambda: self._load_active_rules(rule_type, misses)
+            ))
+        return found
+
+    async def _load_active_rules(self, rule_type: str, country_codes: List[str]) -> Dict[str, CompiledTaxRule]:
+        generation = self._rule_generation
+        loaded = await asyncio.to_thread(self.tax_rule_repository.get_active_tax_rules, rule_type, country_codes)
+        rules = {}
+        for country in country_codes:
+            data = loaded.get(country)
+            if data:
+                rules[country] = self.rule_compiler.compile(data)
+            if generation != self._rule_generation:
+                continue
+            if data:
+                self.rule_index.put(country, rule_type, rules[country])
+            else:
+                # Deactivated since it was cached, as in _load_active_rule
+                self.rule_index.invalidate(country, rule_type)
+        return rules
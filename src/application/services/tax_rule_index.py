@@ -0,0 +1,91 @@
+"""
+Application Service: TaxRuleIndex
+Country-partitioned in-memory index of the active tax rules.
+"""
+import time
+from typing import Dict, List, Optional, Tuple
+
+from .rule_compiler import CompiledTaxRule
+
+
+class TaxRuleIndex:
+    """
+    In-memory index of active tax rules keyed by (country_code, rule_type).
+
+    Rules are partitioned by country so that a jurisdiction can be refreshed or
+    dropped without touching the others. Entries expire after ``ttl_seconds`` so
+    that rules activated through another worker process are eventually picked up.
+
+    An expired entry is kept for another ``max_stale_seconds`` as the last known
+    good rule: ``get`` no longer returns it, but ``get_stale`` does, so callers
+    can keep serving it while they revalidate, or while the database is down.
+    """
+
+    def __init__(self, ttl_seconds: float = 60.0, max_stale_seconds: float = 0.0):
+        self.ttl_seconds = ttl_seconds
+        self.max_stale_seconds = max_stale_seconds
+        self._partitions: Dict[str, Dict[str, Tuple[float, CompiledTaxRule]]] = {}
+
+    def get(self, country_code: str, rule_type: str) -> Optional[CompiledTaxRule]:
+        """Return the cached active rule, or None if it is missing or expired."""
+        entry = self._entry(country_code, rule_type)
+        if entry is None or time.monotonic() - entry[0] > self.ttl_seconds:
+            return None
+        return entry[1]
+
+    def get_stale(self, country_code: str, rule_type: str) -> Optional[Tuple[CompiledTaxRule, float]]:
+        """Return an expired rule still within ``max_stale_seconds``, with the seconds since it expired."""
+        entry = self._entry(country_code, rule_type)
+        if entry is None:
+            return None
+        staleness = time.monotonic() - entry[0] - self.ttl_seconds
+        return (entry[1], staleness) if staleness > 0 else None
+
+    def staleness(self, country_code: str, rule_type: str) -> float:
+        """Seconds since the cached rule expired; 0 while it is fresh or when none is cached."""
+        entry = self._entry(country_code, rule_type)
+        return max(0.0, time.monotonic() - entry[0] - self.ttl_seconds) if entry else 0.0
+
+    def put(self, country_code: str, rule_type: str, rule: CompiledTaxRule) -> None:
+        """Store the active rule for a country and rule type."""
+        self._partitions.setdefault(country_code, {})[rule_type] = (time.monotonic(), rule)
+
+    def invalidate(self, country_code: str, rule_type: Optional[str] = None) -> None:
+        """Drop one rule type, or the whole partition when no rule type is given."""
+        if rule_type is None:
+            self._partitions.pop(country_code, None)
+            return
+
+        partition = self._partitions.get(country_code)
+        if partition is not None:
+            partition.pop(rule_type, None)
+
+    def clear(self) -> None:
+        """Drop every cached rule."""
+        self._partitions.clear()
+
+    def countries(self) -> List[str]:
+        """Country codes that currently have at least one cached rule."""
+        return [code for code, partition in self._partitions.items() if partition]
+
+    def stats(self) -> Dict[str, object]:
+        now = time.monotonic()
+        ages = [
+            now - loaded_at for partition in self._partitions.values() for loaded_at, _ in partition.values()
+            if now - loaded_at <= self.ttl_seconds + self.max_stale_seconds
+        ]
+        stale = [age - self.ttl_seconds for age in ages if age > self.ttl_seconds]
+        return {
+            "entries": len(ages),
+            "stale_entries": len(stale),
+            "max_staleness_seconds": round(max(stale, default=0.0), 3),
+        }
+
+    def _entry(self, country_code: str, rule_type: str) -> Optional[Tuple[float, CompiledTaxRule]]:
+        """The entry if it is fresh or within the stale window; entries past it are dropped."""
+        partition = self._partitions.get(country_code)
+        entry = partition.get(rule_type) if partition else None
+        if entry is not None and time.monotonic() - entry[0] > self.ttl_seconds + self.max_stale_seconds:
+            del partition[rule_type]
+            return None
+        return entry
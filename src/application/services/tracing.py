@@ -0,0 +1,300 @@
+"""
+Application Service: Tracing
+OpenTelemetry-compatible spans, with W3C Trace Context propagation and head sampling.
+"""
+import asyncio
+import contextvars
+import functools
+import json
+import random
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from typing import IO, Any, Dict, Iterator, List, NamedTuple, Optional, Union
+
+TRACEPARENT_HEADER = "traceparent"
+
+# OTLP span kinds and status codes
+SPAN_KIND_INTERNAL = 1
+SPAN_KIND_SERVER = 2
+STATUS_UNSET = 0
+STATUS_OK = 1
+STATUS_ERROR = 2
+
+_FLAG_SAMPLED = 0x01
+
+
+class SpanContext(NamedTuple):
+    trace_id: int
+    span_id: int
+    sampled: bool
+
+
+# Context a request arrived without, and decided not to sample
+_UNSAMPLED = SpanContext(0, 0, False)
+
+
+def parse_traceparent(value: Optional[str]) -> Optional[SpanContext]:
+    """The parent context in a W3C ``traceparent`` header, or None if it is missing or malformed."""
+    if not value:
+        return None
+    parts = value.strip().split("-")
+    if len(parts) < 4 or len(parts[0]) != 2 or parts[0] == "ff" or (parts[0] == "00" and len(parts) != 4):
+        return None
+    version, trace_id, span_id, flags = parts[:4]
+    if len(trace_id) != 32 or len(span_id) != 16 or len(flags) != 2:
+        return None
+    try:
+        context = SpanContext(int(trace_id, 16), int(span_id, 16), bool(int(flags, 16) & _FLAG_SAMPLED))
+        int(version, 16)
+    except ValueError:
+        return None
+    if context.trace_id == 0 or context.span_id == 0:
+        return None
+    return context
+
+
+def format_traceparent(context: SpanContext) -> str:
+    return f"00-{context.trace_id:032x}-{context.span_id:016x}-{_FLAG_SAMPLED if context.sampled else 0:02x}"
+
+
+class Span:
+    """A sampled span; unsampled work creates no Span at all."""
+    __slots__ = (
+        "name", "context", "parent_span_id", "kind", "attributes",
+        "start_ns", "end_ns", "status", "status_message", "_root", "_finished", "_exported"
+    )
+
+    def __init__(self, name: str, context: SpanContext, parent_span_id: Optional[int], kind: int,
+                 attributes: Optional[Dict[str, Any]], root: Optional["Span"]):
+        self.name = name
+        self.context = context
+        self.parent_span_id = parent_span_id
+        self.kind = kind
+        self.attributes: Dict[str, Any] = dict(attributes) if attributes else {}
+        self.start_ns = time.time_ns()
+        self.end_ns = 0
+        self.status = STATUS_UNSET
+        self.status_message = ""
+        # The first span of the trace in this process; its descendants are exported with it
+        self._root = root or self
+        self._finished: List["Span"] = []
+        self._exported = False
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+    def record_exception(self, error: BaseException) -> None:
+        self.status = STATUS_ERROR
+        self.status_message = str(error)
+        self.attributes["exception.type"] = type(error).__name__
+
+
+class ConsoleSpanExporter:
+    """Writes each batch of spans as one OTLP/JSON line, to stdout by default."""
+
+    def __init__(self, stream: Optional[IO[str]] = None, service_name: str = "tax-rules-engine"):
+        self.stream = stream
+        self.service_name = service_name
+        self._lock = threading.Lock()
+
+    def export(self, spans: List[Span]) -> None:
+        line = json.dumps(to_otlp_json(spans, self.service_name), separators=(",", ":"))
+        with self._lock:
+            stream = self.stream or sys.stdout
+            stream.write(line + "\n")
+            stream.flush()
+
+    def shutdown(self) -> None:
+        pass
+
+
+class FileSpanExporter(ConsoleSpanExporter):
+    """
+    Appends OTLP/JSON lines to a file, the format the OpenTelemetry
+    Collector's ``otlpjsonfile`` receiver reads.
+    """
+
+    def __init__(self, path: str, service_name: str = "tax-rules-engine"):
+        super().__init__(open(path, "a", encoding="utf-8"), service_name)
+
+    def shutdown(self) -> None:
+        with self._lock:
+            self.stream.close()
+
+
+class Tracer:
+    """
+    Creates spans and exports them once the request that started them ends.
+
+    A trace is sampled once, where it starts: a request carrying a
+    ``traceparent`` follows the caller's sampled flag, and one without is
+    sampled with probability ``sample_ratio``. Work in an unsampled trace
+    only sets a context variable, so the cost of tracing is proportional to
+    the sample ratio. With no exporter configured, spans are never started.
+    """
+
+    def __init__(self):
+        self.exporter = None
+        self.sample_ratio = 0.0
+        self._current: contextvars.ContextVar[Optional[Union[Span, SpanContext]]] = contextvars.ContextVar(
+            "current_span", default=None
+        )
+
+    @property
+    def enabled(self) -> bool:
+        return self.exporter is not None
+
+    def configure(self, exporter, sample_ratio: float) -> None:
+        self.exporter = exporter
+        self.sample_ratio = sample_ratio
+
+    def shutdown(self) -> None:
+        exporter, self.exporter = self.exporter, None
+        if exporter is not None:
+            exporter.shutdown()
+
+    def current_context(self) -> Optional[SpanContext]:
+        current = self._current.get()
+        return current.context if isinstance(current, Span) else current
+
+    @contextmanager
+    def start_span(
+        self,
+        name: str,
+        kind: int = SPAN_KIND_INTERNAL,
+        parent: Optional[SpanContext] = None,
+        attributes: Optional[Dict[str, Any]] = None
+    ) -> Iterator[Optional[Span]]:
+        """
+        Run the block in a child span of ``parent``, or of the current span.
+
+        Yields the Span, or None when the trace is not sampled or tracing is off.
+        """
+        if self.exporter is None:
+            yield None
+            return
+
+        current = parent if parent is not None else self._current.get()
+        root = current._root if isinstance(current, Span) else None
+        parent_context = current.context if isinstance(current, Span) else current
+        if parent_context is None:
+            sampled = random.random() < self.sample_ratio
+            trace_id = (random.getrandbits(128) or 1) if sampled else 0
+        else:
+            sampled, trace_id = parent_context.sampled, parent_context.trace_id
+
+        if not sampled:
+            token = self._current.set(parent_context or _UNSAMPLED)
+            try:
+                yield None
+            finally:
+                self._current.reset(token)
+            return
+
+        span = Span(
+            name,
+            SpanContext(trace_id, random.getrandbits(64) or 1, True),
+            parent_context.span_id if parent_context is not None else None,
+            kind,
+            attributes,
+            root
+        )
+        token = self._current.set(span)
+        try:
+            yield span
+        except Exception as e:
+            span.record_exception(e)
+            raise
+        finally:
+            self._current.reset(token)
+            self._end(span)
+
+    def _end(self, span: Span) -> None:
+        span.end_ns = time.time_ns()
+        root = span._root
+        if root is not span and not root._exported:
+            root._finished.append(span)
+            return
+        # The local root, or a background span that outlived it
+        span._exported = True
+        batch = span._finished + [span]
+        span._finished = []
+        exporter = self.exporter
+        if exporter is not None:
+            exporter.export(batch)
+
+
+# The process tracer, configured from settings by setup_dependencies
+tracer = Tracer()
+
+
+def traced(name: str, kind: int = SPAN_KIND_INTERNAL):
+    """Decorator running a function, sync or async, in a span named ``name``."""
+    def decorate(function):
+        if asyncio.iscoroutinefunction(function):
+            @functools.wraps(function)
+            async def async_wrapper(*args, **kwargs):
+                if not tracer.enabled:
+                    return await function(*args, **kwargs)
+                with tracer.start_span(name, kind):
+                    return await function(*args, **kwargs)
+
+            return async_wrapper
+
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            if not tracer.enabled:
+                return function(*args, **kwargs)
+            with tracer.start_span(name, kind):
+                return function(*args, **kwargs)
+
+        return wrapper
+
+    return decorate
+
+
+def to_otlp_json(spans: List[Span], service_name: str) -> Dict[str, Any]:
+    """Spans as an OTLP/JSON ``ExportTraceServiceRequest``."""
+    return {
+        "resourceSpans": [{
+            "resource": {"attributes": _otlp_attributes({"service.name": service_name})},
+            "scopeSpans": [{
+                "scope": {"name": __name__},
+                "spans": [_otlp_span(span) for span in spans],
+            }],
+        }]
+    }
+
+
+def _otlp_span(span: Span) -> Dict[str, Any]:
+    encoded = {
+        "traceId": f"{span.context.trace_id:032x}",
+        "spanId": f"{span.context.span_id:016x}",
+        "name": span.name,
+        "kind": span.kind,
+        "startTimeUnixNano": str(span.start_ns),
+        "endTimeUnixNano": str(span.end_ns),
+        "attributes": _otlp_attributes(span.attributes),
+        "status": {"code": span.status},
+    }
+    if span.parent_span_id is not None:
+        encoded["parentSpanId"] = f"{span.parent_span_id:016x}"
+    if span.status_message:
+        encoded["status"]["message"] = span.status_message
+    return encoded
+
+
+def _otlp_attributes(attributes: Dict[str, Any]) -> List[Dict[str, Any]]:
+    encoded = []
+    for key, value in attributes.items():
+        if isinstance(value, bool):
+            encoded.append({"key": key, "value": {"boolValue": value}})
+        elif isinstance(value, int):
+            encoded.append({"key": key, "value": {"intValue": str(value)}})
+        elif isinstance(value, float):
+            encoded.append({"key": key, "value": {"doubleValue": value}})
+        else:
+            encoded.append({"key": key, "value": {"stringValue": str(value)}})
+    return encoded
@@ -0,0 +1,67 @@
+"""
+Application Service: Vector kernel
+Evaluates a CompiledBracketTable over whole NumPy columns.
+"""
+from dataclasses import dataclass
+from typing import Tuple
+
+import numpy as np
+
+from src.application.services.bracket_table import CompiledBracketTable
+
+
+def round_cents(values: np.ndarray) -> np.ndarray:
+    """
+    Round to cents exactly like Python's ``round(x, 2)``.
+
+    ``np.round`` scales by 100 before rounding, so values a hair below a
+    half cent (30864.195 is stored as 30864.19499...) can round up where the
+    scalar path rounds down. The few elements that land near a tie are
+    re-rounded in Python; the rest keep the vectorized result.
+    """
+    rounded = np.round(values, 2)
+    scaled = values * 100
+    ties = np.flatnonzero(np.abs(scaled - np.floor(scaled) - 0.5) < 1e-6)
+    for i in ties:
+        rounded[i] = round(float(values[i]), 2)
+    return rounded
+
+
+@dataclass(frozen=True)
+class VectorTable:
+    """A CompiledBracketTable as NumPy arrays, so a whole column is evaluated with one searchsorted."""
+    lower_bounds: np.ndarray
+    rates: np.ndarray
+    cumulative_tax: np.ndarray
+
+    @classmethod
+    def from_table(cls, table: CompiledBracketTable) -> 'VectorTable':
+        return cls(
+            np.asarray(table.lower_bounds, dtype=np.float64),
+            np.asarray(table.rates, dtype=np.float64),
+            np.asarray(table.cumulative_tax, dtype=np.float64),
+        )
+
+    def tax(self, amounts: np.ndarray) -> np.ndarray:
+        """Unrounded tax per amount; amounts below the first bound pay nothing, NaN stays NaN."""
+        index = np.searchsorted(self.lower_bounds, amounts, side="right") - 1
+        below = index < 0
+        index[below] = 0
+        tax = self.cumulative_tax[index] + self.rates[index] * (amounts - self.lower_bounds[index])
+        tax[below & ~np.isnan(amounts)] = 0.0
+        return tax
+
+    def marginal_rate(self, amounts: np.ndarray) -> np.ndarray:
+        index = np.searchsorted(self.lower_bounds, amounts, side="right") - 1
+        rates = self.rates[np.maximum(index, 0)]
+        rates[index < 0] = 0.0
+        return rates
+
+    def evaluate(self, amounts: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        ``(tax_amount, effective_rate)`` columns rounded as the scenario
+        responses round them; the effective rate is a percentage, 0 for zero amounts.
+        """
+        tax = round_cents(self.tax(amounts))
+        effective = np.divide(tax, amounts, out=np.zeros_like(tax), where=amounts != 0) * 100
+        return tax, round_cents(effective)
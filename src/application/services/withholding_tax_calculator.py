@@ -0,0 +1,11 @@
+from typing import Any, Dict
+from .base_calculator import BaseTaxCalculator
+from .bracket_table import CompiledBracketTable
+
+
+class WithholdingTaxCalculator(BaseTaxCalculator):
+    """Flat-rate withholding, e.g. the non-resident variant of an income tax rule."""
+
+    def compile(self, rule: Dict[str, Any]) -> CompiledBracketTable:
+        """Compile the flat withholding rate"""
+        return CompiledBracketTable.flat(rule.get("rate", 0))
@@ -30,3 +30,4 @@ class TaxRule:
     version: str
     tax_rule: Dict[str, Any]  # JSON structure containing the actual rules
     is_active: bool
+    country_code: Optional[str] = None  # ISO 3166-1 alpha-2 jurisdiction of the rule
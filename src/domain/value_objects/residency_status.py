@@ -95,6 +95,8 @@ class ResidencyStatus:
     
     def __hash__(self) -> int:
         return hash((self.status_type, self.description, self.confidence_score))
+
+    @classmethod
     def tax_resident(cls, description: Optional[str] = None, confidence: float = 1.0) -> 'ResidencyStatus':
         """Create a tax resident status."""
         return cls(
@@ -24,6 +24,7 @@ ENV_PATH = Path(__file__).parent.parent.parent.parent / "config" / "environments
 # infrastructure/configuration/app_settings.py
 import os
 from functools import lru_cache
+from typing import Optional
 from pydantic import Field
 from pydantic_settings import BaseSettings
 
@@ -39,6 +40,85 @@ class Settings(BaseSettings):
     db_name: str = Field(default="tax_residency_db")
     db_user: str = Field(default="myuser")
     db_password: str = Field(default="mypassword")
+    db_driver: str = Field(default="psycopg2")  # psycopg: psycopg 3, which prepares hot statements server-side
+    db_prepare_threshold: int = Field(default=5)  # psycopg 3 executions before a statement is prepared
+    db_circuit_breaker_enabled: bool = Field(default=True)
+    db_circuit_failure_threshold: int = Field(default=5)  # Consecutive connection failures that open the circuit
+    db_circuit_reset_timeout_seconds: float = Field(default=10.0)  # Time open before one trial query is let through
+    db_replica_urls: str = Field(default="")  # Comma-separated SQLAlchemy URLs of read replicas
+    db_replica_max_lag_seconds: float = Field(default=5.0)  # Replicas further behind are not read from
+    db_replica_lag_check_interval_seconds: float = Field(default=5.0)
+    db_read_your_writes_seconds: float = Field(default=10.0)  # A client reads from the primary this long after creating a rule
+    db_query_metrics_enabled: bool = Field(default=True)  # Per-request query cost in Server-Timing, totals in the health check
+    db_slow_query_seconds: Optional[float] = Field(default=0.5)  # Statements at least this slow are logged; None: never
+    server_timing_detail_enabled: bool = Field(default=False)  # Per repository method Server-Timing entries; exposes internals to clients
+
+    # Tax rule settings
+    default_country_code: str = Field(default="US")
+    rule_cache_ttl_seconds: float = Field(default=60.0)
+    rule_cache_max_stale_seconds: float = Field(default=900.0)  # Expired rules served while revalidating or while the database is down
+    http_cache_max_age_seconds: int = Field(default=60)  # Cache-Control max-age for rule and calculation reads
+
+    # Batch calculation settings
+    calculation_pool_workers: Optional[int] = Field(default=None)  # None: one per CPU, 0: run inline
+    calculation_pool_threshold: int = Field(default=20000)
+
+    # Background job settings
+    job_workers: int = Field(default=2)
+    job_max_pending: int = Field(default=100)
+    job_chunk_size: int = Field(default=10000)
+    job_lease_seconds: float = Field(default=60.0)  # A running job is taken over once its worker misses heartbeats for this long
+
+    # Columnar (Arrow IPC / Parquet) batch settings; the endpoint requires pyarrow
+    columnar_max_body_bytes: int = Field(default=268435456)
+    columnar_max_rows: int = Field(default=10000000)
+
+    # Audit log settings
+    audit_enabled: bool = Field(default=True)
+    audit_buffer_rows: int = Field(default=200000)
+    audit_batch_size: int = Field(default=5000)
+    audit_flush_interval_seconds: float = Field(default=1.0)
+    audit_overflow_policy: str = Field(default="block")  # block: apply backpressure, drop: discard and count
+    audit_max_block_seconds: float = Field(default=5.0)  # A blocked calculation then fails with 503
+    audit_max_write_attempts: int = Field(default=10)  # A batch failing this many writes is discarded and counted
+    audit_partitions_ahead: int = Field(default=2)  # Monthly partitions created ahead of the current month
+
+    # Rate limit settings, per client (authenticated user, or address when anonymous)
+    rate_limit_enabled: bool = Field(default=True)
+    rate_limit_calculate_per_second: float = Field(default=50.0)
+    rate_limit_calculate_burst: int = Field(default=100)
+    rate_limit_calculate_concurrency: int = Field(default=20)
+    rate_limit_bulk_per_second: float = Field(default=0.5)  # Batch calculations, job submissions, audit exports
+    rate_limit_bulk_burst: int = Field(default=5)
+    rate_limit_bulk_concurrency: int = Field(default=2)
+    rate_limit_redis_url: Optional[str] = Field(default=None)  # Share buckets across workers; requires redis
+
+    # Load shedding settings, per worker process
+    load_shedding_enabled: bool = Field(default=True)
+    admission_initial_limit: int = Field(default=64)
+    admission_min_limit: int = Field(default=8)
+    admission_max_limit: int = Field(default=1024)
+    admission_latency_target_seconds: float = Field(default=0.25)  # Service time above which the limit backs off
+    admission_max_queue_wait_seconds: float = Field(default=0.2)  # For calculations; rule reads get a quarter, bulk none
+
+    # Response compression settings
+    compression_enabled: bool = Field(default=True)
+    compression_minimum_size: int = Field(default=1024)  # Smaller bodies are sent uncompressed
+    compression_gzip_level: int = Field(default=6)
+    compression_brotli_quality: int = Field(default=4)  # Used when the optional brotli package is installed
+
+    # Tracing settings; spans are written as OTLP/JSON lines
+    tracing_exporter: str = Field(default="none")  # none, console (stdout) or file
+    tracing_file_path: str = Field(default="traces.jsonl")
+    tracing_sample_ratio: float = Field(default=0.01)  # Share of requests without a sampled traceparent that are traced
+    tracing_service_name: str = Field(default="tax-rules-engine")
+
+    # Idempotency settings
+    idempotency_enabled: bool = Field(default=True)
+    idempotency_max_entries: int = Field(default=10000)
+    idempotency_ttl_seconds: float = Field(default=86400.0)
+    idempotency_persist: bool = Field(default=False)  # Also store responses in the idempotency_keys table
+    idempotency_max_body_bytes: int = Field(default=1048576)
 
     class Config:
         env_file = ENV_PATH
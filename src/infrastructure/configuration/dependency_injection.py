@@ -1,38 +1,203 @@
 # src/infrastructure/configuration/dependency_injection.py
+import os
+from datetime import datetime
+
 from fastapi import Depends, FastAPI, Request
 
+from src.application.services.admission_controller import AdmissionController
+from src.application.services.audit_log import AuditLog
+from src.application.services.audit_query_service import AuditQueryService
+from src.application.services.calculation_job_queue import CalculationJobQueue
+from src.application.services.idempotency_store import IdempotencyStore
+from src.application.services.calculation_pool import CalculationPool
+from src.application.services.circuit_breaker import CircuitBreaker
+from src.application.services.rate_limiter import (
+    BUCKET_BULK,
+    BUCKET_CALCULATE,
+    InMemoryRateLimitBackend,
+    RateLimiter,
+    RateLimitPolicy,
+    RedisRateLimitBackend
+)
 from src.application.services.tax_calculation_service import TaxCalculationService
+from src.application.services.tax_rule_index import TaxRuleIndex
+from src.application.services.tracing import ConsoleSpanExporter, FileSpanExporter, tracer
+from src.infrastructure.configuration.app_settings import settings
+from src.infrastructure.configuration.preload import take_preloaded_rule_index
 # from src.domain.repositories.tax_rule_repository_interface import TaxRuleRepositoryInterface
-from src.infrastructure.persistence.database.config.connection_factory import connection_factory
-from src.infrastructure.persistence.database.config.database_config import db_config
-from src.infrastructure.persistence.database.repositories.tax_rule_repository_impl import TaxRuleRepositoryImpl
 
 
 async def setup_dependencies(app: FastAPI):
     """
     Setup application dependencies (repositories, services, mappers)
     """
+    # Persistence is imported here, not at module level, so importing the app does not load SQLAlchemy and the
+    # database driver; they are loaded once, when the lifespan starts
+    from src.infrastructure.persistence.database.config.connection_factory import connection_factory
+    from src.infrastructure.persistence.database.config.database_config import db_config
+    from src.infrastructure.persistence.database.config.query_instrumentation import query_metrics
+    from src.infrastructure.persistence.database.repositories.calculation_audit_repository_impl import CalculationAuditRepositoryImpl
+    from src.infrastructure.persistence.database.repositories.calculation_job_repository_impl import CalculationJobRepositoryImpl
+    from src.infrastructure.persistence.database.repositories.idempotency_key_repository_impl import IdempotencyKeyRepositoryImpl
+    from src.infrastructure.persistence.database.repositories.tax_rule_repository_impl import TaxRuleRepositoryImpl
+
     # Initialize database tables
     db_config.create_tables()
 
+    # Spans of sampled requests, exported when each request ends
+    if settings.tracing_exporter == "console":
+        tracer.configure(ConsoleSpanExporter(service_name=settings.tracing_service_name), settings.tracing_sample_ratio)
+    elif settings.tracing_exporter == "file":
+        tracer.configure(
+            FileSpanExporter(settings.tracing_file_path, service_name=settings.tracing_service_name),
+            settings.tracing_sample_ratio
+        )
+    elif settings.tracing_exporter != "none":
+        raise ValueError(f"Unknown tracing exporter '{settings.tracing_exporter}'; use none, console or file")
+
+    # Fail fast on a sick database instead of queueing queries on it; rules are then served from the index
+    database_circuit_breaker = None
+    if settings.db_circuit_breaker_enabled:
+        database_circuit_breaker = CircuitBreaker(
+            "database",
+            failure_threshold=settings.db_circuit_failure_threshold,
+            reset_timeout_seconds=settings.db_circuit_reset_timeout_seconds
+        )
+    connection_factory.circuit_breaker = database_circuit_breaker
+
     # Repository
     tax_rule_repo = TaxRuleRepositoryImpl(connection_factory=connection_factory)
 
 
+    # In-memory index of active rules, partitioned by country; warmed in the master when preloaded
+    rule_index = take_preloaded_rule_index() or TaxRuleIndex(
+        ttl_seconds=settings.rule_cache_ttl_seconds, max_stale_seconds=settings.rule_cache_max_stale_seconds
+    )
+
+    # Process pool for large batch and scenario runs
+    pool_workers = settings.calculation_pool_workers
+    calculation_pool = CalculationPool(
+        max_workers=(os.cpu_count() or 1) if pool_workers is None else pool_workers,
+        threshold=settings.calculation_pool_threshold
+    )
+
+    # Audit storage, partitioned by month ahead of the writes
+    audit_repo = CalculationAuditRepositoryImpl(connection_factory=connection_factory)
+    audit_repo.ensure_partitions(datetime.utcnow(), settings.audit_partitions_ahead + 1)
+
+    # Audit log, written in batches by a background task
+    audit_log = None
+    if settings.audit_enabled:
+        audit_log = AuditLog(
+            audit_repository=audit_repo,
+            max_buffered_rows=settings.audit_buffer_rows,
+            batch_size=settings.audit_batch_size,
+            flush_interval_seconds=settings.audit_flush_interval_seconds,
+            overflow_policy=settings.audit_overflow_policy,
+            max_block_seconds=settings.audit_max_block_seconds,
+            max_write_attempts=settings.audit_max_write_attempts
+        )
+        audit_log.start()
+
     # Service
     tax_service = TaxCalculationService(
-        tax_rule_repository=tax_rule_repo
+        tax_rule_repository=tax_rule_repo,
+        default_country_code=settings.default_country_code,
+        rule_index=rule_index,
+        calculation_pool=calculation_pool,
+        audit_log=audit_log
+    )
+
+    # Background jobs, resumed from the jobs table
+    calculation_job_queue = CalculationJobQueue(
+        job_repository=CalculationJobRepositoryImpl(connection_factory=connection_factory),
+        tax_calculation_service=tax_service,
+        max_workers=settings.job_workers,
+        max_pending_jobs=settings.job_max_pending,
+        chunk_size=settings.job_chunk_size,
+        lease_seconds=settings.job_lease_seconds
     )
+    await calculation_job_queue.start()
+
+    # Stored responses for Idempotency-Key retries, read by IdempotencyMiddleware
+    idempotency_store = None
+    if settings.idempotency_enabled:
+        idempotency_repo = None
+        if settings.idempotency_persist:
+            idempotency_repo = IdempotencyKeyRepositoryImpl(connection_factory=connection_factory)
+            idempotency_repo.delete_expired()
+        idempotency_store = IdempotencyStore(
+            repository=idempotency_repo,
+            max_entries=settings.idempotency_max_entries,
+            ttl_seconds=settings.idempotency_ttl_seconds
+        )
+
+    # Per-client limits, with separate buckets so bulk traffic cannot starve calculations
+    rate_limiter = None
+    if settings.rate_limit_enabled:
+        rate_limit_backend = InMemoryRateLimitBackend()
+        if settings.rate_limit_redis_url:
+            rate_limit_backend = RedisRateLimitBackend(settings.rate_limit_redis_url, fallback=rate_limit_backend)
+        rate_limiter = RateLimiter(
+            policies={
+                BUCKET_CALCULATE: RateLimitPolicy(
+                    requests_per_second=settings.rate_limit_calculate_per_second,
+                    burst=settings.rate_limit_calculate_burst,
+                    max_concurrent=settings.rate_limit_calculate_concurrency
+                ),
+                BUCKET_BULK: RateLimitPolicy(
+                    requests_per_second=settings.rate_limit_bulk_per_second,
+                    burst=settings.rate_limit_bulk_burst,
+                    max_concurrent=settings.rate_limit_bulk_concurrency
+                ),
+            },
+            backend=rate_limit_backend
+        )
+
+    # Adaptive concurrency limit of this worker, applied by LoadSheddingMiddleware
+    admission_controller = None
+    if settings.load_shedding_enabled:
+        admission_controller = AdmissionController(
+            initial_limit=settings.admission_initial_limit,
+            min_limit=settings.admission_min_limit,
+            max_limit=settings.admission_max_limit,
+            latency_target_seconds=settings.admission_latency_target_seconds,
+            max_queue_wait_seconds=settings.admission_max_queue_wait_seconds
+        )
 
     # Attach to app state
     app.state.tax_rule_repository = tax_rule_repo
     app.state.tax_calculation_service = tax_service
+    app.state.calculation_pool = calculation_pool
+    app.state.calculation_job_queue = calculation_job_queue
+    app.state.audit_log = audit_log
+    app.state.audit_query_service = AuditQueryService(audit_repository=audit_repo)
+    app.state.idempotency_store = idempotency_store
+    app.state.rate_limiter = rate_limiter
+    app.state.admission_controller = admission_controller
+    app.state.database_circuit_breaker = database_circuit_breaker
+    app.state.replica_router = db_config.router if db_config.replica_urls else None
+    app.state.query_metrics = query_metrics if settings.db_query_metrics_enabled else None
 
     @app.on_event("shutdown")
     async def shutdown_event():
         db_config.drop_tables()
 
 
+async def shutdown_dependencies(app: FastAPI):
+    """
+    Release resources created by setup_dependencies; called from the lifespan
+    """
+    await app.state.calculation_job_queue.stop()
+    # After the job workers, so audit records from their last chunks are flushed too
+    if app.state.audit_log is not None:
+        await app.state.audit_log.stop()
+    app.state.calculation_pool.shutdown()
+    if app.state.rate_limiter is not None:
+        await app.state.rate_limiter.close()
+    tracer.shutdown()
+
+
 # Dependency function to get service from app.state
 def get_tax_calculation_service(request: Request) -> TaxCalculationService:
     """FastAPI dependency function to inject TaxCalculationService."""
@@ -46,3 +211,33 @@ def get_tax_calculation_controller(
     from src.presentation.api.v1.controllers.tax_calculation_controller import TaxCalculationController
     """FastAPI dependency function to inject TaxCalculationController."""
     return TaxCalculationController(service)
+
+
+# Dependency function to get the job queue from app.state
+def get_calculation_job_queue(request: Request) -> CalculationJobQueue:
+    """FastAPI dependency function to inject CalculationJobQueue."""
+    return request.app.state.calculation_job_queue
+
+
+# Dependency function to get the job controller
+def get_calculation_job_controller(
+    queue: CalculationJobQueue = Depends(get_calculation_job_queue)
+):
+    from src.presentation.api.v1.controllers.calculation_job_controller import CalculationJobController
+    """FastAPI dependency function to inject CalculationJobController."""
+    return CalculationJobController(queue)
+
+
+# Dependency function to get the audit query service from app.state
+def get_audit_query_service(request: Request) -> AuditQueryService:
+    """FastAPI dependency function to inject AuditQueryService."""
+    return request.app.state.audit_query_service
+
+
+# Dependency function to get the audit controller
+def get_audit_controller(
+    service: AuditQueryService = Depends(get_audit_query_service)
+):
+    from src.presentation.api.v1.controllers.audit_controller import AuditController
+    """FastAPI dependency function to inject AuditController."""
+    return AuditController(service)
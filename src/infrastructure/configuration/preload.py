@@ -0,0 +1,56 @@
+"""
+Preloading for forking servers (gunicorn ``--preload``).
+
+``preload_rule_index`` runs in the master before workers are forked: it loads
+and compiles every active rule once, then closes the master's database
+connections so no socket is shared with the children. Each worker adopts the
+warmed index in ``setup_dependencies``; its pages are shared copy-on-write
+until the worker refreshes entries after their TTL.
+"""
+import gc
+import logging
+from typing import Optional
+
+from src.application.services.tax_calculation_service import TaxCalculationService
+from src.application.services.tax_rule_index import TaxRuleIndex
+from src.infrastructure.configuration.app_settings import settings
+
+logger = logging.getLogger(__name__)
+
+_preloaded_rule_index: Optional[TaxRuleIndex] = None
+
+
+def preload_rule_index() -> int:
+    """Warm a rule index in this (master) process; returns the number of rules loaded."""
+    global _preloaded_rule_index
+    from src.infrastructure.persistence.database.config.connection_factory import connection_factory
+    from src.infrastructure.persistence.database.config.database_config import db_config
+    from src.infrastructure.persistence.database.repositories.tax_rule_repository_impl import TaxRuleRepositoryImpl
+
+    rule_index = TaxRuleIndex(
+        ttl_seconds=settings.rule_cache_ttl_seconds, max_stale_seconds=settings.rule_cache_max_stale_seconds
+    )
+    service = TaxCalculationService(
+        tax_rule_repository=TaxRuleRepositoryImpl(connection_factory=connection_factory),
+        default_country_code=settings.default_country_code,
+        rule_index=rule_index
+    )
+    try:
+        loaded = service.warm_rule_index()
+    except Exception as e:
+        # Workers then load rules on demand, as without preloading
+        logger.error(f"Rule preload failed: {str(e)}")
+        return 0
+    finally:
+        db_config.dispose()
+
+    _preloaded_rule_index = rule_index
+    # Keep the collector from touching (and so copying) the preloaded objects in every worker
+    gc.freeze()
+    logger.info(f"Preloaded {loaded} active rules")
+    return loaded
+
+
+def take_preloaded_rule_index() -> Optional[TaxRuleIndex]:
+    """The index warmed before the fork, if any."""
+    return _preloaded_rule_index
@@ -1,30 +1,118 @@
 from sqlalchemy.orm import Session
 from contextlib import contextmanager
+from typing import Optional
 from .database_config import db_config
+from .replica_router import database_client
 import logging
-from sqlalchemy import text
+from sqlalchemy import exc, text
+
+from src.application.services.circuit_breaker import CircuitBreaker
 
 logger = logging.getLogger(__name__)
 
+
+def is_unavailable_error(error: Exception) -> bool:
+    """Whether an error means the database could not answer (connection lost, timeout), not that a statement failed."""
+    if isinstance(error, (exc.OperationalError, exc.InterfaceError, exc.TimeoutError)):
+        return True
+    return isinstance(error, exc.DBAPIError) and error.connection_invalidated
+
+
 class ConnectionFactory:
     """Factory class for managing database connections"""
     
-    def __init__(self):
+    def __init__(self, circuit_breaker: Optional[CircuitBreaker] = None):
         self.db_config = db_config
+        # Set by setup_dependencies; sessions fail fast while it is open
+        self.circuit_breaker = circuit_breaker
     
     @contextmanager
     def get_session(self):
         """Context manager for database sessions"""
-        session: Session = self.db_config.SessionLocal()
+        with self._guarded():
+            session: Session = self.db_config.SessionLocal()
+            try:
+                yield session
+                session.commit()
+            except Exception as e:
+                logger.error(f"Database session error: {str(e)}")
+                session.rollback()
+                raise
+            finally:
+                session.close()
+
+    @contextmanager
+    def get_read_connection(self):
+        """
+        Context manager for an autocommit connection, for read-only lookups.
+
+        Each query runs as its own statement, without the BEGIN/COMMIT round
+        trips, ORM session or identity map of ``get_session``. It may be on a
+        read replica, so use it only for statements that do not write.
+        """
+        engine = self.db_config.router.engine_for_read()
+        with self._routed(engine):
+            try:
+                with engine.connect() as connection:
+                    yield connection.execution_options(isolation_level="AUTOCOMMIT")
+            except Exception as e:
+                logger.error(f"Database read error: {str(e)}")
+                raise
+
+    @contextmanager
+    def get_read_session(self):
+        """
+        Context manager for a session that may be on a read replica, for
+        read-only ORM queries such as server-side cursors; never committed.
+        """
+        engine = self.db_config.router.engine_for_read()
+        with self._routed(engine):
+            session: Session = self.db_config.SessionLocal(bind=engine)
+            try:
+                yield session
+            except Exception as e:
+                logger.error(f"Database read error: {str(e)}")
+                raise
+            finally:
+                session.close()
+
+    def record_write(self) -> None:
+        """Note a committed write, so the caller's reads, and reads that refill caches, go to the primary."""
+        self.db_config.router.record_write(database_client.get())
+
+    @contextmanager
+    def _routed(self, engine):
+        """Guard primary reads with the circuit breaker; a failing replica is skipped instead."""
+        if engine is self.db_config.router.primary:
+            with self._guarded():
+                yield
+            return
+        try:
+            yield
+        except Exception as e:
+            if is_unavailable_error(e):
+                self.db_config.router.mark_unavailable(engine)
+            raise
+
+    @contextmanager
+    def _guarded(self):
+        """Run a database call through the circuit breaker, when one is set."""
+        breaker = self.circuit_breaker
+        if breaker is None:
+            yield
+            return
+
+        breaker.before_call()
         try:
-            yield session
-            session.commit()
+            yield
         except Exception as e:
-            logger.error(f"Database session error: {str(e)}")
-            session.rollback()
+            # Statement errors (constraint violations, bad input) mean the database answered
+            if is_unavailable_error(e):
+                breaker.record_failure()
+            else:
+                breaker.record_success()
             raise
-        finally:
-            session.close()
+        breaker.record_success()
     
     def get_session_sync(self) -> Session:
         """Get synchronous database session (remember to close it)"""
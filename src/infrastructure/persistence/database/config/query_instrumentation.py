@@ -0,0 +1,141 @@
+"""
+Infrastructure: query instrumentation
+SQLAlchemy engine hooks that time every statement, attribute it to the
+repository method that issued it, and log slow ones.
+"""
+import contextvars
+import functools
+import inspect
+import logging
+import time
+from typing import Any, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from src.application.services.query_metrics import QueryMetrics, current_query_cost
+from src.application.services.tracing import tracer
+
+logger = logging.getLogger(__name__)
+
+# Repository method running in this thread, as "ClassName.method"
+current_repository_method: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar(
+    "current_repository_method", default=None
+)
+
+# Every query of the process; instrumented engines record into it
+query_metrics = QueryMetrics()
+
+_MAX_LOGGED_STATEMENT = 2000
+
+
+def instrument_engine(engine: Engine, metrics: QueryMetrics, slow_query_seconds: Optional[float]) -> None:
+    """
+    Record the duration and row count of every statement ``engine`` runs into
+    ``metrics`` and the current request's cost, and log statements slower
+    than ``slow_query_seconds`` with their parameters redacted.
+
+    Rows are what the driver reports as the cursor's row count: rows returned
+    by a buffered SELECT or changed by a write. Server-side cursors report none.
+    """
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _before(conn, cursor, statement, parameters, context, executemany):
+        if context is not None:
+            context._query_started_at = time.perf_counter()
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _after(conn, cursor, statement, parameters, context, executemany):
+        started_at = getattr(context, "_query_started_at", None)
+        if started_at is None:
+            return
+        seconds = time.perf_counter() - started_at
+        rows = max(cursor.rowcount or 0, 0)
+        method = current_repository_method.get()
+
+        metrics.add(method, rows, seconds)
+        cost = current_query_cost.get()
+        if cost is not None:
+            cost.add(method, rows, seconds)
+
+        if slow_query_seconds and seconds >= slow_query_seconds:
+            metrics.record_slow()
+            if len(statement) > _MAX_LOGGED_STATEMENT:
+                statement = statement[:_MAX_LOGGED_STATEMENT] + "..."
+            logger.warning(
+                f"Slow query ({seconds * 1000:.1f} ms, {rows} rows, {method or 'unattributed'}): "
+                f"{statement} parameters={redact_parameters(parameters, executemany)}"
+            )
+
+
+def redact_parameters(parameters: Any, executemany: bool = False) -> Any:
+    """
+    Bound parameters with every value replaced by its type name, so slow query
+    logs show the shape of a query without tax amounts or identifiers.
+    """
+    if executemany and isinstance(parameters, (list, tuple)):
+        if not parameters:
+            return []
+        return f"{len(parameters)} x {redact_parameters(parameters[0])}"
+    if isinstance(parameters, dict):
+        return {name: _redact(value) for name, value in parameters.items()}
+    if isinstance(parameters, (list, tuple)):
+        return [_redact(value) for value in parameters]
+    return _redact(parameters)
+
+
+def _redact(value: Any) -> str:
+    if value is None:
+        return "None"
+    if isinstance(value, (list, tuple)):
+        return f"<{type(value).__name__}[{len(value)}]>"
+    return f"<{type(value).__name__}>"
+
+
+def instrumented_repository(cls):
+    """
+    Class decorator attributing the queries of each public method to
+    ``ClassName.method``, and running the method in a span of that name.
+    Generator methods are attributed while each item is produced, and not traced.
+    """
+    for name, member in list(vars(cls).items()):
+        if name.startswith("_") or not inspect.isfunction(member):
+            continue
+        setattr(cls, name, _attributed(member, f"{cls.__name__}.{name}"))
+    return cls
+
+
+def _attributed(method, label: str):
+    if inspect.isgeneratorfunction(method):
+        @functools.wraps(method)
+        def generator_wrapper(*args, **kwargs):
+            items = method(*args, **kwargs)
+            try:
+                while True:
+                    # Set and reset around each step: the consumer may resume the generator in another context
+                    token = current_repository_method.set(label)
+                    try:
+                        item = next(items)
+                    except StopIteration:
+                        return
+                    finally:
+                        current_repository_method.reset(token)
+                    yield item
+            finally:
+                # Closes the session of a stream abandoned early
+                items.close()
+
+        return generator_wrapper
+
+    @functools.wraps(method)
+    def wrapper(*args, **kwargs):
+        token = current_repository_method.set(label)
+        try:
+            if not tracer.enabled:
+                return method(*args, **kwargs)
+            with tracer.start_span(label):
+                return method(*args, **kwargs)
+        finally:
+            current_repository_method.reset(token)
+
+    return wrapper
@@ -0,0 +1,159 @@
+"""
+Infrastructure: ReplicaRouter
+Sends read-only queries to read replicas that are caught up, and everything else to the primary.
+"""
+import contextvars
+import itertools
+import logging
+import threading
+import time
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Sequence
+
+if TYPE_CHECKING:
+    from sqlalchemy.engine import Engine
+
+logger = logging.getLogger(__name__)
+
+# Caller of the current request, set by the API layer; a caller who just wrote reads from the primary
+database_client: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar("database_client", default=None)
+
+# Seconds the replica is behind the primary; 0 once it has replayed all the WAL it received, so an idle replica is not lagging
+REPLICA_LAG_SQL = (
+    "SELECT CASE WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0 "
+    "ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0) END"
+)
+
+
+class _Replica:
+    __slots__ = ("engine", "lag", "checked_at")
+
+    def __init__(self, engine: "Engine"):
+        self.engine = engine
+        self.lag: Optional[float] = None  # None: not checked yet, or unreachable
+        self.checked_at: Optional[float] = None
+
+
+class ReplicaRouter:
+    """
+    Chooses the engine each read runs on.
+
+    Replicas are used round robin while their replication lag, measured every
+    ``lag_check_interval_seconds``, is at most ``max_lag_seconds``; one that
+    cannot be reached is skipped until its next check. Reads go to the primary
+    when no replica qualifies, for ``read_your_writes_seconds`` after the same
+    client wrote, and for ``max_lag_seconds`` after any write, so shared
+    caches are not refilled with rows a replica has not replayed yet.
+
+    Thread safe; repositories call it from worker threads.
+    """
+
+    def __init__(
+        self,
+        primary: "Engine",
+        replicas: Sequence["Engine"] = (),
+        max_lag_seconds: float = 5.0,
+        lag_check_interval_seconds: float = 5.0,
+        read_your_writes_seconds: float = 10.0,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Args:
+            primary: Engine of the primary, for writes and reads that must be current
+            replicas: Engines of the read replicas
+            max_lag_seconds: Lag above which a replica is not read from
+            lag_check_interval_seconds: Time between lag checks of a replica
+            read_your_writes_seconds: Time a client reads from the primary after writing
+            clock: Monotonic clock, replaceable in tests
+        """
+        self.primary = primary
+        self.max_lag_seconds = max_lag_seconds
+        self.lag_check_interval_seconds = lag_check_interval_seconds
+        self.read_your_writes_seconds = read_your_writes_seconds
+        self._clock = clock
+        self._replicas = [_Replica(engine) for engine in replicas]
+        self._round_robin = itertools.count()
+        self._lock = threading.Lock()
+        self._check_lock = threading.Lock()
+
+        self._written_at: Optional[float] = None
+        # client -> time until which its reads go to the primary
+        self._sticky_until: Dict[str, float] = {}
+
+        self.primary_reads = 0
+        self.replica_reads = 0
+
+    @property
+    def replica_engines(self) -> List["Engine"]:
+        return [replica.engine for replica in self._replicas]
+
+    def engine_for_read(self) -> "Engine":
+        if not self._replicas or self._pinned_to_primary():
+            self.primary_reads += 1
+            return self.primary
+
+        self._check_lag()
+        caught_up = [r for r in self._replicas if r.lag is not None and r.lag <= self.max_lag_seconds]
+        if not caught_up:
+            self.primary_reads += 1
+            return self.primary
+        self.replica_reads += 1
+        return caught_up[next(self._round_robin) % len(caught_up)].engine
+
+    def record_write(self, client: Optional[str] = None) -> None:
+        """Send reads to the primary for a while: this client's for read_your_writes_seconds, everyone's for max_lag_seconds."""
+        now = self._clock()
+        with self._lock:
+            self._written_at = now
+            if client is not None:
+                self._sticky_until = {c: until for c, until in self._sticky_until.items() if until > now}
+                self._sticky_until[client] = now + self.read_your_writes_seconds
+
+    def mark_unavailable(self, engine: "Engine") -> None:
+        """Skip a replica that failed a query until its next lag check."""
+        for replica in self._replicas:
+            if replica.engine is engine:
+                replica.lag = None
+                replica.checked_at = self._clock()
+
+    def stats(self) -> Dict[str, object]:
+        return {
+            "replicas": len(self._replicas),
+            "replica_lag_seconds": [replica.lag for replica in self._replicas],
+            "primary_reads": self.primary_reads,
+            "replica_reads": self.replica_reads,
+        }
+
+    def _pinned_to_primary(self) -> bool:
+        now = self._clock()
+        if self._written_at is not None and now - self._written_at < self.max_lag_seconds:
+            return True
+        client = database_client.get()
+        return client is not None and self._sticky_until.get(client, now) > now
+
+    def _check_lag(self) -> None:
+        now = self._clock()
+        due = [
+            r for r in self._replicas
+            if r.checked_at is None or now - r.checked_at >= self.lag_check_interval_seconds
+        ]
+        # One thread checks; the others route on the lag measured last time
+        if not due or not self._check_lock.acquire(blocking=False):
+            return
+        try:
+            for replica in due:
+                replica.checked_at = now
+                replica.lag = self._measure_lag(replica.engine)
+        finally:
+            self._check_lock.release()
+
+    @staticmethod
+    def _measure_lag(engine: "Engine") -> Optional[float]:
+        from sqlalchemy import text
+
+        try:
+            with engine.connect() as connection:
+                lag = connection.execute(text(REPLICA_LAG_SQL)).scalar()
+        except Exception as e:
+            logger.warning(f"Replica lag check failed, not reading from it until the next check: {e}")
+            return None
+        return float(lag or 0.0)
@@ -0,0 +1,58 @@
+"""
+Infrastructure: schema upgrades
+Brings tables created by an earlier release up to the current models.
+"""
+import logging
+from typing import Callable, List, Tuple
+
+from sqlalchemy import inspect, text
+from sqlalchemy.engine import Connection, Engine
+
+from src.infrastructure.configuration.app_settings import settings
+
+logger = logging.getLogger(__name__)
+
+
+def _add_tax_rule_country_code(connection: Connection) -> None:
+    """Rules predating jurisdictions belong to the default country."""
+    connection.execute(text("ALTER TABLE tax_rules ADD COLUMN country_code VARCHAR(2)"))
+    connection.execute(
+        text("UPDATE tax_rules SET country_code = :country WHERE country_code IS NULL"),
+        {"country": settings.default_country_code}
+    )
+    if connection.dialect.name == "postgresql":
+        connection.execute(text("ALTER TABLE tax_rules ALTER COLUMN country_code SET NOT NULL"))
+    connection.execute(text("CREATE INDEX IF NOT EXISTS ix_tax_rules_country_code ON tax_rules (country_code)"))
+    connection.execute(text(
+        "CREATE INDEX IF NOT EXISTS ix_tax_rules_country_type_active ON tax_rules (country_code, rule_type, is_active)"
+    ))
+
+
+# (table, column it adds, upgrade); an upgrade runs when its table exists without the column
+UPGRADES: List[Tuple[str, str, Callable[[Connection], None]]] = [
+    ("tax_rules", "country_code", _add_tax_rule_country_code),
+]
+
+
+def upgrade_schema(engine: Engine) -> List[str]:
+    """
+    Apply the upgrades existing tables still need, in one transaction.
+
+    ``create_all`` creates missing tables but never alters existing ones, so
+    this runs after it. Upgrades are keyed on the column they add, which makes
+    running it again a no-op. Returns the ``table.column`` names upgraded.
+    """
+    inspector = inspect(engine)
+    tables = set(inspector.get_table_names())
+    pending = [
+        (table, column, upgrade) for table, column, upgrade in UPGRADES
+        if table in tables and column not in {c["name"] for c in inspector.get_columns(table)}
+    ]
+    if not pending:
+        return []
+
+    with engine.begin() as connection:
+        for table, column, upgrade in pending:
+            logger.info(f"Upgrading schema: adding {table}.{column}")
+            upgrade(connection)
+    return [f"{table}.{column}" for table, column, _ in pending]
@@ -0,0 +1,36 @@
+from sqlalchemy import Column, String, DateTime, Integer, BigInteger, Numeric, Index, PrimaryKeyConstraint
+from .base_model import Base
+
+
+class CalculationAuditModel(Base):
+    """
+    One row per calculated amount. Rows are append-only and written in bulk,
+    so this model does not carry BaseModel's update columns and uses a 64-bit id.
+
+    On PostgreSQL the table is range-partitioned by month on ``calculated_at``
+    (partitions are created by the audit repository). Every index leads with
+    or ends in ``(calculated_at, id)``, the keyset used for pagination, so
+    date-bounded queries touch only the matching partitions and index ranges.
+    """
+    __tablename__ = "calculation_audit_log"
+    __table_args__ = (
+        # The partition key must be part of the primary key
+        PrimaryKeyConstraint("calculated_at", "id", name="pk_calculation_audit_log"),
+        Index("ix_calculation_audit_log_version_time", "rule_version", "calculated_at", "id"),
+        Index("ix_calculation_audit_log_country_type_time", "country_code", "rule_type", "calculated_at", "id"),
+        {"postgresql_partition_by": "RANGE (calculated_at)"},
+    )
+
+    id = Column(BigInteger, autoincrement=True, nullable=False)
+    calculated_at = Column(DateTime, nullable=False)  # UTC
+    operation = Column(String(30), nullable=False)  # e.g. 'calculate', 'multi_jurisdiction', 'batch'
+    rule_type = Column(String(50), nullable=False)
+    country_code = Column(String(2), nullable=False)
+    residency = Column(String(30), nullable=False)
+    days_resident = Column(Integer, nullable=True)
+    rule_version = Column(String(20), nullable=False)
+    amount = Column(Numeric(18, 2), nullable=False)
+    tax_amount = Column(Numeric(18, 2), nullable=False)
+
+    def __repr__(self):
+        return f"<CalculationAudit(id={self.id}, rule_type='{self.rule_type}', version='{self.rule_version}')>"
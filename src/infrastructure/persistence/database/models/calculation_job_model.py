@@ -0,0 +1,42 @@
+from sqlalchemy import Column, String, Text, DateTime, Integer, ForeignKey, Index, UniqueConstraint
+from sqlalchemy.dialects.postgresql import JSONB
+from .base_model import BaseModel
+
+
+class CalculationJobModel(BaseModel):
+    __tablename__ = "calculation_jobs"
+
+    job_id = Column(String(36), nullable=False, unique=True, index=True)  # Public UUID
+    status = Column(String(20), nullable=False, index=True)  # queued, running, completed, failed
+    rule_type = Column(String(50), nullable=False)
+    country_code = Column(String(2), nullable=False)
+    residency = Column(String(30), nullable=False)
+    days_resident = Column(Integer, nullable=True)
+    rule_version = Column(String(20), nullable=True)  # Pinned by the first processed chunk
+    amounts = Column(JSONB, nullable=False)
+    total_count = Column(Integer, nullable=False)
+    processed_count = Column(Integer, nullable=False, default=0)  # Resume point after a restart
+    chunk_size = Column(Integer, nullable=False)
+    error = Column(Text, nullable=True)
+    started_at = Column(DateTime, nullable=True)
+    completed_at = Column(DateTime, nullable=True)
+    lease_owner = Column(String(100), nullable=True)  # Worker running the job
+    lease_expires_at = Column(DateTime, nullable=True, index=True)  # Renewed by the owner's heartbeat; reclaimable once past
+
+    def __repr__(self):
+        return f"<CalculationJob(job_id='{self.job_id}', status='{self.status}')>"
+
+
+class CalculationJobChunkModel(BaseModel):
+    __tablename__ = "calculation_job_chunks"
+    __table_args__ = (
+        UniqueConstraint("job_id", "chunk_index", name="uq_calculation_job_chunks_job_chunk"),
+        Index("ix_calculation_job_chunks_job_chunk", "job_id", "chunk_index"),
+    )
+
+    job_id = Column(String(36), ForeignKey("calculation_jobs.job_id", ondelete="CASCADE"), nullable=False)
+    chunk_index = Column(Integer, nullable=False)
+    tax_amounts = Column(JSONB, nullable=False)
+
+    def __repr__(self):
+        return f"<CalculationJobChunk(job_id='{self.job_id}', chunk_index={self.chunk_index})>"
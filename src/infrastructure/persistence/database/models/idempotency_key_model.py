@@ -0,0 +1,17 @@
+from sqlalchemy import Column, String, DateTime, Integer, JSON, LargeBinary
+from .base_model import Base
+
+
+class IdempotencyKeyModel(Base):
+    """Stored response for an Idempotency-Key, replayed to retries until it expires."""
+    __tablename__ = "idempotency_keys"
+
+    key = Column(String(64), primary_key=True)  # SHA-256 of caller, method, path and Idempotency-Key
+    fingerprint = Column(String(64), nullable=False)  # SHA-256 of the request body and query string
+    status_code = Column(Integer, nullable=False)
+    headers = Column(JSON, nullable=False)
+    body = Column(LargeBinary, nullable=False)
+    expires_at = Column(DateTime, nullable=False, index=True)
+
+    def __repr__(self):
+        return f"<IdempotencyKey(key='{self.key}', status_code={self.status_code})>"
@@ -6,7 +6,12 @@ import uuid
 
 class TaxRuleModel(BaseModel):
     __tablename__ = "tax_rules"
+    __table_args__ = (
+        # Active-rule lookups are always keyed by (country, rule_type)
+        Index("ix_tax_rules_country_type_active", "country_code", "rule_type", "is_active"),
+    )
 
+    country_code = Column(String(2), nullable=False, index=True)  # ISO 3166-1 alpha-2, e.g. 'US'
     rule_type = Column(String(50), nullable=False, index=True)  # e.g., 'income_tax', 'sales_tax'
     version = Column(String(20), nullable=False)
     tax_date = Column(DateTime, nullable=False, index=True)  # When this rule becomes effective
@@ -16,4 +21,4 @@ class TaxRuleModel(BaseModel):
     
     
     def __repr__(self):
-        return f"<TaxRule(rule_name='{self.rule_name}', version='{self.version}', country='{self.country_code}')>"
\ No newline at end of file
+        return f"<TaxRule(rule_type='{self.rule_type}', version='{self.version}', country='{self.country_code}')>"
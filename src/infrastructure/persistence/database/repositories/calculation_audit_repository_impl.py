@@ -0,0 +1,168 @@
+import csv
+import io
+from datetime import date, datetime
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from sqlalchemy import insert, select, text, tuple_
+
+from src.application.services.audit_log import AuditEntry
+
+from ..config.query_instrumentation import instrumented_repository
+from ..models.calculation_audit_model import CalculationAuditModel
+import logging
+
+logger = logging.getLogger(__name__)
+
+AUDIT_COLUMNS = (
+    "calculated_at", "operation", "rule_type", "country_code", "residency",
+    "days_resident", "rule_version", "amount", "tax_amount"
+)
+
+
+def _month_start(value: datetime) -> date:
+    return date(value.year, value.month, 1)
+
+
+def _next_month(month: date) -> date:
+    return date(month.year + month.month // 12, month.month % 12 + 1, 1)
+
+
+@instrumented_repository
+class CalculationAuditRepositoryImpl():
+    """Bulk persistence and keyset queries for calculation audit records"""
+
+    def __init__(self, connection_factory):
+        self.connection_factory = connection_factory
+        self._partitions: Set[date] = set()  # Months known to have a partition
+
+    def insert_entries(self, entries: List[AuditEntry]) -> int:
+        """Write every row of ``entries`` in one transaction; COPY on PostgreSQL, multi-row INSERT elsewhere"""
+        created: Set[date] = set()
+        with self.connection_factory.get_session() as session:
+            connection = session.connection()
+            if connection.dialect.name == "postgresql":
+                created = self._create_partitions(session, {_month_start(e.calculated_at) for e in entries})
+                count = self._copy_rows(connection, entries)
+            else:
+                rows = [dict(zip(AUDIT_COLUMNS, row)) for row in self._rows(entries)]
+                if rows:
+                    session.execute(insert(CalculationAuditModel), rows)
+                count = len(rows)
+        # The partition DDL rolls back with a failed COPY, so months are only remembered once committed
+        self._partitions.update(created)
+        return count
+
+    def ensure_partitions(self, start: datetime, months: int) -> None:
+        """Create the monthly partitions for ``months`` months from ``start`` (PostgreSQL only)"""
+        month = _month_start(start)
+        wanted = set()
+        for _ in range(months):
+            wanted.add(month)
+            month = _next_month(month)
+
+        created: Set[date] = set()
+        with self.connection_factory.get_session() as session:
+            if session.connection().dialect.name == "postgresql":
+                created = self._create_partitions(session, wanted)
+        self._partitions.update(created)
+
+    def stream_records(
+        self,
+        start: datetime,
+        end: datetime,
+        limit: int,
+        after: Optional[Tuple[datetime, int]] = None,
+        rule_type: Optional[str] = None,
+        country_code: Optional[str] = None,
+        rule_version: Optional[str] = None,
+        min_amount: Optional[float] = None,
+        max_amount: Optional[float] = None,
+        fetch_size: int = 1000
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Yield up to ``limit`` records with ``start <= calculated_at < end`` in
+        ``(calculated_at, id)`` order, resuming after the ``after`` keyset.
+
+        Rows are fetched from a server-side cursor ``fetch_size`` at a time, so
+        memory stays flat however large the page is.
+        """
+        model = CalculationAuditModel
+        query = select(model).where(model.calculated_at >= start, model.calculated_at < end)
+        if after is not None:
+            query = query.where(tuple_(model.calculated_at, model.id) > tuple_(*after))
+        if rule_type is not None:
+            query = query.where(model.rule_type == rule_type)
+        if country_code is not None:
+            query = query.where(model.country_code == country_code)
+        if rule_version is not None:
+            query = query.where(model.rule_version == rule_version)
+        if min_amount is not None:
+            query = query.where(model.amount >= min_amount)
+        if max_amount is not None:
+            query = query.where(model.amount <= max_amount)
+        query = query.order_by(model.calculated_at, model.id).limit(limit)
+
+        # Exports are read-only, so they can run on a replica instead of competing with writes
+        with self.connection_factory.get_read_session() as session:
+            result = session.execute(query.execution_options(yield_per=fetch_size))
+            for record in result.scalars():
+                yield self._to_dict(record)
+
+    def _create_partitions(self, session, months: Iterable[date]) -> Set[date]:
+        """Create partitions for months not yet known; the caller remembers them once the session commits"""
+        table = CalculationAuditModel.__tablename__
+        created = set(months) - self._partitions
+        for month in sorted(created):
+            session.execute(text(
+                f"CREATE TABLE IF NOT EXISTS {table}_y{month.year}m{month.month:02d} "
+                f"PARTITION OF {table} FOR VALUES FROM ('{month.isoformat()}') TO ('{_next_month(month).isoformat()}')"
+            ))
+        return created
+
+    def _copy_rows(self, connection, entries: List[AuditEntry]) -> int:
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        count = 0
+        for row in self._rows(entries):
+            writer.writerow(row)
+            count += 1
+        buffer.seek(0)
+
+        table = CalculationAuditModel.__tablename__
+        statement = f"COPY {table} ({', '.join(AUDIT_COLUMNS)}) FROM STDIN WITH (FORMAT csv)"
+        cursor = connection.connection.dbapi_connection.cursor()
+        try:
+            if connection.dialect.driver == "psycopg":
+                # psycopg 3 has no copy_expert; COPY runs through a writer context instead
+                with cursor.copy(statement) as copy:
+                    copy.write(buffer.getvalue())
+            else:
+                cursor.copy_expert(statement, buffer)
+        finally:
+            cursor.close()
+        return count
+
+    @staticmethod
+    def _rows(entries: List[AuditEntry]) -> Iterator[Tuple]:
+        # Entries carry one calculation's shared context plus its amounts; rows are expanded here, off the event loop
+        for entry in entries:
+            for amount, tax_amount in zip(entry.amounts, entry.tax_amounts):
+                yield (
+                    entry.calculated_at, entry.operation, entry.rule_type, entry.country_code, entry.residency,
+                    entry.days_resident, entry.rule_version, amount, tax_amount
+                )
+
+    @staticmethod
+    def _to_dict(record: CalculationAuditModel) -> Dict[str, Any]:
+        return {
+            "id": record.id,
+            "calculated_at": record.calculated_at,
+            "operation": record.operation,
+            "rule_type": record.rule_type,
+            "country_code": record.country_code,
+            "residency": record.residency,
+            "days_resident": record.days_resident,
+            "rule_version": record.rule_version,
+            "amount": record.amount,
+            "tax_amount": record.tax_amount
+        }
@@ -0,0 +1,180 @@
+from typing import List, Optional, Dict, Any
+from datetime import datetime, timedelta
+
+from sqlalchemy import or_
+
+from ..config.query_instrumentation import instrumented_repository
+from ..models.calculation_job_model import CalculationJobModel, CalculationJobChunkModel
+import logging
+
+logger = logging.getLogger(__name__)
+
+PENDING_STATUSES = ("queued", "running")
+
+
+@instrumented_repository
+class CalculationJobRepositoryImpl():
+    """Persistence for background calculation jobs and their result chunks"""
+
+    def __init__(self, connection_factory):
+        self.connection_factory = connection_factory
+
+    def create_job(self, job_data: Dict[str, Any]) -> Dict[str, Any]:
+        with self.connection_factory.get_session() as session:
+            job = CalculationJobModel(status="queued", processed_count=0, **job_data)
+            session.add(job)
+            session.flush()
+            session.refresh(job)
+            return self._to_dict(job)
+
+    def get_job(self, job_id: str, include_amounts: bool = False) -> Optional[Dict[str, Any]]:
+        with self.connection_factory.get_session() as session:
+            job = session.query(CalculationJobModel).filter(CalculationJobModel.job_id == job_id).first()
+            if not job:
+                return None
+            return self._to_dict(job, include_amounts)
+
+    def count_pending_jobs(self) -> int:
+        with self.connection_factory.get_session() as session:
+            return session.query(CalculationJobModel).filter(
+                CalculationJobModel.status.in_(PENDING_STATUSES)
+            ).count()
+
+    def list_queued_jobs(self) -> List[str]:
+        """Ids of every queued job, oldest first"""
+        with self.connection_factory.get_session() as session:
+            rows = session.query(CalculationJobModel.job_id).filter(
+                CalculationJobModel.status == "queued"
+            ).order_by(CalculationJobModel.created_at).all()
+            return [row.job_id for row in rows]
+
+    def requeue_expired_jobs(self) -> List[str]:
+        """Put running jobs whose lease has expired back in the queue; returns their ids, oldest first"""
+        with self.connection_factory.get_session() as session:
+            rows = session.query(CalculationJobModel.job_id).filter(
+                CalculationJobModel.status == "running",
+                or_(
+                    CalculationJobModel.lease_expires_at.is_(None),
+                    CalculationJobModel.lease_expires_at < datetime.utcnow()
+                )
+            ).order_by(CalculationJobModel.created_at).with_for_update(skip_locked=True).all()
+            job_ids = [row.job_id for row in rows]
+            if job_ids:
+                session.query(CalculationJobModel).filter(CalculationJobModel.job_id.in_(job_ids)).update(
+                    {"status": "queued", "lease_owner": None, "lease_expires_at": None},
+                    synchronize_session=False
+                )
+            return job_ids
+
+    def claim_job(self, job_id: str, owner: str, lease_seconds: float) -> bool:
+        """Atomically move a queued job to running under ``owner``'s lease; False if another worker already has it"""
+        now = datetime.utcnow()
+        with self.connection_factory.get_session() as session:
+            claimed = session.query(CalculationJobModel).filter(
+                CalculationJobModel.job_id == job_id,
+                CalculationJobModel.status == "queued"
+            ).update({
+                "status": "running",
+                "started_at": now,
+                "lease_owner": owner,
+                "lease_expires_at": now + timedelta(seconds=lease_seconds)
+            }, synchronize_session=False)
+            return claimed == 1
+
+    def renew_leases(self, owner: str, lease_seconds: float) -> int:
+        """Extend the lease of every job ``owner`` is running; returns how many it still holds"""
+        with self.connection_factory.get_session() as session:
+            return session.query(CalculationJobModel).filter(
+                CalculationJobModel.status == "running",
+                CalculationJobModel.lease_owner == owner
+            ).update(
+                {"lease_expires_at": datetime.utcnow() + timedelta(seconds=lease_seconds)},
+                synchronize_session=False
+            )
+
+    def release_leases(self, owner: str) -> int:
+        """Put the jobs ``owner`` is running back in the queue without waiting for their leases to expire"""
+        with self.connection_factory.get_session() as session:
+            return session.query(CalculationJobModel).filter(
+                CalculationJobModel.status == "running",
+                CalculationJobModel.lease_owner == owner
+            ).update(
+                {"status": "queued", "lease_owner": None, "lease_expires_at": None},
+                synchronize_session=False
+            )
+
+    def save_chunk(
+        self,
+        job_id: str,
+        chunk_index: int,
+        tax_amounts: List[float],
+        processed_count: int,
+        rule_version: str,
+        owner: str
+    ) -> bool:
+        """
+        Store one chunk of results and advance the job's progress in the same
+        transaction; False, storing nothing, if ``owner`` no longer holds the job
+        """
+        with self.connection_factory.get_session() as session:
+            advanced = session.query(CalculationJobModel).filter(
+                CalculationJobModel.job_id == job_id,
+                CalculationJobModel.status == "running",
+                CalculationJobModel.lease_owner == owner
+            ).update({"processed_count": processed_count, "rule_version": rule_version}, synchronize_session=False)
+            if advanced != 1:
+                return False
+            session.add(CalculationJobChunkModel(job_id=job_id, chunk_index=chunk_index, tax_amounts=tax_amounts))
+            return True
+
+    def finish_job(self, job_id: str, status: str, owner: str, error: Optional[str] = None) -> bool:
+        """Complete or fail a job ``owner`` holds; False if its lease was lost"""
+        with self.connection_factory.get_session() as session:
+            finished = session.query(CalculationJobModel).filter(
+                CalculationJobModel.job_id == job_id,
+                CalculationJobModel.status == "running",
+                CalculationJobModel.lease_owner == owner
+            ).update({
+                "status": status,
+                "error": error,
+                "completed_at": datetime.utcnow(),
+                "lease_owner": None,
+                "lease_expires_at": None
+            }, synchronize_session=False)
+            return finished == 1
+
+    def get_results(self, job_id: str, chunk_size: int, offset: int, limit: int) -> List[float]:
+        """Tax amounts ``offset .. offset + limit`` of a job, reading only the chunks that cover them"""
+        first_chunk = offset // chunk_size
+        last_chunk = (offset + limit - 1) // chunk_size
+        with self.connection_factory.get_session() as session:
+            chunks = session.query(CalculationJobChunkModel).filter(
+                CalculationJobChunkModel.job_id == job_id,
+                CalculationJobChunkModel.chunk_index.between(first_chunk, last_chunk)
+            ).order_by(CalculationJobChunkModel.chunk_index).all()
+
+            amounts = [tax for chunk in chunks for tax in chunk.tax_amounts]
+            start = offset - first_chunk * chunk_size
+            return amounts[start:start + limit]
+
+    @staticmethod
+    def _to_dict(job: CalculationJobModel, include_amounts: bool = False) -> Dict[str, Any]:
+        result = {
+            "job_id": job.job_id,
+            "status": job.status,
+            "rule_type": job.rule_type,
+            "country_code": job.country_code,
+            "residency": job.residency,
+            "days_resident": job.days_resident,
+            "rule_version": job.rule_version,
+            "total_count": job.total_count,
+            "processed_count": job.processed_count,
+            "chunk_size": job.chunk_size,
+            "error": job.error,
+            "created_at": job.created_at,
+            "started_at": job.started_at,
+            "completed_at": job.completed_at
+        }
+        if include_amounts:
+            result["amounts"] = job.amounts
+        return result
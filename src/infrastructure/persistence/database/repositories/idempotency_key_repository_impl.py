@@ -0,0 +1,53 @@
+from datetime import datetime
+from typing import Optional
+
+from src.application.services.idempotency_store import StoredResponse
+
+from ..config.query_instrumentation import instrumented_repository
+from ..models.idempotency_key_model import IdempotencyKeyModel
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+@instrumented_repository
+class IdempotencyKeyRepositoryImpl():
+    """Persistence for stored idempotent responses"""
+
+    def __init__(self, connection_factory):
+        self.connection_factory = connection_factory
+
+    def get(self, key: str) -> Optional[StoredResponse]:
+        with self.connection_factory.get_session() as session:
+            record = session.query(IdempotencyKeyModel).filter(
+                IdempotencyKeyModel.key == key,
+                IdempotencyKeyModel.expires_at > datetime.utcnow()
+            ).first()
+            if not record:
+                return None
+
+            return StoredResponse(
+                fingerprint=record.fingerprint,
+                status_code=record.status_code,
+                headers=tuple((name.encode("latin-1"), value.encode("latin-1")) for name, value in record.headers),
+                body=record.body,
+                expires_at=(record.expires_at - datetime(1970, 1, 1)).total_seconds()
+            )
+
+    def save(self, key: str, response: StoredResponse) -> None:
+        with self.connection_factory.get_session() as session:
+            # merge: a key whose previous response expired is overwritten
+            session.merge(IdempotencyKeyModel(
+                key=key,
+                fingerprint=response.fingerprint,
+                status_code=response.status_code,
+                headers=[[name.decode("latin-1"), value.decode("latin-1")] for name, value in response.headers],
+                body=response.body,
+                expires_at=datetime.utcfromtimestamp(response.expires_at)
+            ))
+
+    def delete_expired(self) -> int:
+        with self.connection_factory.get_session() as session:
+            return session.query(IdempotencyKeyModel).filter(
+                IdempotencyKeyModel.expires_at <= datetime.utcnow()
+            ).delete(synchronize_session=False)
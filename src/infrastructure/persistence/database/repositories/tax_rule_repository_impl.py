@@ -1,16 +1,72 @@
 from typing import List, Optional, Dict, Any
 from sqlalchemy.orm import Session
-from sqlalchemy import and_, desc, asc
+from sqlalchemy import and_, desc, asc, bindparam, select
 from datetime import datetime, timezone
 
 from src.domain.repositories.tax_rule_repository_interface import TaxRuleRepositoryInterface
 
+from ..config.query_instrumentation import instrumented_repository
 from ..models.tax_rule_model import TaxRuleModel
 # from ..config.connection_factory import connection_factory
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Lookup statements are built once, so every call hits SQLAlchemy's compiled
+# cache and the driver sees identical SQL it can prepare. They select only the
+# columns the calculators read and return plain rows, not ORM objects.
+_LOOKUP_COLUMNS = (
+    TaxRuleModel.id,
+    TaxRuleModel.country_code,
+    TaxRuleModel.rule_type,
+    TaxRuleModel.version,
+    TaxRuleModel.tax_rule,
+    TaxRuleModel.is_active,
+)
+
+_ACTIVE_RULE = (
+    select(*_LOOKUP_COLUMNS)
+    .where(
+        TaxRuleModel.is_active == True,
+        TaxRuleModel.country_code == bindparam("country_code"),
+        TaxRuleModel.rule_type == bindparam("rule_type")
+    )
+    .order_by(desc(TaxRuleModel.created_at))
+    .limit(1)
+)
+
+_ACTIVE_RULES = (
+    select(*_LOOKUP_COLUMNS)
+    .where(
+        TaxRuleModel.is_active == True,
+        TaxRuleModel.rule_type == bindparam("rule_type"),
+        TaxRuleModel.country_code.in_(bindparam("country_codes", expanding=True))
+    )
+    .order_by(desc(TaxRuleModel.created_at))
+)
+
+_ALL_VERSIONS = (
+    select(
+        TaxRuleModel.id,
+        TaxRuleModel.country_code,
+        TaxRuleModel.rule_type,
+        TaxRuleModel.version,
+        TaxRuleModel.tax_date,
+        TaxRuleModel.tax_rule,
+        TaxRuleModel.is_active,
+        TaxRuleModel.created_at,
+        TaxRuleModel.updated_at
+    )
+    .order_by(desc(TaxRuleModel.created_at))
+)
+
+_ALL_ACTIVE_RULES = (
+    select(*_LOOKUP_COLUMNS)
+    .where(TaxRuleModel.is_active == True)
+    .order_by(desc(TaxRuleModel.created_at))
+)
+
+@instrumented_repository
 class TaxRuleRepositoryImpl():
     """Implementation of tax rule repository"""
     
@@ -19,8 +75,9 @@ class TaxRuleRepositoryImpl():
     
     def create_rule(self, rule_data: Dict[str, Any]) -> Dict[str, Any]:
         with self.connection_factory.get_session() as session:
-            # 1️⃣ Mark previous rules of same type as inactive
+            # 1️⃣ Mark previous rules of same type in the same country as inactive
             session.query(TaxRuleModel).filter(
+                TaxRuleModel.country_code == rule_data["country_code"],
                 TaxRuleModel.rule_type == rule_data["rule_type"],
                 TaxRuleModel.is_active == True
             ).update({"is_active": False}, synchronize_session=False)
@@ -30,54 +87,76 @@ class TaxRuleRepositoryImpl():
             session.add(rule)
             session.flush()
             session.refresh(rule)
-    
-            return {
-                "id": rule.id,
-                "rule_type": rule.rule_type,
-                "version": rule.version,
-                "tax_date": rule.tax_date,
-                "tax_rule": rule.tax_rule,
-                "is_active": rule.is_active,
-                "created_at": rule.created_at,
-                "updated_at": rule.updated_at,
-            }
-
-    def get_all_versions(self) -> List[Dict[str, Any]]:
-        """Get all versions of a rule as dictionaries"""
-        with self.connection_factory.get_session() as session:
-            rules = session.query(TaxRuleModel).order_by(desc(TaxRuleModel.created_at)).all()
-            return [
-                {
-                    "id": r.id,
-                    "rule_type": r.rule_type,
-                    "version": r.version,
-                    "tax_date": r.tax_date,
-                    "tax_rule": r.tax_rule,
-                    "is_active": r.is_active,
-                    "created_at": r.created_at,
-                    "updated_at": r.updated_at
-                }
-                for r in rules
-            ]
+            created = self._to_dict(rule)
+
+        # Committed: reads that must see the new rule now go to the primary, not a lagging replica
+        self.connection_factory.record_write()
+        return created
+
+    def get_all_versions(self, fields: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+        """
+        Get all versions of a rule as dictionaries.
+
+        With ``fields``, only those columns are selected, so large columns such
+        as ``tax_rule`` are never read or materialized when not requested.
+        """
+        with self.connection_factory.get_read_connection() as connection:
+            if fields is None:
+                return [dict(row) for row in connection.execute(_ALL_VERSIONS).mappings()]
+
+            columns = [getattr(TaxRuleModel, f) for f in fields]
+            rows = connection.execute(select(*columns).order_by(desc(TaxRuleModel.created_at)))
+            return [dict(zip(fields, row)) for row in rows]
         
-    def get_active_tax_rule(self, rule_type) -> Dict[str, Any]:
-        """Get all versions of a rule as dictionaries"""
-        with self.connection_factory.get_session() as session:
-            rule = session.query(TaxRuleModel).filter(
-                TaxRuleModel.is_active == True,
-                TaxRuleModel.rule_type == rule_type
-            ).order_by(desc(TaxRuleModel.created_at)).first()
-            if not rule:
+    def get_active_tax_rule(self, rule_type: str, country_code: str) -> Optional[Dict[str, Any]]:
+        """Get the active rule of a type for a country as a dictionary"""
+        with self.connection_factory.get_read_connection() as connection:
+            row = connection.execute(
+                _ACTIVE_RULE, {"country_code": country_code, "rule_type": rule_type}
+            ).mappings().first()
+            if row is None:
                 return None  # or raise exception if you prefer
 
-            return {
-                "id": rule.id,
-                "rule_type": rule.rule_type,
-                "version": rule.version,
-                "tax_date": rule.tax_date,
-                "tax_rule": rule.tax_rule,
-                "is_active": rule.is_active,
-                "created_at": rule.created_at,
-                "updated_at": rule.updated_at
-            }
+            return dict(row)
+
+    def get_active_tax_rules(self, rule_type: str, country_codes: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Get the active rule of a type for several countries in one query, keyed by country code"""
+        with self.connection_factory.get_read_connection() as connection:
+            rows = connection.execute(
+                _ACTIVE_RULES, {"rule_type": rule_type, "country_codes": list(country_codes)}
+            ).mappings()
+
+            # Newest first, so the first rule seen per country wins
+            result: Dict[str, Dict[str, Any]] = {}
+            for row in rows:
+                if row["country_code"] not in result:
+                    result[row["country_code"]] = dict(row)
+            return result
+
+    def get_all_active_rules(self) -> List[Dict[str, Any]]:
+        """Get the active rule of every type and country, for warming the rule index"""
+        with self.connection_factory.get_read_connection() as connection:
+            rows = connection.execute(_ALL_ACTIVE_RULES).mappings()
+
+            # Newest first, so the first rule seen per (country, type) wins
+            result: Dict[Any, Dict[str, Any]] = {}
+            for row in rows:
+                key = (row["country_code"], row["rule_type"])
+                if key not in result:
+                    result[key] = dict(row)
+            return list(result.values())
+
+    @staticmethod
+    def _to_dict(rule: TaxRuleModel) -> Dict[str, Any]:
+        return {
+            "id": rule.id,
+            "country_code": rule.country_code,
+            "rule_type": rule.rule_type,
+            "version": rule.version,
+            "tax_date": rule.tax_date,
+            "tax_rule": rule.tax_rule,
+            "is_active": rule.is_active,
+            "created_at": rule.created_at,
+            "updated_at": rule.updated_at
+        }
 
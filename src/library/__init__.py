@@ -0,0 +1,11 @@
+"""
+Embeddable tax calculation library.
+
+Computes taxes in process over NumPy arrays and pandas/Arrow columns with the
+same compiled rules as the API, for batch and analytics jobs. Needs numpy;
+pandas, pyarrow and SQLAlchemy (for ``TaxEngine.from_database``) are optional.
+Importing it loads neither FastAPI nor Pydantic.
+"""
+from .engine import TaxEngine, VectorTable
+
+__all__ = ["TaxEngine", "VectorTable"]
@@ -0,0 +1,73 @@
+"""
+Command line for the embeddable tax engine.
+
+Snapshot the active rules of a database, then calculate Arrow IPC or Parquet
+files offline; the output holds the input columns plus tax_amount,
+effective_rate and rule_version. Formats follow the file suffixes
+(.arrow/.arrows/.ipc, .parquet/.pq).
+
+Run from the repository root:
+    python -m src.library snapshot --database-url postgresql://... rules.json
+    python -m src.library calculate --rules rules.json --rule-type income_tax incomes.parquet taxes.arrow
+"""
+import argparse
+import sys
+import time
+
+from src.application.services import columnar_io
+from src.library.engine import TaxEngine
+
+
+def snapshot(args: argparse.Namespace) -> int:
+    engine = TaxEngine.from_database(args.database_url)
+    engine.write_snapshot(args.output)
+    print(f"Wrote {len(engine.rules())} rules to {args.output}", file=sys.stderr)
+    return 0
+
+
+def calculate(args: argparse.Namespace) -> int:
+    engine = TaxEngine.from_snapshot(args.rules) if args.rules else TaxEngine.from_database(args.database_url)
+    started = time.perf_counter()
+    table = columnar_io.read_table(args.input, columnar_io.format_for_path(args.input))
+    result = engine.calculate_table(
+        table, args.rule_type, args.country_code, args.residency, args.days_resident, args.amount_column
+    )
+    columnar_io.write_table(result, columnar_io.format_for_path(args.output), args.output)
+    print(f"Calculated {result.num_rows} rows in {time.perf_counter() - started:.3f}s", file=sys.stderr)
+    return 0
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m src.library", description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    snapshot_parser = commands.add_parser("snapshot", help="Write the active rules of a database to a JSON snapshot")
+    snapshot_parser.add_argument("--database-url", required=True)
+    snapshot_parser.add_argument("output")
+    snapshot_parser.set_defaults(run=snapshot)
+
+    calculate_parser = commands.add_parser("calculate", help="Calculate an Arrow IPC or Parquet file of amounts")
+    rules = calculate_parser.add_mutually_exclusive_group(required=True)
+    rules.add_argument("--rules", help="Snapshot written by the snapshot command")
+    rules.add_argument("--database-url", help="Load the active rules from this database instead")
+    calculate_parser.add_argument("--rule-type", required=True)
+    calculate_parser.add_argument("--country-code", default=None)
+    calculate_parser.add_argument("--residency", default="tax_resident")
+    calculate_parser.add_argument("--days-resident", type=int, default=None)
+    calculate_parser.add_argument("--amount-column", default="amount")
+    calculate_parser.add_argument("input")
+    calculate_parser.add_argument("output")
+    calculate_parser.set_defaults(run=calculate)
+
+    args = parser.parse_args(argv)
+    try:
+        return args.run(args)
+    except (LookupError, OSError, ValueError) as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
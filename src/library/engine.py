@@ -0,0 +1,225 @@
+"""
+Library: TaxEngine
+Vectorized tax calculation over NumPy arrays and pandas/Arrow columns.
+"""
+import json
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+try:
+    import numpy as np
+except ImportError as e:  # numpy is required by the library, not by the service
+    raise ImportError("src.library requires numpy: pip install numpy") from e
+
+from src.application.services import columnar_io
+from src.application.services.rule_compiler import CompiledTaxRule, RuleCompiler
+from src.application.services.vector_kernel import VectorTable, round_cents
+from src.domain.value_objects.residency_status import ResidencyType
+
+try:
+    import pandas as pd
+except ImportError:  # pandas is optional; Series inputs are only recognised when it is installed
+    pd = None
+
+try:
+    import pyarrow as pa
+except ImportError:  # pyarrow is optional; Arrow inputs are only recognised when it is installed
+    pa = None
+
+DAYS_IN_YEAR = 365
+SNAPSHOT_FORMAT = "tax-rules-snapshot"
+SNAPSHOT_VERSION = 1
+SNAPSHOT_FIELDS = ("id", "country_code", "rule_type", "version", "tax_rule")
+
+
+class TaxEngine:
+    """
+    In-process tax calculator for dataframe and batch jobs.
+
+    Rules are compiled with the same RuleCompiler as the API, so every
+    residency variant and proration behaves identically; tax amounts are
+    rounded to cents as the API rounds them. Columns are evaluated with NumPy
+    in one pass, without FastAPI, Pydantic or per-row objects.
+
+    Build it from a snapshot file (``from_snapshot``), a database URL
+    (``from_database``) or rule dicts (``from_rules``)::
+
+        engine = TaxEngine.from_snapshot("rules.json")
+        df["tax"] = engine.calculate(df["income"], "income_tax", country_code="GB")
+    """
+
+    def __init__(self, rules: Iterable[Dict[str, Any]], default_country_code: str = "US"):
+        """
+        Args:
+            rules: Active rule dicts with country_code, rule_type, version, tax_rule (and id)
+            default_country_code: Jurisdiction used when a call names none
+        """
+        self.default_country_code = default_country_code
+        self._compiler = RuleCompiler.default()
+        self._rules: Dict[Tuple[str, str], CompiledTaxRule] = {}
+        self._vector_tables: Dict[int, VectorTable] = {}
+        for data in rules:
+            self._rules[(data["country_code"].upper(), data["rule_type"])] = self._compiler.compile(data)
+
+    @classmethod
+    def from_rules(cls, rules: Iterable[Dict[str, Any]], default_country_code: str = "US") -> 'TaxEngine':
+        return cls(rules, default_country_code)
+
+    @classmethod
+    def from_snapshot(cls, path: str, default_country_code: str = "US") -> 'TaxEngine':
+        """Load rules written by ``write_snapshot``."""
+        with open(path, encoding="utf-8") as f:
+            snapshot = json.load(f)
+        if snapshot.get("format") != SNAPSHOT_FORMAT or snapshot.get("version") != SNAPSHOT_VERSION:
+            raise ValueError(f"{path} is not a version {SNAPSHOT_VERSION} {SNAPSHOT_FORMAT} file")
+        return cls(snapshot["rules"], default_country_code)
+
+    @classmethod
+    def from_database(cls, database_url: str, default_country_code: str = "US") -> 'TaxEngine':
+        """Load the active rule per (country, rule_type) from a tax_rules database. Requires SQLAlchemy."""
+        from sqlalchemy import create_engine, desc, select
+
+        from src.infrastructure.persistence.database.models.tax_rule_model import TaxRuleModel
+
+        columns = [getattr(TaxRuleModel, name) for name in SNAPSHOT_FIELDS]
+        engine = create_engine(database_url)
+        try:
+            with engine.connect() as connection:
+                rows = connection.execute(
+                    select(*columns).where(TaxRuleModel.is_active == True).order_by(desc(TaxRuleModel.created_at))
+                ).all()
+        finally:
+            engine.dispose()
+
+        # Newest first, so the first rule seen per (country, rule_type) wins
+        latest: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        for row in rows:
+            data = dict(zip(SNAPSHOT_FIELDS, row))
+            latest.setdefault((data["country_code"], data["rule_type"]), data)
+        return cls(latest.values(), default_country_code)
+
+    def write_snapshot(self, path: str) -> None:
+        """Write the loaded rules to a JSON snapshot for ``from_snapshot``."""
+        snapshot = {
+            "format": SNAPSHOT_FORMAT,
+            "version": SNAPSHOT_VERSION,
+            "created_at": datetime.utcnow().isoformat(),
+            "rules": [{k: rule.data.get(k) for k in SNAPSHOT_FIELDS} for rule in self._rules.values()],
+        }
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(snapshot, f)
+
+    def rules(self) -> List[Dict[str, Any]]:
+        """``{country_code, rule_type, version}`` of every loaded rule."""
+        return [
+            {"country_code": country, "rule_type": rule_type, "version": rule.version}
+            for (country, rule_type), rule in self._rules.items()
+        ]
+
+    def rule_version(self, rule_type: str, country_code: Optional[str] = None) -> str:
+        return self._rule(rule_type, country_code).version
+
+    def calculate(
+        self,
+        amounts: Any,
+        rule_type: str,
+        country_code: Optional[str] = None,
+        residency: str = ResidencyType.TAX_RESIDENT.value,
+        days_resident: Optional[int] = None
+    ) -> Any:
+        """
+        Tax per amount, rounded to cents.
+
+        ``amounts`` may be a NumPy array, a sequence, a pandas Series or an Arrow
+        array; the result has the same kind (a Series keeps its index, Arrow
+        nulls stay null). Missing values give NaN.
+
+        Raises:
+            LookupError: If no rule is loaded for the rule type and country
+            ValueError: If the rule cannot be calculated or days_resident is missing for a prorated variant
+        """
+        values = self._to_numpy(amounts)
+        tax = round_cents(self._vector_table(rule_type, country_code, residency, days_resident).tax(values))
+        return self._like(amounts, tax, "tax_amount")
+
+    def marginal_rates(
+        self,
+        amounts: Any,
+        rule_type: str,
+        country_code: Optional[str] = None,
+        residency: str = ResidencyType.TAX_RESIDENT.value,
+        days_resident: Optional[int] = None
+    ) -> Any:
+        """Decimal rate on the next unit of each amount, in the same kind as ``amounts``."""
+        values = self._to_numpy(amounts)
+        rates = self._vector_table(rule_type, country_code, residency, days_resident).marginal_rate(values)
+        return self._like(amounts, rates, "marginal_rate")
+
+    def calculate_table(
+        self,
+        table: "pa.Table",
+        rule_type: str,
+        country_code: Optional[str] = None,
+        residency: str = ResidencyType.TAX_RESIDENT.value,
+        days_resident: Optional[int] = None,
+        amount_column: str = "amount"
+    ) -> "pa.Table":
+        """
+        ``table`` with ``tax_amount``, ``effective_rate`` (percent) and
+        ``rule_version`` columns appended, as the columnar batch endpoint
+        returns it. Requires pyarrow.
+        """
+        amounts = columnar_io.amount_column(table, amount_column)
+        tax, effective = self._vector_table(rule_type, country_code, residency, days_resident).evaluate(amounts)
+        return columnar_io.with_results(table, tax, effective, self.rule_version(rule_type, country_code))
+
+    def _rule(self, rule_type: str, country_code: Optional[str]) -> CompiledTaxRule:
+        country = (country_code or self.default_country_code).upper()
+        rule = self._rules.get((country, rule_type))
+        if rule is None:
+            raise LookupError(f"No tax rule loaded for {rule_type} in {country}")
+        return rule
+
+    def _vector_table(
+        self,
+        rule_type: str,
+        country_code: Optional[str],
+        residency: str,
+        days_resident: Optional[int]
+    ) -> VectorTable:
+        rule = self._rule(rule_type, country_code)
+        if rule.compile_error:
+            raise ValueError(rule.compile_error)
+
+        variant = rule.variants[ResidencyType(residency)]
+        year_fraction = 1.0
+        if variant.prorated:
+            if days_resident is None:
+                raise ValueError(f"days_resident is required for {residency} calculations")
+            year_fraction = min(days_resident / DAYS_IN_YEAR, 1.0)
+
+        table = variant.table_for(year_fraction)
+        if year_fraction < 1.0:
+            return VectorTable.from_table(table)  # Prorated tables depend on the call; not cached
+
+        vector_table = self._vector_tables.get(id(table))
+        if vector_table is None:
+            # Keyed by identity: compiled tables live as long as the engine's rules
+            vector_table = self._vector_tables[id(table)] = VectorTable.from_table(table)
+        return vector_table
+
+    @staticmethod
+    def _to_numpy(amounts: Any) -> "np.ndarray":
+        if pa is not None and isinstance(amounts, (pa.Array, pa.ChunkedArray)):
+            amounts = amounts.to_numpy(zero_copy_only=False)
+        elif pd is not None and isinstance(amounts, pd.Series):
+            amounts = amounts.to_numpy(dtype=np.float64, na_value=np.nan)
+        return np.array(amounts, dtype=np.float64, ndmin=1)
+
+    @staticmethod
+    def _like(amounts: Any, result: "np.ndarray", name: str) -> Any:
+        if pa is not None and isinstance(amounts, (pa.Array, pa.ChunkedArray)):
+            return pa.array(result, from_pandas=True)  # NaN back to null
+        if pd is not None and isinstance(amounts, pd.Series):
+            return pd.Series(result, index=amounts.index, name=name)
+        return result
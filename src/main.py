@@ -13,14 +13,21 @@ from contextlib import asynccontextmanager
 import logging
 import time
 from typing import Dict, Any
+from src.presentation.api.v1.middlewares.compression_middleware import CompressionMiddleware
+from src.presentation.api.v1.middlewares.idempotency_middleware import IdempotencyMiddleware
+from src.presentation.api.v1.middlewares.load_shedding_middleware import LoadSheddingMiddleware
+from src.presentation.api.v1.middlewares.server_timing_middleware import ServerTimingMiddleware
+from src.presentation.api.v1.middlewares.tracing_middleware import TracingMiddleware
 from src.presentation.common.exception_handlers import business_exception_handler, generic_exception_handler, validation_exception_handler
 from src.presentation.api.v1.controllers.tax_calculation_controller import router as tax_calc_router
 from src.presentation.api.v1.controllers.health_controller import router as health_router
+from src.presentation.api.v1.controllers.calculation_job_controller import router as calculation_job_router
+from src.presentation.api.v1.controllers.audit_controller import router as audit_router
 
 from src.infrastructure.configuration.app_settings import settings
-from src.infrastructure.configuration.dependency_injection import setup_dependencies
+from src.infrastructure.configuration.dependency_injection import setup_dependencies, shutdown_dependencies
 from src.shared.exceptions.base_exceptions import ValidationException, BusinessException
-from src.presentation.api.v1.schemas.common.base_response import ErrorResponse
+from src.presentation.api.v1.schemas.common.base_response import ErrorResponse, RateLimitResponse
 
 
 logging.basicConfig(
@@ -42,6 +49,7 @@ async def lifespan(app: FastAPI):
     yield
     
     logger.info("Shutting down Tax Rules Engine...")
+    await shutdown_dependencies(app)
 
     logger.info("Tax Rules Engine shutdown complete")
 
@@ -58,6 +66,28 @@ app = FastAPI(
     lifespan=lifespan
 )
 
+# Added before CORS so it runs inside it: replayed responses get CORS headers for the retrying origin
+app.add_middleware(IdempotencyMiddleware, max_body_bytes=settings.idempotency_max_body_bytes)
+
+# Outside idempotency, so a replayed response reports its own (zero) database cost, not the original's
+if settings.db_query_metrics_enabled:
+    app.add_middleware(ServerTimingMiddleware, detailed=settings.server_timing_detail_enabled)
+
+# Outside idempotency, so stored responses are uncompressed and replays are negotiated per client
+if settings.compression_enabled:
+    app.add_middleware(
+        CompressionMiddleware,
+        minimum_size=settings.compression_minimum_size,
+        gzip_level=settings.compression_gzip_level,
+        brotli_quality=settings.compression_brotli_quality
+    )
+
+# Outermost behind CORS, so shed requests cost as little as possible and still carry CORS headers
+app.add_middleware(LoadSheddingMiddleware)
+
+# Outside load shedding, so shed requests are traced too; passes straight through unless an exporter is configured
+app.add_middleware(TracingMiddleware)
+
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],
@@ -116,11 +146,26 @@ async def http_exception_handler_wrapper(request: Request, exc: HTTPException):
         404: "NOT_FOUND",
         422: "UNPROCESSABLE_ENTITY",
         429: "RATE_LIMIT_EXCEEDED",
-        500: "INTERNAL_ERROR"
+        500: "INTERNAL_ERROR",
+        503: "SERVICE_UNAVAILABLE"
     }
     
     error_code = error_code_map.get(exc.status_code, "HTTP_ERROR")
-    
+    headers = getattr(exc, "headers", None)
+
+    if exc.status_code == status.HTTP_429_TOO_MANY_REQUESTS:
+        retry_after = (headers or {}).get("Retry-After")
+        return JSONResponse(
+            status_code=exc.status_code,
+            content=RateLimitResponse(
+                success=False,
+                message=exc.detail if isinstance(exc.detail, str) else "Rate limit exceeded",
+                details="Too many requests. Please wait before trying again.",
+                retry_after=int(retry_after) if retry_after else None
+            ).dict(),
+            headers=headers
+        )
+
     return JSONResponse(
         status_code=exc.status_code,
         content=ErrorResponse(
@@ -128,7 +173,8 @@ async def http_exception_handler_wrapper(request: Request, exc: HTTPException):
             message=exc.detail if isinstance(exc.detail, str) else "HTTP error occurred",
             error_code=error_code,
             details=str(exc.detail) if not isinstance(exc.detail, str) else None
-        ).dict()
+        ).dict(),
+        headers=headers
     )
 
 
@@ -140,6 +186,8 @@ async def generic_exception_handler_wrapper(request: Request, exc: Exception):
 
 app.include_router(health_router, prefix="/api/v1")
 app.include_router(tax_calc_router, prefix="/api/v1")
+app.include_router(calculation_job_router, prefix="/api/v1")
+app.include_router(audit_router, prefix="/api/v1")
 
 
 
@@ -0,0 +1,68 @@
+"""
+API Controller: AuditController
+Handles HTTP requests for querying the calculation audit log.
+"""
+from fastapi import APIRouter, HTTPException, Depends, Query, Request, status
+from fastapi.responses import StreamingResponse
+import logging
+
+from src.application.services.audit_query_service import AuditQueryService
+from src.application.services.rate_limiter import BUCKET_BULK
+from src.infrastructure.configuration.dependency_injection import get_audit_controller
+from src.shared.exceptions.base_exceptions import ValidationException
+
+from .tax_calculation_controller import get_current_user, hold_rate_limit_while_streaming, rate_limited
+from ..schemas.request.audit_query_request import AuditQueryRequest
+from ..schemas.common.base_response import ErrorResponse
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+# Create router
+router = APIRouter(prefix="/audit", tags=["audit"])
+
+
+class AuditController:
+
+    def __init__(self, audit_query_service: AuditQueryService):
+        self.service = audit_query_service
+
+    async def query_calculations(self, query: AuditQueryRequest) -> StreamingResponse:
+        try:
+            lines = self.service.stream_ndjson(query)
+        except ValidationException as e:
+            logger.warning(f"Validation error in audit query: {str(e)}")
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=ErrorResponse(
+                    success=False,
+                    error_code="VALIDATION_ERROR",
+                    message="Invalid request data",
+                    details=str(e)
+                ).dict()
+            )
+
+        # The iterator is synchronous; Starlette drains it in a worker thread so DB reads never block the loop
+        return StreamingResponse(lines, media_type=NDJSON_MEDIA_TYPE, headers={"Cache-Control": "no-store"})
+
+
+# GET: Stream audited calculations as NDJSON
+@router.get(
+    "/calculations",
+    response_class=StreamingResponse,
+    responses={200: {"content": {NDJSON_MEDIA_TYPE: {}}, "description": "One audit record per line, then a next_cursor line"}},
+    dependencies=[Depends(rate_limited(BUCKET_BULK))]
+)
+async def query_calculations_endpoint(
+    request: Request,
+    query: AuditQueryRequest = Query(),
+    current_user: dict = Depends(get_current_user),
+    controller: AuditController = Depends(get_audit_controller)
+):
+    """Query audited calculations by date range, rule and amount band, paginated by cursor."""
+    response = await controller.query_calculations(query)
+    # The export counts against the bulk concurrency cap until it has finished streaming
+    response.body_iterator = hold_rate_limit_while_streaming(request, response.body_iterator)
+    return response
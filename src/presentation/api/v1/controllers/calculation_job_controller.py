@@ -0,0 +1,157 @@
+"""
+API Controller: CalculationJobController
+Handles HTTP requests for background calculation jobs.
+"""
+from fastapi import APIRouter, HTTPException, Depends, Query, status
+import logging
+
+from src.application.services.calculation_job_queue import CalculationJobQueue
+from src.application.services.rate_limiter import BUCKET_BULK
+from src.infrastructure.configuration.dependency_injection import get_calculation_job_controller
+from src.domain.value_objects.residency_status import ResidencyStatus
+from src.shared.exceptions.base_exceptions import (
+    BusinessException,
+    CapacityExceededException,
+    NotFoundException,
+    ServiceUnavailableException,
+    ValidationException
+)
+
+from .tax_calculation_controller import rate_limited
+from ..schemas.request.calculation_job_request import CalculationJobRequest
+from ..schemas.response.calculation_job_response import CalculationJobResponse, CalculationJobResultsResponse
+from ..schemas.common.base_response import ErrorResponse
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+MAX_RESULTS_PAGE_SIZE = 10000
+
+# Create router
+router = APIRouter(prefix="/jobs", tags=["jobs"])
+
+
+class CalculationJobController:
+
+    def __init__(self, calculation_job_queue: CalculationJobQueue):
+        self.queue = calculation_job_queue
+
+    async def submit_job(self, job_request: CalculationJobRequest) -> CalculationJobResponse:
+        try:
+            return await self.queue.submit(
+                job_request.amounts,
+                job_request.rule_type,
+                country_code=job_request.country_code,
+                residency=ResidencyStatus(status_type=job_request.residency),
+                days_resident=job_request.days_resident
+            )
+
+        except CapacityExceededException:
+            logger.warning("Calculation job rejected: queue is full")
+            raise
+        except ValidationException as e:
+            logger.warning(f"Validation error in calculation job submission: {str(e)}")
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=ErrorResponse(
+                    success=False,
+                    error_code="VALIDATION_ERROR",
+                    message="Invalid request data",
+                    details=str(e)
+                ).dict()
+            )
+        except BusinessException as e:
+            logger.error(f"Business error in calculation job submission: {str(e)}")
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                detail=ErrorResponse(
+                    success=False,
+                    error_code="ERROR",
+                    message="failed",
+                    details=str(e)
+                ).dict()
+            )
+        except ServiceUnavailableException:
+            raise
+        except Exception as e:
+            logger.error(f"Unexpected error in calculation job submission: {str(e)}", exc_info=True)
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=ErrorResponse(
+                    success=False,
+                    error_code="INTERNAL_ERROR",
+                    message="An unexpected error occurred",
+                    details="Please contact support if the problem persists"
+                ).dict()
+            )
+
+    async def get_job(self, job_id: str) -> CalculationJobResponse:
+        try:
+            return await self.queue.get_status(job_id)
+
+        except NotFoundException:
+            raise
+        except ServiceUnavailableException:
+            raise
+        except Exception as e:
+            logger.error(f"Unexpected error while retrieving calculation job: {str(e)}", exc_info=True)
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=ErrorResponse(
+                    success=False,
+                    error_code="INTERNAL_ERROR",
+                    message="An unexpected error occurred",
+                    details="Please contact support if the problem persists"
+                ).dict()
+            )
+
+    async def get_job_results(self, job_id: str, offset: int, limit: int) -> CalculationJobResultsResponse:
+        try:
+            return await self.queue.get_results(job_id, offset, limit)
+
+        except NotFoundException:
+            raise
+        except ServiceUnavailableException:
+            raise
+        except Exception as e:
+            logger.error(f"Unexpected error while retrieving calculation job results: {str(e)}", exc_info=True)
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=ErrorResponse(
+                    success=False,
+                    error_code="INTERNAL_ERROR",
+                    message="An unexpected error occurred",
+                    details="Please contact support if the problem persists"
+                ).dict()
+            )
+
+
+# POST: Submit a background calculation job
+@router.post("/", response_model=CalculationJobResponse, status_code=status.HTTP_202_ACCEPTED,
+             dependencies=[Depends(rate_limited(BUCKET_BULK))])
+async def submit_job_endpoint(
+    request: CalculationJobRequest,
+    controller: CalculationJobController = Depends(get_calculation_job_controller)
+):
+    """Queue a large calculation run; poll the job for progress."""
+    return await controller.submit_job(request)
+
+# GET: Job status and progress
+@router.get("/{job_id}", response_model=CalculationJobResponse)
+async def get_job_endpoint(
+    job_id: str,
+    controller: CalculationJobController = Depends(get_calculation_job_controller)
+):
+    """Get the status and progress of a calculation job."""
+    return await controller.get_job(job_id)
+
+# GET: One page of a job's results
+@router.get("/{job_id}/results", response_model=CalculationJobResultsResponse)
+async def get_job_results_endpoint(
+    job_id: str,
+    offset: int = Query(0, ge=0, description="Index of the first result to return"),
+    limit: int = Query(1000, ge=1, le=MAX_RESULTS_PAGE_SIZE, description="Maximum number of results to return"),
+    controller: CalculationJobController = Depends(get_calculation_job_controller)
+):
+    """Get the results processed so far, in submission order."""
+    return await controller.get_job_results(job_id, offset, limit)
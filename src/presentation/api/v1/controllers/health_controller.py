@@ -1,6 +1,5 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
-import jwt
 
 
 router = APIRouter(prefix="/health", tags=["health"])
@@ -39,5 +38,21 @@ router = APIRouter(prefix="/health", tags=["health"])
 #         )
 
 @router.get("/", status_code=status.HTTP_200_OK)
-async def health_check():
-    return {"status": "ok", "message": "Service is running"}
+async def health_check(request: Request):
+    health = {"status": "ok", "message": "Service is running"}
+    admission_controller = getattr(request.app.state, "admission_controller", None)
+    if admission_controller is not None:
+        health["admission"] = admission_controller.stats()
+    tax_calculation_service = getattr(request.app.state, "tax_calculation_service", None)
+    if tax_calculation_service is not None:
+        health["rule_cache"] = tax_calculation_service.rule_cache_stats()
+    database_circuit_breaker = getattr(request.app.state, "database_circuit_breaker", None)
+    if database_circuit_breaker is not None:
+        health["database_circuit"] = database_circuit_breaker.stats()
+    replica_router = getattr(request.app.state, "replica_router", None)
+    if replica_router is not None:
+        health["database_replicas"] = replica_router.stats()
+    query_metrics = getattr(request.app.state, "query_metrics", None)
+    if query_metrics is not None:
+        health["database_queries"] = query_metrics.stats()
+    return health
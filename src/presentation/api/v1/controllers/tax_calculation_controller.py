@@ -2,26 +2,45 @@
 API Controller: TaxCalculationController
 Handles HTTP requests for tax calculation operations.
 """
-from fastapi import APIRouter, HTTPException, Depends, Request, status
+from fastapi import APIRouter, HTTPException, Depends, Query, Request, Response, status
 from fastapi.responses import JSONResponse
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, AsyncIterable, AsyncIterator, Callable, List, Union
+import asyncio
 import logging
 
 
 from src.presentation.api.v1.schemas.request.rule_creation_request import TaxRuleCreateRequest
-from src.presentation.api.v1.schemas.response.rule_response import TaxRuleListResponse, TaxRuleResponse
+from src.presentation.api.v1.schemas.response.rule_response import (
+    TaxRuleListResponse,
+    TaxRuleProjectionListResponse,
+    TaxRuleResponse
+)
+from src.infrastructure.configuration.app_settings import settings
 from src.infrastructure.configuration.dependency_injection import get_tax_calculation_controller
+from src.infrastructure.persistence.database.config.replica_router import database_client
+from src.application.mappers.tax_rule_mapper import TaxRuleMapper
+from src.application.services import columnar_io
+from src.application.services.rate_limiter import BUCKET_BULK, BUCKET_CALCULATE
 from src.application.services.tax_calculation_service import TaxCalculationService
-from src.shared.exceptions.base_exceptions import BusinessException, ValidationException
+from src.application.services.tracing import traced
+from src.domain.value_objects.residency_status import ResidencyStatus, ResidencyType
+from src.shared.exceptions.base_exceptions import BusinessException, ServiceUnavailableException, ValidationException
+from src.presentation.common.http_caching import etag_matches, not_modified_response, set_cache_headers
 
 from ..schemas.request.tax_calculation_request import TaxCalculationRequest
+from ..schemas.request.multi_jurisdiction_request import MultiJurisdictionCalculationRequest
+from ..schemas.request.batch_calculation_request import BatchCalculationRequest
+from ..schemas.request.inverse_calculation_request import InverseCalculationRequest
+from ..schemas.response.batch_calculation_response import BatchCalculationResponse
+from ..schemas.request.scenario_request import TaxScenarioRequest
+from ..schemas.response.inverse_calculation_response import InverseCalculationResponse
+from ..schemas.response.scenario_response import TaxScenarioResponse
 from ..schemas.response.tax_calculation_response import (
-    TaxCalculationResponse
+    TaxCalculationResponse,
+    MultiJurisdictionCalculationResponse
 )
 from ..schemas.common.base_response import BaseResponse, ErrorResponse
-from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
-import jwt
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -37,6 +56,8 @@ async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(s
     Validate JWT token and return user information.
     Only used for endpoints that need authentication.
     """
+    import jwt  # Imported on the first authenticated request, not at startup
+
     try:
         token = credentials.credentials
         # payload = jwt.decode(token, JWT_SECRET_KEY, algorithms=[JWT_ALGORITHM])
@@ -58,8 +79,76 @@ async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(s
             headers={"WWW-Authenticate": "Bearer"},
         )
 
+optional_security = HTTPBearer(auto_error=False)
+
+async def get_rate_limit_client(
+    request: Request,
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(optional_security)
+) -> str:
+    """Identify the caller for rate limiting: the authenticated user, or the client address when anonymous."""
+    if credentials is not None:
+        current_user = await get_current_user(credentials)
+        return f"user:{current_user['user_id']}"
+    return f"ip:{request.client.host if request.client else 'unknown'}"
+
+def rate_limited(bucket: str):
+    """
+    Dependency enforcing the ``bucket`` rate and concurrency limits of the
+    caller, with the limiter from ``app.state.rate_limiter``. The concurrency
+    slot is held until the endpoint returns, or until its streamed body is
+    sent when the endpoint hands it to ``hold_rate_limit_while_streaming``.
+    """
+    async def enforce_rate_limit(request: Request, client_id: str = Depends(get_rate_limit_client)):
+        rate_limiter = getattr(request.app.state, "rate_limiter", None)
+        if rate_limiter is None or not await rate_limiter.acquire(client_id, bucket):
+            yield
+            return
+
+        released = False
+
+        def release() -> None:
+            nonlocal released
+            if not released:
+                released = True
+                rate_limiter.release(client_id, bucket)
+
+        request.state.release_rate_limit = release
+        try:
+            yield
+        except BaseException:
+            release()
+            raise
+        # A streamed body outlives the endpoint; it gives the slot back once sent
+        if not getattr(request.state, "rate_limit_streaming", False):
+            release()
+
+    return enforce_rate_limit
+
+def hold_rate_limit_while_streaming(request: Request, body: AsyncIterable) -> AsyncIterable:
+    """
+    Keep the request's concurrency slot until ``body`` has been sent, failed
+    or been abandoned by the client, instead of releasing it when the
+    endpoint returns and before the body streams.
+    """
+    release = getattr(request.state, "release_rate_limit", None)
+    if release is None:
+        return body
+    request.state.rate_limit_streaming = True
+    return _released_after(body, release)
+
+async def _released_after(body: AsyncIterable, release: Callable[[], None]) -> AsyncIterator:
+    try:
+        async for chunk in body:
+            yield chunk
+    finally:
+        release()
+
+async def bind_database_client(client_id: str = Depends(get_rate_limit_client)) -> None:
+    """Tag the request's database reads with the caller, so they see the rules the caller created."""
+    database_client.set(client_id)
+
 # Create router
-router = APIRouter(prefix="/tax-rules", tags=["tax-rules"])
+router = APIRouter(prefix="/tax-rules", tags=["tax-rules"], dependencies=[Depends(bind_database_client)])
 
 
 class TaxCalculationController:
@@ -67,10 +156,15 @@ class TaxCalculationController:
     def __init__(self, tax_calculation_service: TaxCalculationService):
         self.service = tax_calculation_service
 
+    @traced("TaxCalculationController.calculate_tax")
     async def calculate_tax(
         self,
         rule_type: str,
-        amount: float
+        amount: float,
+        country_code: Optional[str] = None,
+        residency: Optional[ResidencyType] = None,
+        days_resident: Optional[int] = None,
+        include_breakdown: bool = False
     ) -> TaxCalculationResponse:
         try:
             calculation_request=  TaxCalculationRequest(
@@ -79,7 +173,14 @@ class TaxCalculationController:
             )
             
             # Calculate tax using the rule
-            return  await self.service.calculate_tax(calculation_request.amount, calculation_request.rule_type)
+            return  await self.service.calculate_tax(
+                calculation_request.amount,
+                calculation_request.rule_type,
+                country_code=country_code,
+                residency=ResidencyStatus(status_type=residency) if residency else None,
+                days_resident=days_resident,
+                include_breakdown=include_breakdown
+            )
 
         except ValidationException as e:
             logger.warning(f"Validation error in tax calculation: {str(e)}")
@@ -103,6 +204,8 @@ class TaxCalculationController:
                     details=str(e)
                 ).dict()
             )
+        except ServiceUnavailableException:
+            raise
         except Exception as e:
             logger.error(f"Unexpected error in tax calculation: {str(e)}", exc_info=True)
             raise HTTPException(
@@ -116,6 +219,289 @@ class TaxCalculationController:
             )
     
 
+    async def calculate_tax_multi_jurisdiction(
+        self,
+        calculation_request: MultiJurisdictionCalculationRequest
+    ) -> MultiJurisdictionCalculationResponse:
+        try:
+            results = await self.service.calculate_tax_multi_jurisdiction(
+                calculation_request.amount,
+                calculation_request.rule_type,
+                calculation_request.country_codes,
+                residency=ResidencyStatus(status_type=calculation_request.residency),
+                days_resident=calculation_request.days_resident,
+                include_breakdown=calculation_request.include_breakdown
+            )
+
+            return MultiJurisdictionCalculationResponse(
+                success=True,
+                message="",
+                income=calculation_request.amount,
+                rule_type=calculation_request.rule_type,
+                total_tax_amount=round(sum(r.tax_amount for r in results), 2),
+                results=results
+            )
+
+        except ValidationException as e:
+            logger.warning(f"Validation error in tax calculation: {str(e)}")
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=ErrorResponse(
+                    success=False,
+                    error_code="VALIDATION_ERROR",
+                    message="Invalid request data",
+                    details=str(e)
+                ).dict()
+            )
+        except BusinessException as e:
+            logger.error(f"Business error in tax calculation: {str(e)}")
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                detail=ErrorResponse(
+                    success=False,
+                    error_code="ERROR",
+                    message="failed",
+                    details=str(e)
+                ).dict()
+            )
+        except ServiceUnavailableException:
+            raise
+        except Exception as e:
+            logger.error(f"Unexpected error in tax calculation: {str(e)}", exc_info=True)
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=ErrorResponse(
+                    success=False,
+                    error_code="INTERNAL_ERROR",
+                    message="An unexpected error occurred",
+                    details="Please contact support if the problem persists"
+                ).dict()
+            )
+
+    async def calculate_batch(
+        self,
+        rule_type: str,
+        batch_request: BatchCalculationRequest
+    ) -> BatchCalculationResponse:
+        try:
+            return await self.service.calculate_batch(
+                batch_request.amounts,
+                rule_type.lower(),
+                country_code=batch_request.country_code,
+                residency=ResidencyStatus(status_type=batch_request.residency),
+                days_resident=batch_request.days_resident
+            )
+
+        except ValidationException as e:
+            logger.warning(f"Validation error in batch tax calculation: {str(e)}")
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=ErrorResponse(
+                    success=False,
+                    error_code="VALIDATION_ERROR",
+                    message="Invalid request data",
+                    details=str(e)
+                ).dict()
+            )
+        except BusinessException as e:
+            logger.error(f"Business error in batch tax calculation: {str(e)}")
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                detail=ErrorResponse(
+                    success=False,
+                    error_code="ERROR",
+                    message="failed",
+                    details=str(e)
+                ).dict()
+            )
+        except ServiceUnavailableException:
+            raise
+        except Exception as e:
+            logger.error(f"Unexpected error in batch tax calculation: {str(e)}", exc_info=True)
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=ErrorResponse(
+                    success=False,
+                    error_code="INTERNAL_ERROR",
+                    message="An unexpected error occurred",
+                    details="Please contact support if the problem persists"
+                ).dict()
+            )
+
+    async def calculate_batch_columnar(
+        self,
+        rule_type: str,
+        body: bytearray,
+        input_format: str,
+        output_format: str,
+        amount_column: str = "amount",
+        country_code: Optional[str] = None,
+        residency: ResidencyType = ResidencyType.TAX_RESIDENT,
+        days_resident: Optional[int] = None
+    ) -> Response:
+        """Calculate an Arrow or Parquet table and return it with tax_amount, effective_rate and rule_version appended."""
+        try:
+            try:
+                # Decoding and encoding release the GIL; keep them off the event loop
+                table = await asyncio.to_thread(columnar_io.read_table, body, input_format)
+                amounts = columnar_io.amount_column(table, amount_column)
+            except ValueError as e:
+                raise ValidationException(str(e))
+            if table.num_rows > settings.columnar_max_rows:
+                raise ValidationException(f"At most {settings.columnar_max_rows} rows are allowed per request")
+
+            result = await self.service.calculate_columns(
+                amounts,
+                rule_type.lower(),
+                country_code=country_code,
+                residency=ResidencyStatus(status_type=residency),
+                days_resident=days_resident
+            )
+            table = columnar_io.with_results(
+                table, result["tax_amount"], result["effective_rate"], result["rule_version"]
+            )
+            content = await asyncio.to_thread(columnar_io.write_table, table, output_format)
+            headers = {"Cache-Control": "no-store", "X-Rule-Version": result["rule_version"]}
+            if result["rule_stale_seconds"] is not None:
+                headers["X-Rule-Stale-Seconds"] = str(result["rule_stale_seconds"])
+            return Response(content=content, media_type=columnar_io.MEDIA_TYPES[output_format], headers=headers)
+
+        except ValidationException as e:
+            logger.warning(f"Validation error in columnar tax calculation: {str(e)}")
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=ErrorResponse(
+                    success=False,
+                    error_code="VALIDATION_ERROR",
+                    message="Invalid request data",
+                    details=str(e)
+                ).dict()
+            )
+        except BusinessException as e:
+            logger.error(f"Business error in columnar tax calculation: {str(e)}")
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                detail=ErrorResponse(
+                    success=False,
+                    error_code="ERROR",
+                    message="failed",
+                    details=str(e)
+                ).dict()
+            )
+        except ServiceUnavailableException:
+            raise
+        except Exception as e:
+            logger.error(f"Unexpected error in columnar tax calculation: {str(e)}", exc_info=True)
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=ErrorResponse(
+                    success=False,
+                    error_code="INTERNAL_ERROR",
+                    message="An unexpected error occurred",
+                    details="Please contact support if the problem persists"
+                ).dict()
+            )
+
+    async def calculate_scenarios(
+        self,
+        rule_type: str,
+        scenario_request: TaxScenarioRequest
+    ) -> TaxScenarioResponse:
+        try:
+            return await self.service.calculate_scenarios(
+                scenario_request.amounts(),
+                rule_type.lower(),
+                country_code=scenario_request.country_code,
+                residency=ResidencyStatus(status_type=scenario_request.residency),
+                days_resident=scenario_request.days_resident
+            )
+
+        except ValidationException as e:
+            logger.warning(f"Validation error in tax scenario calculation: {str(e)}")
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=ErrorResponse(
+                    success=False,
+                    error_code="VALIDATION_ERROR",
+                    message="Invalid request data",
+                    details=str(e)
+                ).dict()
+            )
+        except BusinessException as e:
+            logger.error(f"Business error in tax scenario calculation: {str(e)}")
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                detail=ErrorResponse(
+                    success=False,
+                    error_code="ERROR",
+                    message="failed",
+                    details=str(e)
+                ).dict()
+            )
+        except ServiceUnavailableException:
+            raise
+        except Exception as e:
+            logger.error(f"Unexpected error in tax scenario calculation: {str(e)}", exc_info=True)
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=ErrorResponse(
+                    success=False,
+                    error_code="INTERNAL_ERROR",
+                    message="An unexpected error occurred",
+                    details="Please contact support if the problem persists"
+                ).dict()
+            )
+
+    async def calculate_gross_from_net(
+        self,
+        rule_type: str,
+        inverse_request: InverseCalculationRequest
+    ) -> InverseCalculationResponse:
+        try:
+            return await self.service.calculate_gross_from_net(
+                inverse_request.net_amounts,
+                rule_type.lower(),
+                country_code=inverse_request.country_code,
+                residency=ResidencyStatus(status_type=inverse_request.residency),
+                days_resident=inverse_request.days_resident
+            )
+
+        except ValidationException as e:
+            logger.warning(f"Validation error in inverse tax calculation: {str(e)}")
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=ErrorResponse(
+                    success=False,
+                    error_code="VALIDATION_ERROR",
+                    message="Invalid request data",
+                    details=str(e)
+                ).dict()
+            )
+        except BusinessException as e:
+            logger.error(f"Business error in inverse tax calculation: {str(e)}")
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                detail=ErrorResponse(
+                    success=False,
+                    error_code="ERROR",
+                    message="failed",
+                    details=str(e)
+                ).dict()
+            )
+        except ServiceUnavailableException:
+            raise
+        except Exception as e:
+            logger.error(f"Unexpected error in inverse tax calculation: {str(e)}", exc_info=True)
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=ErrorResponse(
+                    success=False,
+                    error_code="INTERNAL_ERROR",
+                    message="An unexpected error occurred",
+                    details="Please contact support if the problem persists"
+                ).dict()
+            )
+
     async def create_tax_rule(self, rule_request: TaxRuleCreateRequest, user_id: str) -> TaxRuleResponse:
         try:
             
@@ -128,18 +514,13 @@ class TaxCalculationController:
                 tax_date=rule_request.tax_date,
                 tax_rule=rule_request.tax_rule,
                 is_active=rule_request.is_active,
-                created_by=user_id
+                created_by=user_id,
+                country_code=rule_request.country_code
             )
 
             logger.info(f"Tax rule {new_rule.id} created successfully")
 
-            return TaxRuleResponse(
-                id=new_rule.id,
-                rule_type=new_rule.rule_type,
-                version=new_rule.version,
-                is_active=new_rule.is_active,
-                tax_rule=new_rule.tax_rule
-            )
+            return TaxRuleMapper.to_tax_rule_response(new_rule)
 
         except ValidationException as e:
             logger.warning(f"Validation error in tax calculation: {str(e)}")
@@ -163,6 +544,8 @@ class TaxCalculationController:
                     details=str(e)
                 ).dict()
             )
+        except ServiceUnavailableException:
+            raise
         except Exception as e:
             logger.error(f"Unexpected error in tax calculation: {str(e)}", exc_info=True)
             raise HTTPException(
@@ -175,6 +558,23 @@ class TaxCalculationController:
                 ).dict()
             )
     
+    async def get_active_rule_etag(self, rule_type: str, country_code: Optional[str] = None) -> Optional[str]:
+        """ETag for reads of the active rule; None when it cannot be determined (the read then reports why)."""
+        try:
+            return await self.service.get_active_rule_etag(rule_type.lower(), country_code)
+        except ServiceUnavailableException:
+            raise
+        except Exception as e:
+            logger.debug(f"No ETag for active {rule_type} rule: {str(e)}")
+            return None
+
+    def get_rules_catalog_etag(self, fields: Optional[List[str]] = None) -> Optional[str]:
+        etag = self.service.get_rules_catalog_etag()
+        if etag is None or not fields:
+            return etag
+        # Each projection is a different representation of the catalog, so it needs its own validator
+        return f'{etag[:-1]}-{"+".join(fields)}"'
+
     async def get_all_tax_rules(
         self
     ) -> TaxRuleListResponse:
@@ -184,16 +584,7 @@ class TaxCalculationController:
             return TaxRuleListResponse(
                 success=True,
                 message="",
-                rules=[
-                TaxRuleResponse(
-                        id=r.id,
-                        rule_type=r.rule_type,
-                        version=r.version,
-                        is_active=r.is_active,
-                        tax_rule=r.tax_rule
-                    )
-                    for r in rules
-                ]
+                rules=[TaxRuleMapper.to_tax_rule_response(r) for r in rules]
             )
             
         except BusinessException as e:
@@ -207,6 +598,8 @@ class TaxCalculationController:
                     details=str(e)
                 ).dict()
             )
+        except ServiceUnavailableException:
+            raise
         except Exception as e:
             logger.error(f"Unexpected error retrieving history: {str(e)}", exc_info=True)
             raise HTTPException(
@@ -218,21 +611,66 @@ class TaxCalculationController:
                 ).dict()
             )
     
+    async def get_tax_rules_projection(self, fields: List[str]) -> TaxRuleProjectionListResponse:
+        try:
+            rules = await self.service.get_available_rules_projection(fields)
+            return TaxRuleProjectionListResponse(success=True, message="", rules=rules)
+
+        except ValidationException as e:
+            logger.warning(f"Validation error listing rules: {str(e)}")
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=ErrorResponse(
+                    success=False,
+                    error_code="VALIDATION_ERROR",
+                    message=str(e),
+                    details=getattr(e, 'details', None)
+                ).dict()
+            )
+        except BusinessException as e:
+            logger.error(f"Error listing rules: {str(e)}")
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                detail=ErrorResponse(
+                    success=False,
+                    error_code="HISTORY_ERROR",
+                    message="Failed to retrieve tax rules",
+                    details=str(e)
+                ).dict()
+            )
+        except ServiceUnavailableException:
+            raise
+        except Exception as e:
+            logger.error(f"Unexpected error listing rules: {str(e)}", exc_info=True)
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=ErrorResponse(
+                    success=False,
+                    error_code="INTERNAL_ERROR",
+                    message="An unexpected error occurred"
+                ).dict()
+            )
+
     async def get_active_tax_rule(
-        self, rule_type
+        self, rule_type, country_code: Optional[str] = None
     ) -> TaxRuleResponse:
         try:
             
-            rule = await self.service.get_active_tax_rule(rule_type)
+            rule = await self.service.get_active_tax_rule(rule_type, country_code)
       
-            return TaxRuleResponse(
-                        id=rule.id,
-                        rule_type=rule.rule_type,
-                        version=rule.version,
-                        is_active=rule.is_active,
-                        tax_rule=rule.tax_rule
-                    )
+            return TaxRuleMapper.to_tax_rule_response(rule)
             
+        except ValidationException as e:
+            logger.warning(f"Validation error retrieving active rule: {str(e)}")
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=ErrorResponse(
+                    success=False,
+                    error_code="VALIDATION_ERROR",
+                    message="Invalid request data",
+                    details=str(e)
+                ).dict()
+            )
         except BusinessException as e:
             logger.error(f"Error retrieving calculation history: {str(e)}")
             raise HTTPException(
@@ -244,6 +682,8 @@ class TaxCalculationController:
                     details=str(e)
                 ).dict()
             )
+        except ServiceUnavailableException:
+            raise
         except Exception as e:
             logger.error(f"Unexpected error retrieving history: {str(e)}", exc_info=True)
             raise HTTPException(
@@ -257,14 +697,121 @@ class TaxCalculationController:
 
 
 # Register routes
-@router.get("/calculate/{rule_type}/{amount}", response_model=TaxCalculationResponse)
+@router.get("/calculate/{rule_type}/{amount}", response_model=TaxCalculationResponse,
+             dependencies=[Depends(rate_limited(BUCKET_CALCULATE))])
 async def calculate_tax_endpoint(
     rule_type: str,
     amount: float,
+    request: Request,
+    response: Response,
+    country_code: Optional[str] = Query(None, description="ISO 3166-1 alpha-2 jurisdiction (defaults to the service default)"),
+    residency: ResidencyType = Query(ResidencyType.TAX_RESIDENT, description="Tax residency status of the taxpayer"),
+    days_resident: Optional[int] = Query(None, ge=1, le=366, description="Days of residency in the tax year, for prorated variants"),
+    include_breakdown: bool = Query(False, description="Include the per-bracket breakdown in the response"),
     controller: TaxCalculationController = Depends(get_tax_calculation_controller)
 ):
-    
-    return await controller.calculate_tax(rule_type, amount)
+    """Calculate tax for one amount; revalidate with If-None-Match to get 304 while the rule is unchanged."""
+    etag = await controller.get_active_rule_etag(rule_type, country_code)
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return not_modified_response(etag)
+
+    result = await controller.calculate_tax(rule_type, amount, country_code, residency, days_resident, include_breakdown)
+    set_cache_headers(response, etag)
+    return result
+
+# POST: Calculate the same amount in several jurisdictions
+@router.post("/calculate/multi-jurisdiction", response_model=MultiJurisdictionCalculationResponse,
+             dependencies=[Depends(rate_limited(BUCKET_CALCULATE))])
+async def calculate_tax_multi_jurisdiction_endpoint(
+    request: MultiJurisdictionCalculationRequest,
+    controller: TaxCalculationController = Depends(get_tax_calculation_controller)
+):
+    """Calculate tax for one amount in several jurisdictions."""
+    return await controller.calculate_tax_multi_jurisdiction(request)
+
+# POST: Calculate many amounts against the active rule
+@router.post("/calculate/{rule_type}/batch", response_model=BatchCalculationResponse,
+             dependencies=[Depends(rate_limited(BUCKET_BULK))])
+async def calculate_batch_endpoint(
+    rule_type: str,
+    request: BatchCalculationRequest,
+    controller: TaxCalculationController = Depends(get_tax_calculation_controller)
+):
+    """Calculate tax for many amounts in one call; large batches run on the process pool."""
+    return await controller.calculate_batch(rule_type, request)
+
+# POST: Calculate an Arrow IPC stream or Parquet file of amounts against the active rule
+@router.post("/calculate/{rule_type}/batch/columnar", response_class=Response,
+             dependencies=[Depends(rate_limited(BUCKET_BULK))],
+             responses={200: {"content": {media_type: {} for media_type in columnar_io.MEDIA_TYPES.values()},
+                              "description": "The input table with tax_amount, effective_rate and rule_version appended"}})
+async def calculate_batch_columnar_endpoint(
+    rule_type: str,
+    request: Request,
+    amount_column: str = Query("amount", description="Column holding the amounts"),
+    country_code: Optional[str] = Query(None, description="ISO 3166-1 alpha-2 jurisdiction (defaults to the service default)"),
+    residency: ResidencyType = Query(ResidencyType.TAX_RESIDENT, description="Tax residency status applied to every amount"),
+    days_resident: Optional[int] = Query(None, ge=1, le=366, description="Days of residency in the tax year, for prorated variants"),
+    controller: TaxCalculationController = Depends(get_tax_calculation_controller)
+):
+    """
+    Calculate tax for a column of amounts sent as an Arrow IPC stream
+    (application/vnd.apache.arrow.stream) or a Parquet file
+    (application/vnd.apache.parquet). The response uses the format named in
+    Accept, or the request's format.
+    """
+    input_format = columnar_io.format_for_media_type(request.headers.get("content-type"))
+    if input_format is None or not columnar_io.COLUMNAR_AVAILABLE:
+        raise HTTPException(
+            status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+            detail=ErrorResponse(
+                success=False,
+                error_code="UNSUPPORTED_MEDIA_TYPE",
+                message="Send an Arrow IPC stream or a Parquet file",
+                details=None if columnar_io.COLUMNAR_AVAILABLE else "Columnar payloads are not enabled on this server"
+            ).dict()
+        )
+
+    body = bytearray()
+    async for chunk in request.stream():
+        body += chunk
+        if len(body) > settings.columnar_max_body_bytes:
+            raise HTTPException(
+                status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                detail=ErrorResponse(
+                    success=False,
+                    error_code="PAYLOAD_TOO_LARGE",
+                    message=f"Payloads are limited to {settings.columnar_max_body_bytes} bytes"
+                ).dict()
+            )
+
+    output_format = columnar_io.format_for_media_type(request.headers.get("accept")) or input_format
+    return await controller.calculate_batch_columnar(
+        rule_type, body, input_format, output_format,
+        amount_column, country_code, residency, days_resident
+    )
+
+# POST: Evaluate what-if amounts against the active rule
+@router.post("/calculate/{rule_type}/scenarios", response_model=TaxScenarioResponse,
+             dependencies=[Depends(rate_limited(BUCKET_CALCULATE))])
+async def calculate_scenarios_endpoint(
+    rule_type: str,
+    request: TaxScenarioRequest,
+    controller: TaxCalculationController = Depends(get_tax_calculation_controller)
+):
+    """Return tax, marginal and effective rates for many amounts in one call."""
+    return await controller.calculate_scenarios(rule_type, request)
+
+# POST: Solve gross amounts for target net amounts
+@router.post("/calculate/{rule_type}/inverse", response_model=InverseCalculationResponse,
+             dependencies=[Depends(rate_limited(BUCKET_CALCULATE))])
+async def calculate_gross_from_net_endpoint(
+    rule_type: str,
+    request: InverseCalculationRequest,
+    controller: TaxCalculationController = Depends(get_tax_calculation_controller)
+):
+    """Return the gross amount that leaves each target net amount after tax."""
+    return await controller.calculate_gross_from_net(rule_type, request)
 
 # POST: Create a new tax rule
 @router.post("/", response_model=TaxRuleResponse)
@@ -278,19 +825,44 @@ async def create_tax_rule_endpoint(
     return await controller.create_tax_rule(request, user_id)
 
 # GET: Get all tax rules
-@router.get("/", response_model=TaxRuleListResponse)
+@router.get("/", response_model=Union[TaxRuleListResponse, TaxRuleProjectionListResponse])
 async def get_all_tax_rules_endpoint(
+    request: Request,
+    response: Response,
+    fields: Optional[str] = Query(
+        None,
+        description="Comma-separated rule fields to return, e.g. id,country_code,version; omit tax_rule for lean listings"
+    ),
     controller: TaxCalculationController = Depends(get_tax_calculation_controller)
 ):
-    """Get all tax rules."""
-    return await controller.get_all_tax_rules()
+    """Get all tax rules, optionally projected to a subset of fields."""
+    field_list = [f.strip() for f in fields.split(",") if f.strip()] if fields else None
+    etag = controller.get_rules_catalog_etag(field_list)
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return not_modified_response(etag)
+
+    if field_list:
+        result = await controller.get_tax_rules_projection(field_list)
+    else:
+        result = await controller.get_all_tax_rules()
+    set_cache_headers(response, controller.get_rules_catalog_etag(field_list))
+    return result
 
 # GET: Get all active tax rules
 @router.get("/{rule_type}/active", response_model=TaxRuleResponse)
 async def get_active_tax_rules_endpoint(
     rule_type: str,
+    request: Request,
+    response: Response,
+    country_code: Optional[str] = Query(None, description="ISO 3166-1 alpha-2 jurisdiction (defaults to the service default)"),
     controller: TaxCalculationController = Depends(get_tax_calculation_controller)
 ):
-    """Get the latest active tax rule for the given rule_type."""
-    return await controller.get_active_tax_rule(rule_type)
+    """Get the latest active tax rule for the given rule_type and country."""
+    etag = await controller.get_active_rule_etag(rule_type, country_code)
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return not_modified_response(etag)
+
+    result = await controller.get_active_tax_rule(rule_type, country_code)
+    set_cache_headers(response, etag)
+    return result
 
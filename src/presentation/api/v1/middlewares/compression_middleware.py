@@ -0,0 +1,171 @@
+"""
+Middleware: CompressionMiddleware
+Negotiated brotli/gzip compression of response bodies above a size threshold.
+"""
+import zlib
+from typing import List, Optional, Tuple
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:
+    import brotli
+except ImportError:  # brotli is optional; gzip is always available
+    brotli = None
+
+COMPRESSIBLE_TYPES = (
+    b"application/json",
+    b"application/x-ndjson",
+    b"application/problem+json",
+    b"application/xml",
+    b"text/",
+)
+
+
+def negotiate_encoding(accept_encoding: Optional[str], brotli_available: bool = brotli is not None) -> Optional[str]:
+    """Pick ``br`` or ``gzip`` from an Accept-Encoding header by q-value, preferring ``br`` on ties."""
+    if not accept_encoding:
+        return None
+
+    supported = ("br", "gzip") if brotli_available else ("gzip",)
+    weights = {}
+    for item in accept_encoding.split(","):
+        name, _, params = item.strip().partition(";")
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        weights[name.strip().lower()] = q
+
+    best, best_q = None, 0.0
+    for encoding in supported:
+        q = weights.get(encoding, weights.get("*", 0.0))
+        if q > best_q:
+            best, best_q = encoding, q
+    return best
+
+
+class _Compressor:
+    """Incremental compressor for one response."""
+
+    def __init__(self, encoding: str, gzip_level: int, brotli_quality: int):
+        self._brotli = encoding == "br"
+        if self._brotli:
+            self._compressor = brotli.Compressor(quality=brotli_quality)
+        else:
+            # wbits=31 writes a gzip header and trailer
+            self._compressor = zlib.compressobj(gzip_level, zlib.DEFLATED, 31)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.process(data) if self._brotli else self._compressor.compress(data)
+
+    def flush(self) -> bytes:
+        return self._compressor.finish() if self._brotli else self._compressor.flush()
+
+
+class CompressionMiddleware:
+    """
+    Compresses responses with brotli (when installed) or gzip, as negotiated
+    through Accept-Encoding.
+
+    Bodies smaller than ``minimum_size`` are sent as-is, since compressing them
+    costs more CPU than it saves bytes. Streamed bodies (e.g. NDJSON) are
+    compressed chunk by chunk. Only text-like content types are compressed, and
+    responses that already carry a Content-Encoding are left alone.
+    """
+
+    def __init__(self, app: ASGIApp, minimum_size: int = 1024, gzip_level: int = 6, brotli_quality: int = 4):
+        """
+        Args:
+            app: Wrapped ASGI application
+            minimum_size: Smallest body, in bytes, worth compressing
+            gzip_level: zlib compression level (1-9)
+            brotli_quality: brotli quality (0-11); low levels are fast enough for dynamic responses
+        """
+        self.app = app
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        accept_encoding = dict(scope["headers"]).get(b"accept-encoding", b"").decode("latin-1")
+        encoding = negotiate_encoding(accept_encoding)
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        start: Optional[Message] = None
+        compressor: Optional[_Compressor] = None
+        passthrough = False
+
+        async def compressing_send(message: Message) -> None:
+            nonlocal start, compressor, passthrough
+            if message["type"] == "http.response.start":
+                start = message
+                headers = dict(message.get("headers", []))
+                content_type = headers.get(b"content-type", b"")
+                passthrough = b"content-encoding" in headers or not content_type.startswith(COMPRESSIBLE_TYPES)
+                if passthrough:
+                    await send(message)
+                return
+
+            if message["type"] != "http.response.body" or passthrough:
+                await send(message)
+                return
+
+            body = message.get("body", b"")
+            more_body = message.get("more_body", False)
+
+            if compressor is None:
+                if not more_body and len(body) < self.minimum_size:
+                    await send(self._with_headers(start, vary=True))
+                    await send(message)
+                    return
+                compressor = _Compressor(encoding, self.gzip_level, self.brotli_quality)
+                if not more_body:
+                    compressed = compressor.compress(body) + compressor.flush()
+                    await send(self._with_headers(start, vary=True, encoding=encoding, length=len(compressed)))
+                    await send({"type": "http.response.body", "body": compressed})
+                    return
+                await send(self._with_headers(start, vary=True, encoding=encoding))
+
+            data = compressor.compress(body)
+            if not more_body:
+                data += compressor.flush()
+            if data or not more_body:
+                await send({"type": "http.response.body", "body": data, "more_body": more_body})
+
+        await self.app(scope, receive, compressing_send)
+
+    @staticmethod
+    def _with_headers(
+        start: Message,
+        vary: bool,
+        encoding: Optional[str] = None,
+        length: Optional[int] = None
+    ) -> Message:
+        headers: List[Tuple[bytes, bytes]] = []
+        vary_values = []
+        for name, value in start.get("headers", []):
+            if name == b"vary":
+                vary_values.append(value)
+            elif encoding is not None and name == b"content-length":
+                continue  # Replaced below, or dropped for streamed bodies
+            else:
+                headers.append((name, value))
+
+        if vary and not any(b"accept-encoding" in v.lower() for v in vary_values):
+            vary_values.append(b"Accept-Encoding")
+        if vary_values:
+            headers.append((b"vary", b", ".join(vary_values)))
+        if encoding is not None:
+            headers.append((b"content-encoding", encoding.encode()))
+            if length is not None:
+                headers.append((b"content-length", str(length).encode()))
+        return {**start, "headers": headers}
@@ -0,0 +1,165 @@
+"""
+Middleware: IdempotencyMiddleware
+Replays the stored response for POST requests retried with the same Idempotency-Key.
+"""
+import hashlib
+import json
+import logging
+from typing import List, Optional, Tuple
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.application.services.idempotency_store import IdempotencyStore, StoredResponse
+from src.presentation.api.v1.schemas.common.base_response import ErrorResponse
+
+logger = logging.getLogger(__name__)
+
+IDEMPOTENCY_HEADER = b"idempotency-key"
+REPLAYED_HEADER = (b"idempotent-replayed", b"true")
+MAX_KEY_LENGTH = 255
+
+# Rejections a retry may not get again (timeouts, conflicts, rate limits, load shedding); never stored
+TRANSIENT_STATUSES = frozenset({408, 409, 429, 503})
+
+
+class IdempotencyMiddleware:
+    """
+    Honours the ``Idempotency-Key`` header on POST requests.
+
+    The first request with a key runs normally and its response is stored,
+    unless it is a server error or a transient rejection (a status in
+    ``TRANSIENT_STATUSES`` or any response with ``Retry-After``), which the
+    retry should not inherit. A retry with the same key, caller and path gets the
+    stored response back, marked ``Idempotent-Replayed: true``, without running
+    the endpoint again. Reusing a key with a different body is rejected with
+    422, and a retry that arrives while the first request is still running is
+    rejected with 409.
+
+    The store is read from ``app.state.idempotency_store``; requests pass
+    straight through when it is not configured.
+    """
+
+    def __init__(self, app: ASGIApp, max_body_bytes: int = 1024 * 1024):
+        """
+        Args:
+            app: Wrapped ASGI application
+            max_body_bytes: Larger responses are not stored, so their retries run again
+        """
+        self.app = app
+        self.max_body_bytes = max_body_bytes
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] != "POST":
+            await self.app(scope, receive, send)
+            return
+
+        headers = dict(scope["headers"])
+        idempotency_key = headers.get(IDEMPOTENCY_HEADER)
+        store: Optional[IdempotencyStore] = getattr(scope["app"].state, "idempotency_store", None)
+        if idempotency_key is None or store is None:
+            await self.app(scope, receive, send)
+            return
+
+        if not idempotency_key or len(idempotency_key) > MAX_KEY_LENGTH:
+            await self._send_error(send, 400, "BAD_REQUEST", f"Idempotency-Key must be 1 to {MAX_KEY_LENGTH} characters")
+            return
+
+        body = await self._read_body(receive)
+        # Keys are scoped to the caller and endpoint, so one client can never replay another's response
+        key = hashlib.sha256(b"\n".join([
+            self._caller(scope, headers), scope["method"].encode(), scope["path"].encode(), idempotency_key
+        ])).hexdigest()
+        fingerprint = hashlib.sha256(scope.get("query_string", b"") + b"\n" + body).hexdigest()
+
+        stored = await store.get(key)
+        if stored is not None:
+            if stored.fingerprint != fingerprint:
+                await self._send_error(send, 422, "IDEMPOTENCY_KEY_REUSED",
+                                       "Idempotency-Key was already used with a different request")
+                return
+            await self._replay(send, stored)
+            return
+
+        if not store.begin(key):
+            await self._send_error(send, 409, "IDEMPOTENCY_KEY_IN_USE",
+                                   "A request with this Idempotency-Key is still being processed")
+            return
+
+        status_code = 500
+        response_headers: List[Tuple[bytes, bytes]] = []
+        chunks: List[bytes] = []
+        size = 0
+
+        async def replay_receive() -> Message:
+            nonlocal body
+            if body is None:
+                return await receive()  # Only disconnects remain after the body
+            message = {"type": "http.request", "body": body, "more_body": False}
+            body = None
+            return message
+
+        async def capture_send(message: Message) -> None:
+            nonlocal status_code, response_headers, size
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                response_headers = list(message.get("headers", []))
+            elif message["type"] == "http.response.body" and size <= self.max_body_bytes:
+                chunk = message.get("body", b"")
+                size += len(chunk)
+                chunks.append(chunk)
+            await send(message)
+
+        try:
+            await self.app(scope, replay_receive, capture_send)
+        except BaseException:
+            store.release(key)
+            raise
+
+        if not self._storable(status_code, response_headers) or size > self.max_body_bytes:
+            store.release(key)
+            return
+        await store.put(key, fingerprint, status_code, response_headers, b"".join(chunks))
+
+    @staticmethod
+    def _caller(scope: Scope, headers: dict) -> bytes:
+        """The credentials of the caller, or its address when anonymous, as the rate limiter identifies clients."""
+        authorization = headers.get(b"authorization")
+        if authorization:
+            return b"auth:" + authorization
+        client = scope.get("client")
+        return b"ip:" + (client[0] if client else "unknown").encode()
+
+    @staticmethod
+    def _storable(status_code: int, headers: List[Tuple[bytes, bytes]]) -> bool:
+        if status_code >= 500 or status_code in TRANSIENT_STATUSES:
+            return False
+        return not any(name.lower() == b"retry-after" for name, _ in headers)
+
+    @staticmethod
+    async def _read_body(receive: Receive) -> bytes:
+        parts = []
+        more_body = True
+        while more_body:
+            message = await receive()
+            parts.append(message.get("body", b""))
+            more_body = message.get("more_body", False)
+        return b"".join(parts)
+
+    @staticmethod
+    async def _replay(send: Send, stored: StoredResponse) -> None:
+        await send({
+            "type": "http.response.start",
+            "status": stored.status_code,
+            "headers": list(stored.headers) + [REPLAYED_HEADER],
+        })
+        await send({"type": "http.response.body", "body": stored.body})
+
+    @staticmethod
+    async def _send_error(send: Send, status_code: int, error_code: str, message: str) -> None:
+        body = json.dumps(ErrorResponse(success=False, message=message, error_code=error_code).dict()).encode()
+        await send({
+            "type": "http.response.start",
+            "status": status_code,
+            "headers": [(b"content-type", b"application/json"), (b"content-length", str(len(body)).encode())],
+        })
+        await send({"type": "http.response.body", "body": body})
@@ -0,0 +1,102 @@
+"""
+Middleware: LoadSheddingMiddleware
+Rejects requests early with 503 when the worker is over its adaptive concurrency limit.
+"""
+import json
+import logging
+import time
+from typing import Optional
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.application.services.admission_controller import (
+    AdmissionController,
+    PRIORITY_BULK,
+    PRIORITY_CRITICAL,
+    PRIORITY_NAMES,
+    PRIORITY_NORMAL
+)
+from src.presentation.api.v1.schemas.common.base_response import ErrorResponse
+
+logger = logging.getLogger(__name__)
+
+API_PREFIX = "/api/v1"
+EXEMPT_PREFIXES = (f"{API_PREFIX}/health", "/docs", "/redoc", "/openapi.json")
+
+
+def classify_request(method: str, path: str) -> Optional[int]:
+    """Admission priority of a request; None for requests that are never shed."""
+    if path.startswith(EXEMPT_PREFIXES):
+        return None
+    if path.startswith(f"{API_PREFIX}/tax-rules/calculate/"):
+        return PRIORITY_BULK if path.endswith("/batch") or "/batch/" in path else PRIORITY_CRITICAL
+    if path.startswith(f"{API_PREFIX}/audit/") or (path.startswith(f"{API_PREFIX}/jobs") and method == "POST"):
+        return PRIORITY_BULK
+    return PRIORITY_NORMAL
+
+
+class LoadSheddingMiddleware:
+    """
+    Admits each request through the worker's AdmissionController.
+
+    Shed requests get ``503 Service Unavailable`` with ``Retry-After`` before
+    any body is read or service code runs. Interactive calculations have the
+    highest priority; rule reads and writes come next, and batch, job and
+    audit export traffic is the first to be shed. Service time (admission to
+    response start) feeds the adaptive limit.
+
+    The controller is read from ``app.state.admission_controller``; requests
+    pass straight through when it is not configured.
+    """
+
+    def __init__(self, app: ASGIApp, retry_after_seconds: int = 1):
+        self.app = app
+        self.retry_after_seconds = retry_after_seconds
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        controller: Optional[AdmissionController] = getattr(scope["app"].state, "admission_controller", None)
+        priority = classify_request(scope["method"], scope["path"])
+        if controller is None or priority is None:
+            await self.app(scope, receive, send)
+            return
+
+        queue_time = await controller.admit(priority)
+        if queue_time is None:
+            logger.warning(f"Shed {PRIORITY_NAMES[priority]} request {scope['method']} {scope['path']}")
+            await self._send_overloaded(send)
+            return
+
+        admitted_at = time.monotonic()
+        latency = None
+
+        async def timed_send(message: Message) -> None:
+            nonlocal latency
+            if message["type"] == "http.response.start":
+                latency = time.monotonic() - admitted_at
+            await send(message)
+
+        try:
+            await self.app(scope, receive, timed_send)
+        finally:
+            controller.release(priority, latency if latency is not None else time.monotonic() - admitted_at)
+
+    async def _send_overloaded(self, send: Send) -> None:
+        body = json.dumps(ErrorResponse(
+            success=False,
+            message="Service is overloaded, retry later",
+            error_code="SERVICE_OVERLOADED"
+        ).dict()).encode()
+        await send({
+            "type": "http.response.start",
+            "status": 503,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode()),
+                (b"retry-after", str(self.retry_after_seconds).encode()),
+            ],
+        })
+        await send({"type": "http.response.body", "body": body})
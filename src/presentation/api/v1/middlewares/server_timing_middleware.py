@@ -0,0 +1,43 @@
+"""
+Middleware: ServerTimingMiddleware
+Reports the database cost of each request in a Server-Timing response header.
+"""
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.application.services.query_metrics import QueryCost, current_query_cost
+
+
+class ServerTimingMiddleware:
+    """
+    Collects the queries a request runs into a QueryCost and adds it to the
+    response as ``Server-Timing``: a ``db`` entry with the total query time,
+    count and rows. With ``detailed``, one ``db.<Repository>.<method>`` entry
+    per repository method that queried follows; that names internal code, so
+    it is meant for trusted clients only.
+
+    The header is written when the response starts, so a streamed response
+    reports the queries run before its first chunk.
+    """
+
+    def __init__(self, app: ASGIApp, detailed: bool = False):
+        self.app = app
+        self.detailed = detailed
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        cost = QueryCost()
+        token = current_query_cost.set(cost)
+
+        async def send_with_timing(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                MutableHeaders(scope=message).append("Server-Timing", cost.server_timing(self.detailed))
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            current_query_cost.reset(token)
@@ -0,0 +1,65 @@
+"""
+Middleware: TracingMiddleware
+Starts the server span of each request, continuing the caller's W3C trace context.
+"""
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.application.services.tracing import (
+    SPAN_KIND_SERVER,
+    STATUS_ERROR,
+    TRACEPARENT_HEADER,
+    parse_traceparent,
+    tracer
+)
+
+_TRACEPARENT = TRACEPARENT_HEADER.encode()
+
+
+class TracingMiddleware:
+    """
+    Runs each HTTP request in a server span, the parent of the controller,
+    service, repository and calculator spans it leads to. An incoming
+    ``traceparent`` header makes it a child of the caller's span and decides
+    whether the request is sampled.
+
+    The span is named ``<method> <route template>`` once the request is routed.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not tracer.enabled:
+            await self.app(scope, receive, send)
+            return
+
+        parent = None
+        for name, value in scope["headers"]:
+            if name == _TRACEPARENT:
+                parent = parse_traceparent(value.decode("latin-1"))
+                break
+
+        with tracer.start_span(
+            f"{scope['method']} {scope['path']}",
+            kind=SPAN_KIND_SERVER,
+            parent=parent,
+            attributes={"http.request.method": scope["method"], "url.path": scope["path"]}
+        ) as span:
+            if span is None:
+                await self.app(scope, receive, send)
+                return
+
+            async def send_with_status(message: Message) -> None:
+                if message["type"] == "http.response.start":
+                    span.set_attribute("http.response.status_code", message["status"])
+                    if message["status"] >= 500:
+                        span.status = STATUS_ERROR
+                await send(message)
+
+            try:
+                await self.app(scope, receive, send_with_status)
+            finally:
+                route = getattr(scope.get("route"), "path", None)
+                if route:
+                    span.name = f"{scope['method']} {route}"
+                    span.set_attribute("http.route", route)
@@ -0,0 +1,66 @@
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+from pydantic import BaseModel, Field, root_validator, validator
+
+MAX_AUDIT_PAGE_SIZE = 100000
+MAX_AUDIT_QUERY_DAYS = 366
+
+
+class AuditQueryRequest(BaseModel):
+    """
+    Filters for the calculation audit query.
+
+    The date range is required and bounded, so every query is pruned to a few
+    monthly partitions. ``cursor`` is the ``next_cursor`` of the previous page.
+    """
+    start: datetime = Field(..., description="Inclusive lower bound of calculated_at (UTC if no offset is given)", example="2024-01-01T00:00:00")
+    end: datetime = Field(..., description="Exclusive upper bound of calculated_at (UTC if no offset is given)", example="2024-02-01T00:00:00")
+
+    rule_type: Optional[str] = Field(default=None, description="Only records for this rule type", example="income_tax")
+    country_code: Optional[str] = Field(default=None, description="Only records for this ISO 3166-1 alpha-2 jurisdiction", example="US")
+    rule_version: Optional[str] = Field(default=None, description="Only records calculated with this rule version", example="2024.1")
+    min_amount: Optional[float] = Field(default=None, ge=0, description="Inclusive lower bound of the calculated amount")
+    max_amount: Optional[float] = Field(default=None, ge=0, description="Inclusive upper bound of the calculated amount")
+
+    limit: int = Field(default=1000, ge=1, le=MAX_AUDIT_PAGE_SIZE, description="Maximum number of records in this page")
+    cursor: Optional[str] = Field(default=None, description="Resume after the last record of the previous page")
+
+    @validator('start', 'end')
+    def to_naive_utc(cls, v):
+        """Audit timestamps are stored as naive UTC."""
+        if v.tzinfo is not None:
+            return v.astimezone(timezone.utc).replace(tzinfo=None)
+        return v
+
+    @validator('rule_type')
+    def validate_rule_type(cls, v):
+        return v.lower() if v else v
+
+    @validator('country_code')
+    def validate_country_code(cls, v):
+        return v.upper() if v else v
+
+    @root_validator(skip_on_failure=True)
+    def validate_ranges(cls, values):
+        """Require a bounded date range and a consistent amount band."""
+        if values["end"] <= values["start"]:
+            raise ValueError("end must be after start")
+        if values["end"] - values["start"] > timedelta(days=MAX_AUDIT_QUERY_DAYS):
+            raise ValueError(f"The date range cannot exceed {MAX_AUDIT_QUERY_DAYS} days")
+
+        min_amount, max_amount = values.get("min_amount"), values.get("max_amount")
+        if min_amount is not None and max_amount is not None and max_amount < min_amount:
+            raise ValueError("max_amount must not be below min_amount")
+        return values
+
+    class Config:
+        schema_extra = {
+            "example": {
+                "start": "2024-01-01T00:00:00",
+                "end": "2024-02-01T00:00:00",
+                "rule_version": "2024.1",
+                "min_amount": 50000,
+                "max_amount": 100000,
+                "limit": 1000
+            }
+        }
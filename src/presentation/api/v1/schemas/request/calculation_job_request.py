@@ -0,0 +1,41 @@
+from typing import List, Optional
+from pydantic import BaseModel, Field, validator
+
+from src.domain.value_objects.residency_status import ResidencyType
+
+MAX_JOB_AMOUNTS = 5000000
+
+
+class CalculationJobRequest(BaseModel):
+    rule_type: str = Field(..., description="Tax rule type to apply", example="income_tax")
+    amounts: List[float] = Field(
+        ...,
+        min_length=1,
+        max_length=MAX_JOB_AMOUNTS,
+        description="Amounts to calculate tax for",
+        example=[1000.00, 2500.00, 60000.00]
+    )
+
+    country_code: Optional[str] = Field(default=None, description="ISO 3166-1 alpha-2 jurisdiction (defaults to the service default)")
+    residency: ResidencyType = Field(default=ResidencyType.TAX_RESIDENT, description="Tax residency status applied to every amount")
+    days_resident: Optional[int] = Field(default=None, ge=1, le=366, description="Days of residency in the tax year, for prorated variants")
+
+    @validator('rule_type')
+    def validate_rule_type(cls, v):
+        return v.lower()
+
+    @validator('amounts')
+    def validate_amounts(cls, v):
+        """Ensure amounts are not negative and round to 2 decimals."""
+        if any(a < 0 for a in v):
+            raise ValueError("Amounts cannot be negative")
+        return [round(a, 2) for a in v]
+
+    class Config:
+        schema_extra = {
+            "example": {
+                "rule_type": "income_tax",
+                "amounts": [1000.00, 2500.00, 60000.00],
+                "country_code": "US"
+            }
+        }
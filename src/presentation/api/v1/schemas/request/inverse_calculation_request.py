@@ -0,0 +1,35 @@
+from typing import List, Optional
+from pydantic import BaseModel, Field, validator
+
+from src.domain.value_objects.residency_status import ResidencyType
+
+MAX_INVERSE_TARGETS = 10000
+
+
+class InverseCalculationRequest(BaseModel):
+    net_amounts: List[float] = Field(
+        ...,
+        min_length=1,
+        max_length=MAX_INVERSE_TARGETS,
+        description="Target amounts after tax to solve the gross amount for",
+        example=[40000.00, 55000.00]
+    )
+
+    country_code: Optional[str] = Field(default=None, description="ISO 3166-1 alpha-2 jurisdiction (defaults to the service default)")
+    residency: ResidencyType = Field(default=ResidencyType.TAX_RESIDENT, description="Tax residency status of the taxpayer")
+    days_resident: Optional[int] = Field(default=None, ge=1, le=366, description="Days of residency in the tax year, for prorated variants")
+
+    @validator('net_amounts')
+    def validate_net_amounts(cls, v):
+        """Ensure targets are positive and round to 2 decimals."""
+        if any(n <= 0 for n in v):
+            raise ValueError("Net amounts must be greater than 0")
+        return [round(n, 2) for n in v]
+
+    class Config:
+        schema_extra = {
+            "example": {
+                "net_amounts": [40000.00, 55000.00],
+                "country_code": "US"
+            }
+        }
@@ -0,0 +1,71 @@
+from typing import List, Optional
+from pydantic import BaseModel, Field, validator
+
+from src.domain.value_objects.residency_status import ResidencyType
+
+
+class MultiJurisdictionCalculationRequest(BaseModel):
+    amount: float = Field(
+        ...,
+        gt=0,
+        description="Amount to calculate tax for",
+        example=1000.00
+    )
+
+    rule_type: str = Field(
+        ...,
+        min_length=3,
+        max_length=50,
+        description="Type of tax rule (e.g., 'income_tax')",
+        example="income_tax"
+    )
+
+    country_codes: List[str] = Field(
+        ...,
+        min_length=1,
+        max_length=50,
+        description="ISO 3166-1 alpha-2 codes of the jurisdictions to calculate in",
+        example=["US", "GB"]
+    )
+
+    residency: ResidencyType = Field(
+        default=ResidencyType.TAX_RESIDENT,
+        description="Tax residency status applied in every jurisdiction",
+        example="dual_resident"
+    )
+
+    days_resident: Optional[int] = Field(
+        default=None,
+        ge=1,
+        le=366,
+        description="Days of residency in the tax year, for prorated variants"
+    )
+
+    include_breakdown: bool = Field(
+        default=False,
+        description="Include the per-bracket breakdown for each jurisdiction"
+    )
+
+    @validator('rule_type')
+    def validate_rule_type(cls, v):
+        """Ensure rule_type contains only letters, underscores, or hyphens."""
+        if not all(c.isalpha() or c in ['_'] for c in v):
+            raise ValueError("rule_type must contain only letters, underscores")
+        return v.lower()
+
+    @validator('amount')
+    def validate_amount(cls, v):
+        """Ensure amount is positive and round to 2 decimals."""
+        if v <= 0:
+            raise ValueError("Amount must be greater than 0")
+        return round(v, 2)
+
+    class Config:
+        schema_extra = {
+            "example": {
+                "amount": 1000.00,
+                "rule_type": "income_tax",
+                "country_codes": ["US", "GB"],
+                "residency": "dual_resident"
+            }
+        }
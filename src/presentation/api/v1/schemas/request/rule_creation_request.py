@@ -1,12 +1,15 @@
 from datetime import datetime
-from typing import Any, Dict
-from pydantic import Field
-from pydantic_settings import BaseSettings
+from typing import Any, Dict, Optional
+from pydantic import BaseModel, Field, StrictBool, StrictStr
 
 
-class TaxRuleCreateRequest(BaseSettings):
-    rule_type: str = Field(..., description="Type of tax rule (e.g., 'income_tax')")
-    version: str = Field(..., description="Rule version")
+class TaxRuleCreateRequest(BaseModel):
+    rule_type: StrictStr = Field(..., description="Type of tax rule (e.g., 'income_tax')")
+    country_code: Optional[StrictStr] = Field(default=None, description="ISO 3166-1 alpha-2 country the rule applies to (defaults to the service default)")
+    version: StrictStr = Field(..., description="Rule version")
     tax_date: datetime = Field(..., description="Date when this rule becomes effective")
     tax_rule: Dict[str, Any] = Field(..., description="The tax calculation rules")
-    is_active: bool = Field(default=True, description="Is this rule active")
\ No newline at end of file
+    is_active: StrictBool = Field(default=True, description="Is this rule active")
+
+    class Config:
+        extra = "forbid"
@@ -0,0 +1,65 @@
+from typing import List, Optional
+from pydantic import BaseModel, Field, root_validator, validator
+
+from src.domain.value_objects.residency_status import ResidencyType
+
+MAX_SCENARIO_POINTS = 10000
+
+
+class TaxScenarioRequest(BaseModel):
+    """
+    What-if points to evaluate against one rule.
+
+    Either ``base_amount`` with ``deltas`` (the base amount itself is always the
+    first point) or a ``start``/``stop``/``step`` range, both ends inclusive.
+    """
+    base_amount: Optional[float] = Field(default=None, ge=0, description="Amount the deltas are applied to", example=50000.00)
+    deltas: Optional[List[float]] = Field(default=None, description="Changes to evaluate relative to base_amount", example=[1000, 5000, -2000])
+
+    start: Optional[float] = Field(default=None, ge=0, description="First amount of the range", example=30000.00)
+    stop: Optional[float] = Field(default=None, ge=0, description="Last amount of the range (inclusive)", example=80000.00)
+    step: Optional[float] = Field(default=None, gt=0, description="Distance between range points", example=1000.00)
+
+    country_code: Optional[str] = Field(default=None, description="ISO 3166-1 alpha-2 jurisdiction (defaults to the service default)")
+    residency: ResidencyType = Field(default=ResidencyType.TAX_RESIDENT, description="Tax residency status of the taxpayer")
+    days_resident: Optional[int] = Field(default=None, ge=1, le=366, description="Days of residency in the tax year, for prorated variants")
+
+    @root_validator(skip_on_failure=True)
+    def validate_points(cls, values):
+        """Require exactly one of the delta or range forms and bound the number of points."""
+        has_deltas = values.get("base_amount") is not None
+        has_range = any(values.get(k) is not None for k in ("start", "stop", "step"))
+        if has_deltas == has_range:
+            raise ValueError("Provide either base_amount with deltas, or start, stop and step")
+
+        if has_deltas:
+            deltas = values.get("deltas") or []
+            if len(deltas) + 1 > MAX_SCENARIO_POINTS:
+                raise ValueError(f"At most {MAX_SCENARIO_POINTS} scenario points are allowed")
+            if any(values["base_amount"] + d < 0 for d in deltas):
+                raise ValueError("Scenario amounts cannot be negative")
+        else:
+            if any(values.get(k) is None for k in ("start", "stop", "step")):
+                raise ValueError("start, stop and step are all required for a range")
+            if values["stop"] < values["start"]:
+                raise ValueError("stop must not be below start")
+            if int((values["stop"] - values["start"]) / values["step"]) + 1 > MAX_SCENARIO_POINTS:
+                raise ValueError(f"At most {MAX_SCENARIO_POINTS} scenario points are allowed")
+        return values
+
+    def amounts(self) -> List[float]:
+        """Expand the request into the amounts to evaluate."""
+        if self.base_amount is not None:
+            return [round(self.base_amount, 2)] + [round(self.base_amount + d, 2) for d in (self.deltas or [])]
+
+        count = int((self.stop - self.start) / self.step + 1e-9) + 1
+        return [round(self.start + i * self.step, 2) for i in range(count)]
+
+    class Config:
+        schema_extra = {
+            "example": {
+                "base_amount": 50000.00,
+                "deltas": [1000, 5000, -2000],
+                "country_code": "US"
+            }
+        }
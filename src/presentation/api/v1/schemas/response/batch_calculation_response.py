@@ -0,0 +1,16 @@
+"""
+API Schema: Batch Calculation Response
+Pydantic models for batch tax calculation API responses.
+"""
+from typing import List, Optional
+
+from src.presentation.api.v1.schemas.common.base_response import BaseResponse
+
+
+class BatchCalculationResponse(BaseResponse):
+    rule_type: str
+    rule_version: str
+    country_code: Optional[str] = None
+    residency: Optional[str] = None
+    rule_stale_seconds: Optional[float] = None  # Set while an expired rule is served during revalidation
+    tax_amounts: List[float]  # Same order as the requested amounts
@@ -0,0 +1,33 @@
+"""
+API Schema: Calculation Job Response
+Pydantic models for background calculation job API responses.
+"""
+from typing import List, Optional
+
+from src.presentation.api.v1.schemas.common.base_response import BaseResponse
+
+
+class CalculationJobResponse(BaseResponse):
+    job_id: str
+    status: str  # queued, running, completed, failed
+    rule_type: str
+    country_code: str
+    residency: str
+    rule_version: Optional[str] = None
+    total_count: int
+    processed_count: int
+    error: Optional[str] = None
+    created_at: Optional[str] = None
+    started_at: Optional[str] = None
+    completed_at: Optional[str] = None
+
+
+class CalculationJobResultsResponse(BaseResponse):
+    job_id: str
+    status: str
+    rule_version: Optional[str] = None
+    offset: int
+    total_count: int
+    processed_count: int
+    next_offset: Optional[int] = None  # None once every processed result has been returned
+    tax_amounts: List[float]  # Same order as the submitted amounts
@@ -0,0 +1,23 @@
+"""
+API Schema: Inverse Calculation Response
+Pydantic models for net-to-gross API responses.
+"""
+from pydantic import BaseModel
+from typing import List, Optional
+
+from src.presentation.api.v1.schemas.common.base_response import BaseResponse
+
+
+class InverseCalculationResult(BaseModel):
+    net_amount: float
+    gross_amount: float
+    tax_amount: float
+
+
+class InverseCalculationResponse(BaseResponse):
+    rule_type: str
+    rule_version: str
+    country_code: Optional[str] = None
+    residency: Optional[str] = None
+    rule_stale_seconds: Optional[float] = None  # Set while an expired rule is served during revalidation
+    results: List[InverseCalculationResult]
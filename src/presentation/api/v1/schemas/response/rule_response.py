@@ -1,18 +1,29 @@
-from datetime import datetime
-from typing import Dict, Any, List
-from pydantic import BaseModel, Field
-from pydantic_settings import BaseSettings
+from typing import Dict, Any, List, Optional
+from pydantic import BaseModel, Field, StrictBool, StrictInt, StrictStr
 
 from src.presentation.api.v1.schemas.common.base_response import BaseResponse
 
 
-class TaxRuleResponse(BaseSettings):
-    id: int
-    rule_type: str
-    version: str
-    is_active: bool
+class TaxRuleResponse(BaseModel):
+    """
+    A stored tax rule. A plain model: unlike a settings class, building one
+    never reads the environment. See ``TaxRuleMapper.to_tax_rule_response``.
+    """
+    id: StrictInt
+    rule_type: StrictStr
+    version: StrictStr
+    is_active: StrictBool
     tax_rule: Dict[str, Any]
+    country_code: Optional[StrictStr] = None
+
+    class Config:
+        extra = "forbid"
 
 
 class TaxRuleListResponse(BaseResponse):
     rules: List[TaxRuleResponse]
+
+
+class TaxRuleProjectionListResponse(BaseResponse):
+    """Rule listing restricted to the fields requested with ``?fields=``."""
+    rules: List[Dict[str, Any]]
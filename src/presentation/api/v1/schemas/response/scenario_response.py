@@ -0,0 +1,24 @@
+"""
+API Schema: Tax Scenario Response
+Pydantic models for what-if scenario API responses.
+"""
+from pydantic import BaseModel
+from typing import List, Optional
+
+from src.presentation.api.v1.schemas.common.base_response import BaseResponse
+
+
+class TaxScenarioPoint(BaseModel):
+    amount: float
+    tax_amount: float
+    marginal_rate: float  # Percentage applied to the next unit of income
+    effective_rate: float  # tax_amount / amount as a percentage
+
+
+class TaxScenarioResponse(BaseResponse):
+    rule_type: str
+    rule_version: str
+    country_code: Optional[str] = None
+    residency: Optional[str] = None
+    rule_stale_seconds: Optional[float] = None  # Set while an expired rule is served during revalidation
+    points: List[TaxScenarioPoint]
@@ -6,8 +6,20 @@ from pydantic import BaseModel, Field
 from typing import List, Dict, Optional, Any
 from datetime import datetime
 
+from src.presentation.api.v1.schemas.common.base_response import BaseResponse
+
 class TaxCalculationResponse(BaseModel):
     income: float
     tax_amount: float
     rule_version: str
-    breakdown: Optional[List[Dict[str, Any]]] = None
\ No newline at end of file
+    country_code: Optional[str] = None
+    residency: Optional[str] = None
+    rule_stale_seconds: Optional[float] = None  # Set while an expired rule is served during revalidation
+    breakdown: Optional[List[Dict[str, Any]]] = None
+
+
+class MultiJurisdictionCalculationResponse(BaseResponse):
+    income: float
+    rule_type: str
+    total_tax_amount: float
+    results: List[TaxCalculationResponse]
@@ -0,0 +1,43 @@
+"""
+HTTP caching helpers: ETag validation and Cache-Control headers.
+"""
+from typing import Optional
+
+from fastapi import Response, status
+
+from src.infrastructure.configuration.app_settings import settings
+
+
+def etag_matches(if_none_match: Optional[str], etag: Optional[str]) -> bool:
+    """Weak comparison of an If-None-Match header against the current ETag (RFC 9110, 13.1.2)."""
+    if not if_none_match or not etag:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+
+    current = etag[2:] if etag.startswith("W/") else etag
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == current:
+            return True
+    return False
+
+
+def cache_control() -> str:
+    return f"public, max-age={settings.http_cache_max_age_seconds}"
+
+
+def set_cache_headers(response: Response, etag: Optional[str]) -> None:
+    """Mark a successful read as cacheable; without an ETag, caches can only use max-age."""
+    response.headers["Cache-Control"] = cache_control()
+    if etag:
+        response.headers["ETag"] = etag
+
+
+def not_modified_response(etag: str) -> Response:
+    return Response(
+        status_code=status.HTTP_304_NOT_MODIFIED,
+        headers={"ETag": etag, "Cache-Control": cache_control()}
+    )
@@ -13,3 +13,32 @@ class BusinessException(HTTPException):
     
     def __init__(self, detail: Any = None, code: Optional[int] = status.HTTP_400_BAD_REQUEST):
         super().__init__(status_code=code, detail=detail or "Business logic error occurred.")
+
+
+class NotFoundException(HTTPException):
+    """Custom exception for missing resources."""
+    
+    def __init__(self, detail: Any = None):
+        super().__init__(status_code=status.HTTP_404_NOT_FOUND, detail=detail or "Resource not found.")
+
+
+class CapacityExceededException(HTTPException):
+    """Custom exception for a full queue or exhausted limit; the client should retry later."""
+    
+    def __init__(self, detail: Any = None, retry_after: Optional[int] = None):
+        super().__init__(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail=detail or "Capacity exceeded, retry later.",
+            headers={"Retry-After": str(retry_after)} if retry_after else None
+        )
+
+
+class ServiceUnavailableException(HTTPException):
+    """Custom exception for an unavailable dependency, e.g. an open database circuit; the client should retry later."""
+    
+    def __init__(self, detail: Any = None, retry_after: Optional[int] = None):
+        super().__init__(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=detail or "Service unavailable, retry later.",
+            headers={"Retry-After": str(retry_after)} if retry_after else None
+        )
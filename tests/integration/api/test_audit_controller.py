@@ -0,0 +1,56 @@
+import asyncio
+import threading
+
+import httpx
+import pytest
+from fastapi import FastAPI
+
+from src.application.services.rate_limiter import BUCKET_BULK, RateLimiter, RateLimitPolicy
+from src.infrastructure.configuration.dependency_injection import get_audit_controller
+from src.presentation.api.v1.controllers.audit_controller import AuditController, router
+from src.presentation.api.v1.controllers.tax_calculation_controller import get_current_user
+
+QUERY = "/audit/calculations?start=2024-01-01T00:00:00&end=2024-02-01T00:00:00"
+
+
+class SlowExportService:
+    """Audit query service whose first export streams until ``finish`` is set."""
+
+    def __init__(self):
+        self.finish = threading.Event()
+        self.exports = 0
+
+    def stream_ndjson(self, query):
+        self.exports += 1
+        return self._lines(first=self.exports == 1)
+
+    def _lines(self, first):
+        yield '{"id": 1}\n'
+        if first:
+            self.finish.wait(5)
+        yield '{"next_cursor": null}\n'
+
+
+@pytest.mark.asyncio
+async def test_export_holds_its_bulk_slot_until_streamed():
+    service = SlowExportService()
+    app = FastAPI()
+    app.include_router(router)
+    app.state.rate_limiter = RateLimiter({
+        BUCKET_BULK: RateLimitPolicy(requests_per_second=100, burst=100, max_concurrent=1)
+    })
+    app.dependency_overrides[get_current_user] = lambda: {"user_id": 1}
+    app.dependency_overrides[get_audit_controller] = lambda: AuditController(service)
+
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+        first = asyncio.create_task(client.get(QUERY))
+        while service.exports == 0:
+            await asyncio.sleep(0.01)
+
+        second = await client.get(QUERY)
+        service.finish.set()
+        assert second.status_code == 429
+        assert (await first).status_code == 200
+
+        third = await client.get(QUERY)
+        assert third.status_code == 200
@@ -0,0 +1,80 @@
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse, StreamingResponse
+from fastapi.testclient import TestClient
+
+from src.presentation.api.v1.middlewares.compression_middleware import CompressionMiddleware, negotiate_encoding
+
+
+class TestNegotiateEncoding:
+
+    def test_prefers_brotli_when_available(self):
+        assert negotiate_encoding("gzip, deflate, br", brotli_available=True) == "br"
+        assert negotiate_encoding("gzip, deflate, br", brotli_available=False) == "gzip"
+
+    def test_honours_q_values(self):
+        assert negotiate_encoding("br;q=0.5, gzip", brotli_available=True) == "gzip"
+        assert negotiate_encoding("gzip;q=0, identity", brotli_available=False) is None
+        assert negotiate_encoding("*", brotli_available=False) == "gzip"
+        assert negotiate_encoding(None) is None
+
+
+class TestCompressionMiddleware:
+
+    @pytest.fixture
+    def client(self):
+        app = FastAPI()
+        app.add_middleware(CompressionMiddleware, minimum_size=100)
+
+        @app.get("/rules")
+        async def rules():
+            return {"rules": [{"id": i, "country_code": "US", "version": "2024.1"} for i in range(50)]}
+
+        @app.get("/small")
+        async def small():
+            return {"ok": True}
+
+        @app.get("/text")
+        async def text():
+            return PlainTextResponse("x" * 500, media_type="image/svg+xml")
+
+        @app.get("/stream")
+        async def stream():
+            lines = (f'{{"id": {i}}}\n'.encode() for i in range(200))
+            return StreamingResponse(lines, media_type="application/x-ndjson")
+
+        return TestClient(app)
+
+    def test_large_json_is_gzipped(self, client):
+        response = client.get("/rules", headers={"Accept-Encoding": "gzip"})
+
+        assert response.headers["content-encoding"] == "gzip"
+        assert response.headers["vary"] == "Accept-Encoding"
+        assert int(response.headers["content-length"]) < len(response.content)
+        assert len(response.json()["rules"]) == 50
+
+    def test_small_bodies_and_unlisted_types_are_not_compressed(self, client):
+        small = client.get("/small", headers={"Accept-Encoding": "gzip"})
+        assert "content-encoding" not in small.headers
+        assert small.headers["vary"] == "Accept-Encoding"
+
+        svg = client.get("/text", headers={"Accept-Encoding": "gzip"})
+        assert "content-encoding" not in svg.headers
+
+    def test_without_accept_encoding_nothing_changes(self, client):
+        response = client.get("/rules", headers={"Accept-Encoding": "identity"})
+        assert "content-encoding" not in response.headers
+
+    def test_streamed_bodies_are_compressed(self, client):
+        response = client.get("/stream", headers={"Accept-Encoding": "gzip"})
+
+        assert response.headers["content-encoding"] == "gzip"
+        assert "content-length" not in response.headers
+        assert response.text.splitlines()[-1] == '{"id": 199}'
+
+    def test_brotli(self, client):
+        pytest.importorskip("brotli")
+        response = client.get("/rules", headers={"Accept-Encoding": "gzip, br"})
+
+        assert response.headers["content-encoding"] == "br"
+        assert len(response.json()["rules"]) == 50
@@ -0,0 +1,115 @@
+import pytest
+from fastapi import FastAPI, HTTPException
+from fastapi.testclient import TestClient
+
+from src.application.services.idempotency_store import IdempotencyStore
+from src.presentation.api.v1.middlewares.idempotency_middleware import IdempotencyMiddleware
+
+
+class TestIdempotencyMiddleware:
+
+    @pytest.fixture
+    def app(self):
+        app = FastAPI()
+        app.add_middleware(IdempotencyMiddleware)
+        app.state.idempotency_store = IdempotencyStore()
+        app.state.calls = 0
+
+        @app.post("/rules")
+        async def create_rule(payload: dict):
+            app.state.calls += 1
+            return {"version": app.state.calls, **payload}
+
+        @app.post("/limited")
+        async def limited():
+            app.state.calls += 1
+            if app.state.calls == 1:
+                raise HTTPException(status_code=429, detail="slow down", headers={"Retry-After": "1"})
+            return {"ok": True}
+
+        @app.post("/fail")
+        async def fail():
+            app.state.calls += 1
+            raise RuntimeError("boom")
+
+        return app
+
+    @pytest.fixture
+    def client(self, app):
+        return TestClient(app, raise_server_exceptions=False)
+
+    def test_retry_replays_stored_response(self, app, client):
+        first = client.post("/rules", json={"rate": 10}, headers={"Idempotency-Key": "abc"})
+        retry = client.post("/rules", json={"rate": 10}, headers={"Idempotency-Key": "abc"})
+
+        assert retry.status_code == 200
+        assert retry.json() == first.json() == {"version": 1, "rate": 10}
+        assert retry.headers["Idempotent-Replayed"] == "true"
+        assert app.state.calls == 1
+
+    def test_key_is_scoped_to_the_caller(self, app, client):
+        client.post("/rules", json={"rate": 10}, headers={"Idempotency-Key": "abc", "Authorization": "Bearer a"})
+        other = client.post("/rules", json={"rate": 10}, headers={"Idempotency-Key": "abc", "Authorization": "Bearer b"})
+
+        assert other.json()["version"] == 2
+        assert "Idempotent-Replayed" not in other.headers
+
+    def test_anonymous_keys_are_scoped_to_the_client_address(self, app):
+        TestClient(app, client=("10.0.0.1", 5000)).post("/rules", json={}, headers={"Idempotency-Key": "abc"})
+        other = TestClient(app, client=("10.0.0.2", 5000)).post("/rules", json={}, headers={"Idempotency-Key": "abc"})
+
+        assert other.json()["version"] == 2
+        assert "Idempotent-Replayed" not in other.headers
+
+    def test_transient_rejections_are_not_stored(self, app, client):
+        rejected = client.post("/limited", headers={"Idempotency-Key": "abc"})
+        retry = client.post("/limited", headers={"Idempotency-Key": "abc"})
+
+        assert rejected.status_code == 429
+        assert retry.status_code == 200
+        assert "Idempotent-Replayed" not in retry.headers
+        assert app.state.calls == 2
+
+    def test_reused_key_with_different_body_is_rejected(self, app, client):
+        client.post("/rules", json={"rate": 10}, headers={"Idempotency-Key": "abc"})
+        reused = client.post("/rules", json={"rate": 20}, headers={"Idempotency-Key": "abc"})
+
+        assert reused.status_code == 422
+        assert reused.json()["error_code"] == "IDEMPOTENCY_KEY_REUSED"
+        assert app.state.calls == 1
+
+    def test_key_in_flight_is_rejected(self, app, client):
+        store = app.state.idempotency_store
+        client.post("/rules", json={}, headers={"Idempotency-Key": "first"})
+        key = next(iter(store._entries))
+        store._entries.clear()
+        store.begin(key)
+
+        response = client.post("/rules", json={}, headers={"Idempotency-Key": "first"})
+
+        assert response.status_code == 409
+
+    def test_server_errors_are_not_stored(self, app, client):
+        client.post("/fail", headers={"Idempotency-Key": "abc"})
+        client.post("/fail", headers={"Idempotency-Key": "abc"})
+
+        assert app.state.calls == 2
+
+    def test_requests_without_key_are_untouched(self, app, client):
+        client.post("/rules", json={})
+        client.post("/rules", json={})
+
+        assert app.state.calls == 2
+
+    @pytest.mark.asyncio
+    async def test_store_evicts_least_recently_used(self):
+        store = IdempotencyStore(max_entries=2)
+        for key in ("a", "b"):
+            store.begin(key)
+            await store.put(key, "fp", 200, [], b"{}")
+        await store.get("a")
+        store.begin("c")
+        await store.put("c", "fp", 200, [], b"{}")
+
+        assert await store.get("b") is None
+        assert await store.get("a") is not None
@@ -0,0 +1,53 @@
+import asyncio
+import httpx
+import pytest
+from fastapi import FastAPI
+
+from src.application.services.admission_controller import (
+    AdmissionController,
+    PRIORITY_BULK,
+    PRIORITY_CRITICAL,
+    PRIORITY_NORMAL
+)
+from src.presentation.api.v1.middlewares.load_shedding_middleware import LoadSheddingMiddleware, classify_request
+
+
+def test_classify_request():
+    assert classify_request("GET", "/api/v1/tax-rules/calculate/income_tax/1000") == PRIORITY_CRITICAL
+    assert classify_request("POST", "/api/v1/tax-rules/calculate/income_tax/batch") == PRIORITY_BULK
+    assert classify_request("POST", "/api/v1/tax-rules/calculate/income_tax/batch/columnar") == PRIORITY_BULK
+    assert classify_request("POST", "/api/v1/jobs/") == PRIORITY_BULK
+    assert classify_request("GET", "/api/v1/jobs/abc") == PRIORITY_NORMAL
+    assert classify_request("GET", "/api/v1/tax-rules/") == PRIORITY_NORMAL
+    assert classify_request("GET", "/api/v1/health/") is None
+
+
+@pytest.mark.asyncio
+async def test_requests_over_the_limit_are_shed():
+    app = FastAPI()
+    app.add_middleware(LoadSheddingMiddleware)
+    app.state.admission_controller = AdmissionController(initial_limit=1, min_limit=1, max_queue_wait_seconds=0.01)
+    release = asyncio.Event()
+
+    @app.get("/api/v1/tax-rules/calculate/{rule_type}/{amount}")
+    async def calculate(rule_type: str, amount: float):
+        await release.wait()
+        return {"tax_amount": amount / 10}
+
+    @app.get("/api/v1/health/")
+    async def health():
+        return {"status": "ok"}
+
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+        slow = asyncio.create_task(client.get("/api/v1/tax-rules/calculate/income_tax/1000"))
+        await asyncio.sleep(0.01)
+
+        shed = await client.get("/api/v1/tax-rules/calculate/income_tax/2000")
+        assert shed.status_code == 503
+        assert shed.headers["Retry-After"] == "1"
+        assert shed.json()["error_code"] == "SERVICE_OVERLOADED"
+        assert (await client.get("/api/v1/health/")).status_code == 200
+
+        release.set()
+        assert (await slow).status_code == 200
+    assert app.state.admission_controller.in_flight == 0
@@ -0,0 +1,50 @@
+import asyncio
+
+import httpx
+import pytest
+from fastapi import FastAPI
+
+from src.application.services.query_metrics import current_query_cost
+from src.presentation.api.v1.middlewares.server_timing_middleware import ServerTimingMiddleware
+
+
+def _app(detailed):
+    app = FastAPI()
+    app.add_middleware(ServerTimingMiddleware, detailed=detailed)
+
+    def query(rows):
+        # As the engine hooks do, from the worker thread a repository runs in
+        current_query_cost.get().add("TaxRuleRepositoryImpl.get_active_tax_rule", rows, 0.004)
+
+    @app.get("/rules")
+    async def rules():
+        await asyncio.to_thread(query, 1)
+        await asyncio.to_thread(query, 2)
+        return {}
+
+    @app.get("/no-queries")
+    async def no_queries():
+        return {}
+
+    return app
+
+
+async def _server_timing(app, path):
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+        return (await client.get(path)).headers["Server-Timing"]
+
+
+@pytest.mark.asyncio
+async def test_database_cost_is_reported_in_server_timing():
+    app = _app(detailed=False)
+
+    assert await _server_timing(app, "/rules") == 'db;dur=8.00;desc="2 queries, 3 rows"'
+    assert await _server_timing(app, "/no-queries") == 'db;dur=0.00;desc="0 queries, 0 rows"'
+
+
+@pytest.mark.asyncio
+async def test_per_method_entries_are_opt_in():
+    assert await _server_timing(_app(detailed=True), "/rules") == (
+        'db;dur=8.00;desc="2 queries, 3 rows", '
+        'db.TaxRuleRepositoryImpl.get_active_tax_rule;dur=8.00;desc="2 queries, 3 rows"'
+    )
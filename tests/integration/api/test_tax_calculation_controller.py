@@ -63,7 +63,7 @@ class TestTaxCalculationAPI:
         assert result.income == 50000.0
         assert result.tax_amount == 10000.0
         assert result.rule_version == "1.0"
-        mock_tax_calculation_service.calculate_tax.assert_called_once_with(amount, rule_type)
+        mock_tax_calculation_service.calculate_tax.assert_called_once_with(amount, rule_type, country_code=None, residency=None, days_resident=None, include_breakdown=False)
     
     @pytest.mark.asyncio
     async def test_calculate_tax_business_exception(self, tax_controller, mock_tax_calculation_service):
@@ -100,3 +100,162 @@ class TestTaxCalculationAPI:
         assert exc_info.value.detail["error_code"] == "INTERNAL_ERROR"
 
 
+
+
+class TestHttpCaching:
+
+    @pytest.fixture
+    def mock_tax_calculation_service(self):
+        service = Mock(spec=TaxCalculationService)
+        service.get_active_rule_etag.return_value = 'W/"US-7-2024.1"'
+        service.calculate_tax = AsyncMock(return_value=TaxCalculationResponse(
+            income=1000.0, tax_amount=100.0, rule_version="2024.1"
+        ))
+        return service
+
+    @pytest.fixture
+    def client(self, mock_tax_calculation_service):
+        from fastapi import FastAPI
+        from src.infrastructure.configuration.dependency_injection import get_tax_calculation_controller
+        app = FastAPI()
+        app.include_router(router, prefix="/api/v1")
+        app.dependency_overrides[get_tax_calculation_controller] = lambda: TaxCalculationController(mock_tax_calculation_service)
+        return TestClient(app)
+
+    def test_calculation_carries_validators(self, client):
+        response = client.get("/api/v1/tax-rules/calculate/income_tax/1000")
+
+        assert response.status_code == 200
+        assert response.headers["ETag"] == 'W/"US-7-2024.1"'
+        assert response.headers["Cache-Control"].startswith("public, max-age=")
+
+    def test_matching_if_none_match_skips_the_calculation(self, client, mock_tax_calculation_service):
+        response = client.get(
+            "/api/v1/tax-rules/calculate/income_tax/1000", headers={"If-None-Match": '"other", W/"US-7-2024.1"'}
+        )
+
+        assert response.status_code == 304
+        assert response.content == b""
+        mock_tax_calculation_service.calculate_tax.assert_not_called()
+
+    def test_new_rule_version_invalidates_etag(self, client, mock_tax_calculation_service):
+        mock_tax_calculation_service.get_active_rule_etag.return_value = 'W/"US-8-2024.2"'
+
+        response = client.get("/api/v1/tax-rules/calculate/income_tax/1000", headers={"If-None-Match": 'W/"US-7-2024.1"'})
+
+        assert response.status_code == 200
+        assert response.headers["ETag"] == 'W/"US-8-2024.2"'
+
+    def test_projected_listing_has_its_own_etag(self, client, mock_tax_calculation_service):
+        mock_tax_calculation_service.get_rules_catalog_etag.return_value = 'W/"rules-abc"'
+        mock_tax_calculation_service.get_available_rules_projection = AsyncMock(
+            return_value=[{"id": 1, "version": "2024.1"}]
+        )
+
+        response = client.get("/api/v1/tax-rules/?fields=id,version")
+
+        assert response.status_code == 200
+        assert response.json()["rules"] == [{"id": 1, "version": "2024.1"}]
+        assert response.headers["ETag"] == 'W/"rules-abc-id+version"'
+        mock_tax_calculation_service.get_available_rules_projection.assert_awaited_once_with(["id", "version"])
+
+
+class TestRateLimiting:
+
+    @pytest.fixture
+    def client(self):
+        from fastapi import FastAPI
+        from src.application.services.rate_limiter import BUCKET_CALCULATE, RateLimiter, RateLimitPolicy
+        from src.infrastructure.configuration.dependency_injection import get_tax_calculation_controller
+        service = Mock(spec=TaxCalculationService)
+        service.get_active_rule_etag.return_value = None
+        service.calculate_tax = AsyncMock(return_value=TaxCalculationResponse(
+            income=1000.0, tax_amount=100.0, rule_version="2024.1"
+        ))
+        app = FastAPI()
+        app.include_router(router, prefix="/api/v1")
+        app.state.rate_limiter = RateLimiter({
+            BUCKET_CALCULATE: RateLimitPolicy(requests_per_second=0.01, burst=1, max_concurrent=1)
+        })
+        app.dependency_overrides[get_tax_calculation_controller] = lambda: TaxCalculationController(service)
+        return TestClient(app)
+
+    def test_calculate_is_limited_per_client(self, client):
+        assert client.get("/api/v1/tax-rules/calculate/income_tax/1000").status_code == 200
+
+        limited = client.get("/api/v1/tax-rules/calculate/income_tax/1000")
+        assert limited.status_code == 429
+        assert int(limited.headers["Retry-After"]) > 0
+
+        # An authenticated caller has its own bucket, and the released concurrency slot is reusable
+        authenticated = client.get(
+            "/api/v1/tax-rules/calculate/income_tax/1000", headers={"Authorization": "Bearer token"}
+        )
+        assert authenticated.status_code == 200
+
+
+class TestColumnarBatch:
+
+    @pytest.fixture
+    def pa(self):
+        return pytest.importorskip("pyarrow")
+
+    @pytest.fixture
+    def mock_tax_calculation_service(self):
+        np = pytest.importorskip("numpy")
+        service = Mock(spec=TaxCalculationService)
+        service.calculate_columns = AsyncMock(return_value={
+            "tax_amount": np.array([100.0, 250.0]),
+            "effective_rate": np.array([10.0, 10.0]),
+            "rule_version": "2024.1",
+            "country_code": "US",
+            "residency": "tax_resident",
+            "rule_stale_seconds": None,
+        })
+        return service
+
+    @pytest.fixture
+    def client(self, mock_tax_calculation_service):
+        from fastapi import FastAPI
+        from src.infrastructure.configuration.dependency_injection import get_tax_calculation_controller
+        app = FastAPI()
+        app.include_router(router, prefix="/api/v1")
+        app.dependency_overrides[get_tax_calculation_controller] = lambda: TaxCalculationController(mock_tax_calculation_service)
+        return TestClient(app)
+
+    def test_arrow_in_parquet_out(self, client, mock_tax_calculation_service, pa):
+        from src.application.services import columnar_io
+        table = pa.table({"employee": ["a", "b"], "amount": [1000.0, 2500.0]})
+
+        response = client.post(
+            "/api/v1/tax-rules/calculate/income_tax/batch/columnar?country_code=US",
+            content=columnar_io.write_table(table, columnar_io.FORMAT_ARROW),
+            headers={"Content-Type": "application/vnd.apache.arrow.stream", "Accept": "application/vnd.apache.parquet"}
+        )
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/vnd.apache.parquet"
+        result = columnar_io.read_table(response.content, columnar_io.FORMAT_PARQUET).to_pydict()
+        assert result["employee"] == ["a", "b"]
+        assert result["tax_amount"] == [100.0, 250.0]
+        assert result["rule_version"] == ["2024.1", "2024.1"]
+        amounts = mock_tax_calculation_service.calculate_columns.await_args.args[0]
+        assert amounts.tolist() == [1000.0, 2500.0]
+
+    def test_missing_amount_column_is_rejected(self, client, pa):
+        from src.application.services import columnar_io
+        table = pa.table({"income": [1000.0]})
+
+        response = client.post(
+            "/api/v1/tax-rules/calculate/income_tax/batch/columnar",
+            content=columnar_io.write_table(table, columnar_io.FORMAT_ARROW),
+            headers={"Content-Type": "application/vnd.apache.arrow.stream"}
+        )
+
+        assert response.status_code == 400
+        assert "amount" in response.json()["detail"]["details"]
+
+    def test_json_is_unsupported(self, client):
+        response = client.post("/api/v1/tax-rules/calculate/income_tax/batch/columnar", json={"amounts": [1.0]})
+
+        assert response.status_code == 415
@@ -0,0 +1,55 @@
+import httpx
+import pytest
+from fastapi import FastAPI
+
+from src.application.services.tracing import SPAN_KIND_SERVER, traced, tracer
+from src.presentation.api.v1.middlewares.tracing_middleware import TracingMiddleware
+
+
+class RecordingExporter:
+    def __init__(self):
+        self.spans = []
+
+    def export(self, spans):
+        self.spans.extend(spans)
+
+    def shutdown(self):
+        pass
+
+
+@pytest.fixture
+def exporter():
+    exporter = RecordingExporter()
+    tracer.configure(exporter, sample_ratio=0.0)
+    yield exporter
+    tracer.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_incoming_trace_context_is_continued(exporter):
+    app = FastAPI()
+    app.add_middleware(TracingMiddleware)
+
+    @traced("TaxCalculationService.calculate_tax")
+    async def calculate(amount: float):
+        return amount / 10
+
+    @app.get("/api/v1/tax-rules/calculate/{rule_type}/{amount}")
+    async def calculate_endpoint(rule_type: str, amount: float):
+        return {"tax_amount": await calculate(amount)}
+
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+        await client.get(
+            "/api/v1/tax-rules/calculate/income_tax/1000",
+            headers={"traceparent": "00-4bf92f3577b34da6a3ce929d0e0e4736-00f067aa0ba902b7-01"}
+        )
+        # Not sampled by the caller, and the local sample ratio is 0
+        await client.get("/api/v1/tax-rules/calculate/income_tax/2000")
+
+    service, server = exporter.spans
+    assert server.name == "GET /api/v1/tax-rules/calculate/{rule_type}/{amount}"
+    assert server.kind == SPAN_KIND_SERVER
+    assert server.context.trace_id == 0x4bf92f3577b34da6a3ce929d0e0e4736
+    assert server.parent_span_id == 0x00f067aa0ba902b7
+    assert server.attributes["http.response.status_code"] == 200
+    assert service.parent_span_id == server.context.span_id
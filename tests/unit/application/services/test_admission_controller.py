@@ -0,0 +1,63 @@
+import asyncio
+import pytest
+
+from src.application.services.admission_controller import (
+    AdmissionController,
+    PRIORITY_BULK,
+    PRIORITY_CRITICAL,
+    PRIORITY_NORMAL
+)
+
+
+class TestAdmissionController:
+
+    @pytest.mark.asyncio
+    async def test_lower_priorities_get_a_smaller_share(self):
+        controller = AdmissionController(initial_limit=4, max_queue_wait_seconds=0)
+
+        assert await controller.admit(PRIORITY_BULK) == 0.0
+        assert await controller.admit(PRIORITY_BULK) == 0.0
+        assert await controller.admit(PRIORITY_BULK) is None  # Bulk may fill half of the limit
+        assert await controller.admit(PRIORITY_NORMAL) == 0.0
+        assert await controller.admit(PRIORITY_NORMAL) is None  # Normal may fill three quarters
+        assert await controller.admit(PRIORITY_CRITICAL) == 0.0
+        assert await controller.admit(PRIORITY_CRITICAL) is None
+        assert controller.stats()["shed"] == {"critical": 1, "normal": 1, "bulk": 1}
+
+    @pytest.mark.asyncio
+    async def test_queued_critical_request_takes_the_next_free_slot(self):
+        controller = AdmissionController(initial_limit=1, min_limit=1, max_queue_wait_seconds=1.0)
+        await controller.admit(PRIORITY_CRITICAL)
+
+        normal = asyncio.create_task(controller.admit(PRIORITY_NORMAL))
+        critical = asyncio.create_task(controller.admit(PRIORITY_CRITICAL))
+        await asyncio.sleep(0)
+
+        controller.release(PRIORITY_CRITICAL, 0.01)
+        assert await critical is not None
+        assert await normal is None  # Its 0.25s budget ran out while the critical request held the slot
+
+    @pytest.mark.asyncio
+    async def test_limit_backs_off_on_slow_requests_and_recovers(self):
+        now = [0.0]
+        controller = AdmissionController(
+            initial_limit=10, min_limit=2, latency_target_seconds=0.1, clock=lambda: now[0]
+        )
+
+        for _ in range(3):
+            await controller.admit(PRIORITY_CRITICAL)
+        for _ in range(3):
+            controller.release(PRIORITY_CRITICAL, 0.5)
+        assert controller.limit == pytest.approx(9.0)  # Backs off once per target interval
+
+        now[0] += 1.0
+        for _ in range(20):
+            await controller.admit(PRIORITY_CRITICAL)
+            controller.release(PRIORITY_BULK, 5.0)  # Bulk latency never moves the limit
+        assert controller.limit == pytest.approx(9.0)
+
+        for _ in range(9):
+            await controller.admit(PRIORITY_CRITICAL)
+        for _ in range(9):
+            controller.release(PRIORITY_CRITICAL, 0.01)
+        assert controller.limit > 9.0
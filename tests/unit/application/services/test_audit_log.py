@@ -0,0 +1,106 @@
+import asyncio
+import pytest
+from datetime import datetime
+
+from src.application.services.audit_log import AuditEntry, AuditLog
+from src.shared.exceptions.base_exceptions import ServiceUnavailableException
+
+
+def _entry(rows=1):
+    return AuditEntry(datetime.utcnow(), "batch", "income_tax", "US", "tax_resident", None, "2024.1",
+                      [100.0] * rows, [10.0] * rows)
+
+
+class RecordingRepository:
+
+    def __init__(self, failures=0):
+        self.batches = []
+        self.failures = failures
+
+    def insert_entries(self, entries):
+        if self.failures:
+            self.failures -= 1
+            raise RuntimeError("database unavailable")
+        self.batches.append(entries)
+        return sum(len(e.amounts) for e in entries)
+
+
+class TestAuditLog:
+
+    @pytest.mark.asyncio
+    async def test_entries_are_written_in_batches(self):
+        repository = RecordingRepository()
+        audit_log = AuditLog(repository, batch_size=4, flush_interval_seconds=60)
+        audit_log.start()
+
+        for _ in range(3):
+            await audit_log.record(_entry(2))
+        await asyncio.sleep(0.05)
+
+        # The batch threshold triggers a write without waiting for the interval
+        assert [len(batch) for batch in repository.batches] == [2]
+        assert audit_log.buffered_rows == 2
+
+        await audit_log.stop()
+        assert audit_log.written_rows == 6
+        assert audit_log.buffered_rows == 0
+
+    @pytest.mark.asyncio
+    async def test_drop_policy_counts_discarded_rows(self):
+        audit_log = AuditLog(RecordingRepository(), max_buffered_rows=3, batch_size=100,
+                             flush_interval_seconds=60, overflow_policy="drop")
+        audit_log.start()
+
+        await audit_log.record(_entry(2))
+        await audit_log.record(_entry(2))
+
+        assert audit_log.dropped_rows == 2
+        await audit_log.stop()
+        assert audit_log.written_rows == 2
+
+    @pytest.mark.asyncio
+    async def test_block_policy_waits_for_the_flusher(self):
+        audit_log = AuditLog(RecordingRepository(), max_buffered_rows=3, batch_size=2, flush_interval_seconds=60)
+        audit_log.start()
+
+        await audit_log.record(_entry(2))
+        await asyncio.wait_for(audit_log.record(_entry(2)), timeout=1)
+
+        await audit_log.stop()
+        assert (audit_log.written_rows, audit_log.dropped_rows) == (4, 0)
+
+    @pytest.mark.asyncio
+    async def test_failed_writes_are_retried(self):
+        repository = RecordingRepository(failures=1)
+        audit_log = AuditLog(repository, batch_size=1, flush_interval_seconds=60, retry_delay_seconds=0)
+        audit_log.start()
+
+        await audit_log.record(_entry())
+        await asyncio.sleep(0.05)
+        await audit_log.stop()
+
+        assert audit_log.written_rows == 1
+
+    @pytest.mark.asyncio
+    async def test_database_outage_fails_blocked_callers_and_discards_batches(self):
+        repository = RecordingRepository(failures=10 ** 6)
+        audit_log = AuditLog(repository, max_buffered_rows=3, batch_size=2, flush_interval_seconds=60,
+                             retry_delay_seconds=0.01, max_block_seconds=0.01, max_write_attempts=1000)
+        audit_log.start()
+
+        await audit_log.record(_entry(2))
+        with pytest.raises(ServiceUnavailableException) as exc_info:
+            await asyncio.wait_for(audit_log.record(_entry(2)), timeout=1)
+        assert exc_info.value.headers["Retry-After"] == "1"
+
+        audit_log.max_write_attempts = 3
+        while not audit_log.failed_rows:
+            await asyncio.sleep(0.01)
+        await audit_log.record(_entry(2))
+        await audit_log.stop()
+
+        assert (audit_log.written_rows, audit_log.failed_rows, repository.batches) == (0, 2, [])
+
+    def test_unknown_overflow_policy(self):
+        with pytest.raises(ValueError):
+            AuditLog(RecordingRepository(), overflow_policy="ignore")
@@ -0,0 +1,76 @@
+import json
+import pytest
+from datetime import datetime
+from decimal import Decimal
+from unittest.mock import Mock
+
+from src.application.services.audit_query_service import AuditQueryService
+from src.presentation.api.v1.schemas.request.audit_query_request import AuditQueryRequest
+from src.shared.exceptions.base_exceptions import ValidationException
+
+
+def _record(record_id, minute):
+    return {
+        "id": record_id,
+        "calculated_at": datetime(2024, 1, 15, 10, minute),
+        "operation": "calculate",
+        "rule_type": "income_tax",
+        "country_code": "US",
+        "residency": "tax_resident",
+        "days_resident": None,
+        "rule_version": "2024.1",
+        "amount": Decimal("1000.00"),
+        "tax_amount": Decimal("100.00"),
+    }
+
+
+class TestAuditQueryService:
+
+    @pytest.fixture
+    def repository(self):
+        return Mock()
+
+    @pytest.fixture
+    def service(self, repository):
+        return AuditQueryService(repository)
+
+    def _query(self, **kwargs):
+        return AuditQueryRequest(start="2024-01-01T00:00:00", end="2024-02-01T00:00:00", **kwargs)
+
+    def test_full_page_ends_with_cursor_to_resume_from(self, service, repository):
+        repository.stream_records.return_value = iter([_record(1, 0), _record(2, 1)])
+
+        lines = [json.loads(line) for line in service.stream_ndjson(self._query(limit=2, country_code="us"))]
+
+        assert [line.get("id") for line in lines[:2]] == [1, 2]
+        assert lines[0]["amount"] == 1000.0
+        assert lines[0]["calculated_at"] == "2024-01-15T10:00:00"
+        assert service.decode_cursor(lines[-1]["next_cursor"]) == (datetime(2024, 1, 15, 10, 1), 2)
+        assert repository.stream_records.call_args.kwargs["country_code"] == "US"
+
+    def test_cursor_is_passed_as_keyset(self, service, repository):
+        repository.stream_records.return_value = iter([_record(3, 2)])
+        cursor = service.encode_cursor(datetime(2024, 1, 15, 10, 1), 2)
+
+        lines = list(service.stream_ndjson(self._query(limit=2, cursor=cursor)))
+
+        assert repository.stream_records.call_args.kwargs["after"] == (datetime(2024, 1, 15, 10, 1), 2)
+        # A short page is the last one
+        assert json.loads(lines[-1]) == {"next_cursor": None}
+
+    def test_invalid_cursor_is_rejected_before_streaming(self, service, repository):
+        with pytest.raises(ValidationException):
+            service.stream_ndjson(self._query(cursor="not-a-cursor"))
+        repository.stream_records.assert_not_called()
+
+    def test_query_requires_bounded_range(self):
+        with pytest.raises(ValueError):
+            AuditQueryRequest(start="2024-01-01T00:00:00", end="2025-06-01T00:00:00")
+        with pytest.raises(ValueError):
+            self._query(min_amount=10, max_amount=5)
+
+    def test_offset_timestamps_are_converted_to_utc(self):
+        query = AuditQueryRequest(start="2024-01-01T02:00:00+02:00", end="2024-01-02T00:00:00Z")
+
+        assert query.start == datetime(2024, 1, 1, 0, 0)
+        assert query.end.tzinfo is None
@@ -0,0 +1,227 @@
+import asyncio
+import pytest
+from datetime import datetime, timedelta
+from unittest.mock import Mock
+
+from src.application.services.calculation_job_queue import CalculationJobQueue
+from src.application.services.tax_calculation_service import TaxCalculationService
+from src.shared.exceptions.base_exceptions import BusinessException, CapacityExceededException, NotFoundException
+
+
+class InMemoryJobRepository:
+    """Stand-in for CalculationJobRepositoryImpl keeping jobs and chunks in dicts."""
+
+    def __init__(self):
+        self.jobs = {}
+        self.chunks = {}
+
+    def create_job(self, job_data):
+        self.jobs[job_data["job_id"]] = {
+            **job_data, "status": "queued", "processed_count": 0, "rule_version": None, "error": None,
+            "created_at": datetime.utcnow(), "started_at": None, "completed_at": None,
+            "lease_owner": None, "lease_expires_at": None
+        }
+        return self.get_job(job_data["job_id"])
+
+    def get_job(self, job_id, include_amounts=False):
+        job = self.jobs.get(job_id)
+        if job is None:
+            return None
+        return dict(job) if include_amounts else {k: v for k, v in job.items() if k != "amounts"}
+
+    def count_pending_jobs(self):
+        return sum(1 for job in self.jobs.values() if job["status"] in ("queued", "running"))
+
+    def list_queued_jobs(self):
+        return [job_id for job_id, job in self.jobs.items() if job["status"] == "queued"]
+
+    def requeue_expired_jobs(self):
+        expired = [
+            job_id for job_id, job in self.jobs.items()
+            if job["status"] == "running"
+            and (job["lease_expires_at"] is None or job["lease_expires_at"] < datetime.utcnow())
+        ]
+        for job_id in expired:
+            self.jobs[job_id].update(status="queued", lease_owner=None, lease_expires_at=None)
+        return expired
+
+    def claim_job(self, job_id, owner, lease_seconds):
+        if self.jobs[job_id]["status"] != "queued":
+            return False
+        self.jobs[job_id].update(
+            status="running", lease_owner=owner, lease_expires_at=datetime.utcnow() + timedelta(seconds=lease_seconds)
+        )
+        return True
+
+    def renew_leases(self, owner, lease_seconds):
+        held = [job for job in self.jobs.values() if job["status"] == "running" and job["lease_owner"] == owner]
+        for job in held:
+            job["lease_expires_at"] = datetime.utcnow() + timedelta(seconds=lease_seconds)
+        return len(held)
+
+    def release_leases(self, owner):
+        held = [job for job in self.jobs.values() if job["status"] == "running" and job["lease_owner"] == owner]
+        for job in held:
+            job.update(status="queued", lease_owner=None, lease_expires_at=None)
+        return len(held)
+
+    def save_chunk(self, job_id, chunk_index, tax_amounts, processed_count, rule_version, owner):
+        job = self.jobs[job_id]
+        if job["status"] != "running" or job["lease_owner"] != owner:
+            return False
+        self.chunks[(job_id, chunk_index)] = tax_amounts
+        job.update(processed_count=processed_count, rule_version=rule_version)
+        return True
+
+    def finish_job(self, job_id, status, owner, error=None):
+        job = self.jobs[job_id]
+        if job["status"] != "running" or job["lease_owner"] != owner:
+            return False
+        job.update(status=status, error=error, completed_at=datetime.utcnow(), lease_owner=None, lease_expires_at=None)
+        return True
+
+    def get_results(self, job_id, chunk_size, offset, limit):
+        first, last = offset // chunk_size, (offset + limit - 1) // chunk_size
+        amounts = [tax for i in range(first, last + 1) for tax in self.chunks.get((job_id, i), [])]
+        start = offset - first * chunk_size
+        return amounts[start:start + limit]
+
+
+def _rule(rate, version="2024.1"):
+    return {
+        "id": 1,
+        "country_code": "US",
+        "rule_type": "income_tax",
+        "version": version,
+        "tax_rule": {"brackets": [{"min_amount": 0, "max_amount": None, "rate": rate}]},
+        "is_active": True,
+    }
+
+
+class TestCalculationJobQueue:
+
+    @pytest.fixture
+    def rule_repository(self):
+        repository = Mock()
+        repository.get_active_tax_rule.return_value = _rule(10)
+        return repository
+
+    @pytest.fixture
+    def job_repository(self):
+        return InMemoryJobRepository()
+
+    @pytest.fixture
+    def queue(self, rule_repository, job_repository):
+        service = TaxCalculationService(rule_repository)
+        return CalculationJobQueue(
+            job_repository, service, max_workers=1, max_pending_jobs=2, chunk_size=3, worker_id="worker-a"
+        )
+
+    async def _drain(self, queue):
+        await queue.start()
+        await queue._queue.join()
+        await queue.stop()
+
+    @pytest.mark.asyncio
+    async def test_job_is_processed_in_chunks_and_paginated(self, queue, job_repository):
+        submitted = await queue.submit([100.0 * i for i in range(1, 8)], "income_tax")
+        assert submitted.status == "queued"
+
+        await self._drain(queue)
+
+        status = await queue.get_status(submitted.job_id)
+        assert (status.status, status.processed_count, status.rule_version) == ("completed", 7, "2024.1")
+        assert len([key for key in job_repository.chunks if key[0] == submitted.job_id]) == 3
+
+        page = await queue.get_results(submitted.job_id, offset=2, limit=3)
+        assert page.tax_amounts == [30.0, 40.0, 50.0]
+        assert page.next_offset == 5
+        last = await queue.get_results(submitted.job_id, offset=5, limit=10)
+        assert last.tax_amounts == [60.0, 70.0]
+        assert last.next_offset is None
+
+    @pytest.mark.asyncio
+    async def test_interrupted_job_resumes_after_last_chunk(self, queue, job_repository, rule_repository):
+        submitted = await queue.submit([100.0] * 5, "income_tax")
+        # Simulate a worker that stopped after storing the first chunk and whose lease then expired
+        job_repository.claim_job(submitted.job_id, "worker-b", 60)
+        job_repository.save_chunk(submitted.job_id, 0, [-1.0, -1.0, -1.0], 3, "2024.1", "worker-b")
+        job_repository.jobs[submitted.job_id]["lease_expires_at"] = datetime.utcnow() - timedelta(seconds=1)
+
+        await self._drain(queue)
+
+        page = await queue.get_results(submitted.job_id, limit=5)
+        assert page.status == "completed"
+        assert page.tax_amounts == [-1.0, -1.0, -1.0, 10.0, 10.0]
+
+    @pytest.mark.asyncio
+    async def test_job_with_a_live_lease_is_left_to_its_worker(self, queue, job_repository):
+        submitted = await queue.submit([100.0] * 5, "income_tax")
+        job_repository.claim_job(submitted.job_id, "worker-b", 60)
+
+        await queue.start()
+        await queue.stop()
+
+        job = job_repository.jobs[submitted.job_id]
+        assert (job["status"], job["lease_owner"], job["processed_count"]) == ("running", "worker-b", 0)
+
+    @pytest.mark.asyncio
+    async def test_worker_abandons_a_job_taken_over_by_another(self, queue, job_repository):
+        submitted = await queue.submit([100.0] * 7, "income_tax")
+        save_chunk = job_repository.save_chunk
+
+        def take_over_after_first_chunk(job_id, *args):
+            saved = save_chunk(job_id, *args)
+            job_repository.jobs[job_id]["lease_owner"] = "worker-b"
+            return saved
+
+        job_repository.save_chunk = take_over_after_first_chunk
+
+        await self._drain(queue)
+
+        job = job_repository.jobs[submitted.job_id]
+        assert (job["status"], job["lease_owner"], job["processed_count"]) == ("running", "worker-b", 3)
+        assert list(job_repository.chunks) == [(submitted.job_id, 0)]
+
+    @pytest.mark.asyncio
+    async def test_stop_hands_running_jobs_back_to_the_queue(self, queue, job_repository):
+        submitted = await queue.submit([100.0] * 5, "income_tax")
+        job_repository.claim_job(submitted.job_id, "worker-a", 60)
+
+        await queue.stop()
+
+        assert job_repository.jobs[submitted.job_id]["status"] == "queued"
+
+    @pytest.mark.asyncio
+    async def test_rule_change_mid_run_fails_the_job(self, queue, job_repository, rule_repository):
+        submitted = await queue.submit([100.0] * 5, "income_tax")
+        job_repository.chunks[(submitted.job_id, 0)] = [10.0] * 3
+        job_repository.jobs[submitted.job_id].update(processed_count=3, rule_version="2023.9")
+
+        await self._drain(queue)
+
+        status = await queue.get_status(submitted.job_id)
+        assert status.status == "failed"
+        assert "2023.9" in status.error
+
+    @pytest.mark.asyncio
+    async def test_submissions_are_rejected_when_queue_is_full(self, queue):
+        await queue.submit([1.0], "income_tax")
+        await queue.submit([1.0], "income_tax")
+
+        with pytest.raises(CapacityExceededException) as exc_info:
+            await queue.submit([1.0], "income_tax")
+        assert exc_info.value.headers["Retry-After"] == "30"
+
+    @pytest.mark.asyncio
+    async def test_unknown_rule_is_rejected_at_submission(self, queue, rule_repository, job_repository):
+        rule_repository.get_active_tax_rule.return_value = None
+
+        with pytest.raises(BusinessException):
+            await queue.submit([1.0], "income_tax")
+        assert job_repository.jobs == {}
+
+    @pytest.mark.asyncio
+    async def test_unknown_job(self, queue):
+        with pytest.raises(NotFoundException):
+            await queue.get_status("missing")
@@ -0,0 +1,55 @@
+import pytest
+
+from src.application.services.bracket_table import CompiledBracketTable
+from src.application.services.calculation_pool import CalculationPool
+
+
+BRACKETS = [
+    {"min_amount": 0, "max_amount": 1000, "rate": 10},
+    {"min_amount": 1000, "max_amount": None, "rate": 20},
+]
+
+
+class TestCalculationPool:
+
+    def test_chunk_size_is_clamped(self):
+        pool = CalculationPool(max_workers=4, min_chunk_size=100, max_chunk_size=1000)
+
+        assert pool.chunk_size(10) == 100
+        assert pool.chunk_size(8000) == 500
+        assert pool.chunk_size(10 ** 6) == 1000
+
+    def test_disabled_pool_never_offloads(self):
+        assert not CalculationPool(max_workers=0, threshold=1).should_offload(10 ** 6)
+        assert not CalculationPool(max_workers=2, threshold=100).should_offload(99)
+        assert CalculationPool(max_workers=2, threshold=100).should_offload(100)
+
+    @pytest.mark.asyncio
+    async def test_evaluate_preserves_order(self):
+        table = CompiledBracketTable.from_brackets(BRACKETS)
+        pool = CalculationPool(max_workers=2, threshold=1, min_chunk_size=3)
+        amounts = [float(a) for a in range(0, 2000, 100)]
+
+        try:
+            results = await pool.evaluate(table, amounts, with_marginal=True)
+        finally:
+            pool.shutdown()
+
+        assert results == [(round(table.tax_for(a), 2), table.marginal_rate(a)) for a in amounts]
+
+    @pytest.mark.asyncio
+    async def test_new_rule_versions_reuse_the_pool(self):
+        pool = CalculationPool(max_workers=1, threshold=1)
+        amounts = [500.0, 1500.0]
+
+        try:
+            first = await pool.evaluate(CompiledBracketTable.from_brackets(BRACKETS), amounts)
+            executor = pool._executor
+            raised = [{**bracket, "rate": bracket["rate"] * 2} for bracket in BRACKETS]
+            second = await pool.evaluate(CompiledBracketTable.from_brackets(raised), amounts)
+            assert pool._executor is executor
+        finally:
+            pool.shutdown()
+
+        assert [tax for tax, _ in first] == [50.0, 200.0]
+        assert [tax for tax, _ in second] == [100.0, 400.0]
@@ -0,0 +1,69 @@
+import pytest
+
+from src.application.services.circuit_breaker import CircuitBreaker, STATE_CLOSED, STATE_HALF_OPEN, STATE_OPEN
+from src.shared.exceptions.base_exceptions import ServiceUnavailableException
+
+
+class FakeClock:
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestCircuitBreaker:
+
+    @pytest.fixture
+    def clock(self):
+        return FakeClock()
+
+    @pytest.fixture
+    def breaker(self, clock):
+        return CircuitBreaker("database", failure_threshold=2, reset_timeout_seconds=5.0, clock=clock)
+
+    def _fail(self, breaker):
+        breaker.before_call()
+        breaker.record_failure()
+
+    def test_opens_after_consecutive_failures(self, breaker):
+        self._fail(breaker)
+        breaker.before_call()
+        breaker.record_success()  # A success in between resets the count
+        self._fail(breaker)
+        assert breaker.state == STATE_CLOSED
+
+        self._fail(breaker)
+        assert breaker.state == STATE_OPEN
+        with pytest.raises(ServiceUnavailableException) as exc_info:
+            breaker.before_call()
+        assert exc_info.value.status_code == 503
+        assert exc_info.value.headers["Retry-After"] == "5"
+        assert breaker.stats()["rejected"] == 1
+
+    def test_half_open_lets_one_trial_through(self, breaker, clock):
+        self._fail(breaker)
+        self._fail(breaker)
+        clock.now += 5
+
+        breaker.before_call()
+        assert breaker.state == STATE_HALF_OPEN
+        with pytest.raises(ServiceUnavailableException):
+            breaker.before_call()  # Only one trial at a time
+
+        breaker.record_success()
+        assert breaker.state == STATE_CLOSED
+        breaker.before_call()
+
+    def test_failed_trial_reopens(self, breaker, clock):
+        self._fail(breaker)
+        self._fail(breaker)
+        clock.now += 5
+
+        self._fail(breaker)
+
+        assert breaker.state == STATE_OPEN
+        assert breaker.stats()["times_opened"] == 2
+        with pytest.raises(ServiceUnavailableException):
+            breaker.before_call()
@@ -0,0 +1,114 @@
+import asyncio
+
+import pytest
+
+from src.application.services.rate_limiter import (
+    BUCKET_BULK,
+    BUCKET_CALCULATE,
+    InMemoryRateLimitBackend,
+    RateLimiter,
+    RateLimitPolicy
+)
+from src.shared.exceptions.base_exceptions import CapacityExceededException
+
+
+class FakeClock:
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class SlowBackend:
+    """Backend whose take() yields to the event loop, as the Redis backend does."""
+
+    def __init__(self, wait=0.0):
+        self.wait = wait
+
+    async def take(self, key, rate, burst):
+        await asyncio.sleep(0)
+        return self.wait
+
+
+class TestRateLimiter:
+
+    @pytest.fixture
+    def clock(self):
+        return FakeClock()
+
+    @pytest.fixture
+    def limiter(self, clock):
+        return RateLimiter(
+            policies={
+                BUCKET_CALCULATE: RateLimitPolicy(requests_per_second=10, burst=3, max_concurrent=10),
+                BUCKET_BULK: RateLimitPolicy(requests_per_second=0.5, burst=1, max_concurrent=1),
+            },
+            backend=InMemoryRateLimitBackend(clock=clock)
+        )
+
+    async def _call(self, limiter, client_id, bucket):
+        await limiter.acquire(client_id, bucket)
+        limiter.release(client_id, bucket)
+
+    @pytest.mark.asyncio
+    async def test_burst_then_refill(self, limiter, clock):
+        for _ in range(3):
+            await self._call(limiter, "user:1", BUCKET_CALCULATE)
+
+        with pytest.raises(CapacityExceededException) as exc_info:
+            await limiter.acquire("user:1", BUCKET_CALCULATE)
+        assert exc_info.value.headers["Retry-After"] == "1"
+
+        clock.now += 0.1
+        await self._call(limiter, "user:1", BUCKET_CALCULATE)
+
+    @pytest.mark.asyncio
+    async def test_clients_and_buckets_are_independent(self, limiter):
+        await self._call(limiter, "user:1", BUCKET_BULK)
+        with pytest.raises(CapacityExceededException) as exc_info:
+            await limiter.acquire("user:1", BUCKET_BULK)
+        assert exc_info.value.headers["Retry-After"] == "2"
+
+        # Exhausting the bulk bucket leaves calculations and other clients alone
+        await self._call(limiter, "user:1", BUCKET_CALCULATE)
+        await self._call(limiter, "user:2", BUCKET_BULK)
+
+    @pytest.mark.asyncio
+    async def test_concurrency_cap_until_release(self, limiter, clock):
+        await limiter.acquire("user:1", BUCKET_BULK)
+        clock.now += 10
+
+        with pytest.raises(CapacityExceededException) as exc_info:
+            await limiter.acquire("user:1", BUCKET_BULK)
+        assert "concurrent" in exc_info.value.detail
+
+        limiter.release("user:1", BUCKET_BULK)
+        await limiter.acquire("user:1", BUCKET_BULK)
+
+    @pytest.mark.asyncio
+    async def test_unlimited_bucket(self, limiter):
+        assert await limiter.acquire("user:1", "rules") is False
+
+    @pytest.mark.asyncio
+    async def test_concurrency_cap_holds_while_the_backend_is_awaited(self):
+        policy = RateLimitPolicy(requests_per_second=100, burst=100, max_concurrent=2)
+        limiter = RateLimiter(policies={BUCKET_BULK: policy}, backend=SlowBackend())
+
+        results = await asyncio.gather(
+            *(limiter.acquire("user:1", BUCKET_BULK) for _ in range(5)), return_exceptions=True
+        )
+
+        assert sum(result is True for result in results) == 2
+        assert all(isinstance(result, CapacityExceededException) for result in results if result is not True)
+
+    @pytest.mark.asyncio
+    async def test_rate_limited_request_gives_back_its_slot(self):
+        policy = RateLimitPolicy(requests_per_second=1, burst=1, max_concurrent=1)
+        limiter = RateLimiter(policies={BUCKET_BULK: policy}, backend=SlowBackend(wait=1.0))
+
+        with pytest.raises(CapacityExceededException) as exc_info:
+            await limiter.acquire("user:1", BUCKET_BULK)
+        assert "Rate limit" in exc_info.value.detail
+        assert limiter._in_flight == {}
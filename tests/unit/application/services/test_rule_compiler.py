@@ -0,0 +1,104 @@
+import pytest
+
+from src.application.services.SalesTaxCalculator import SalesTaxCalculator
+from src.application.services.bracket_table import CompiledBracketTable
+from src.application.services.income_tax_calculator import IncomeTaxCalculator
+from src.application.services.rule_compiler import RuleCompiler
+from src.application.services.withholding_tax_calculator import WithholdingTaxCalculator
+from src.domain.value_objects.residency_status import ResidencyType
+
+
+BRACKETS = [
+    {"min_amount": 0, "max_amount": 500, "rate": 10},
+    {"min_amount": 501, "max_amount": 700, "rate": 12},
+    {"min_amount": 701, "max_amount": None, "rate": 15},
+]
+
+
+class TestCompiledBracketTable:
+
+    def test_tax_matches_bracket_walk(self):
+        table = CompiledBracketTable.from_brackets(BRACKETS)
+
+        assert table.tax_for(400) == pytest.approx(40.0)
+        # 500 at 10%, the 500-501 gap is untaxed, 99 at 12%
+        assert table.tax_for(600) == pytest.approx(61.88)
+        assert table.tax_for(1000) == pytest.approx(50 + 199 * 0.12 + 299 * 0.15)
+
+    def test_marginal_rate(self):
+        table = CompiledBracketTable.from_brackets(BRACKETS)
+
+        assert table.marginal_rate(100) == 0.10
+        assert table.marginal_rate(500.5) == 0.0
+        assert table.marginal_rate(5000) == 0.15
+
+    def test_overlapping_brackets_are_rejected(self):
+        with pytest.raises(ValueError):
+            CompiledBracketTable.from_brackets([
+                {"min_amount": 0, "max_amount": 600, "rate": 10},
+                {"min_amount": 500, "max_amount": None, "rate": 20},
+            ])
+
+    def test_empty_brackets_are_rejected(self):
+        with pytest.raises(ValueError):
+            CompiledBracketTable.from_brackets([])
+
+
+class TestRuleCompiler:
+
+    @pytest.fixture
+    def compiler(self):
+        income = IncomeTaxCalculator()
+        return RuleCompiler(
+            {"income_tax": income, "sales_tax": SalesTaxCalculator()},
+            {"brackets": income, "flat": WithholdingTaxCalculator()}
+        )
+
+    def _rule(self, tax_rule, rule_type="income_tax"):
+        return {"id": 1, "rule_type": rule_type, "version": "2024.1", "tax_rule": tax_rule, "is_active": True}
+
+    def test_every_residency_type_has_a_variant(self, compiler):
+        compiled = compiler.compile(self._rule({"brackets": BRACKETS}))
+
+        assert set(compiled.variants) == set(ResidencyType)
+        assert compiled.variants[ResidencyType.TAX_RESIDENT].calculate(600)["tax_amount"] == 61.88
+        assert compiled.variants[ResidencyType.NON_RESIDENT].calculate(600)["tax_amount"] == 61.88
+
+    def test_non_resident_flat_withholding(self, compiler):
+        compiled = compiler.compile(self._rule({
+            "brackets": BRACKETS,
+            "residency_variants": {"non_resident": {"calculation_type": "flat", "rate": 25}}
+        }))
+
+        result = compiled.variants[ResidencyType.NON_RESIDENT].calculate(1000)
+        assert result["tax_amount"] == 250.0
+
+    def test_partial_resident_is_prorated(self, compiler):
+        compiled = compiler.compile(self._rule({"brackets": [{"min_amount": 0, "max_amount": 1000, "rate": 0},
+                                                             {"min_amount": 1000, "max_amount": None, "rate": 20}]}))
+        variant = compiled.variants[ResidencyType.PARTIAL_RESIDENT]
+
+        assert variant.prorated
+        # Half a year halves the tax-free threshold
+        assert variant.calculate(1000, 0.5)["tax_amount"] == 100.0
+        assert variant.calculate(1000)["tax_amount"] == 0.0
+
+    def test_unknown_rule_type_keeps_rule_servable(self, compiler):
+        compiled = compiler.compile(self._rule({"rate": 1}, rule_type="property_tax"))
+
+        assert compiled.variants == {}
+        assert "property_tax" in compiled.compile_error
+
+    def test_unknown_residency_override(self, compiler):
+        compiled = compiler.compile(self._rule({"brackets": BRACKETS, "residency_variants": {"martian": {}}}))
+
+        assert "martian" in compiled.compile_error
+
+    def test_breakdown_is_only_built_on_request(self, compiler):
+        variant = compiler.compile(self._rule({"brackets": BRACKETS})).variants[ResidencyType.TAX_RESIDENT]
+
+        assert "breakdown" not in variant.calculate(600)
+        assert variant.calculate(600, include_breakdown=True)["breakdown"] == [
+            {"min_amount": 0, "max_amount": 500, "rate": 10.0, "taxable_amount": 500.0, "tax": 50.0},
+            {"min_amount": 501, "max_amount": 700, "rate": 12.0, "taxable_amount": 99.0, "tax": 11.88},
+        ]
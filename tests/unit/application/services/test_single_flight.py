@@ -0,0 +1,60 @@
+import asyncio
+import pytest
+
+from src.application.services.single_flight import SingleFlight
+
+
+class TestSingleFlight:
+
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_share_one_execution(self):
+        single_flight = SingleFlight()
+        calls = []
+        release = asyncio.Event()
+
+        async def load():
+            calls.append(1)
+            await release.wait()
+            return "rule"
+
+        waiters = [asyncio.create_task(single_flight.do("US:income_tax", load)) for _ in range(50)]
+        await asyncio.sleep(0)
+        release.set()
+
+        assert await asyncio.gather(*waiters) == ["rule"] * 50
+        assert len(calls) == 1
+        assert single_flight.in_flight == 0
+
+    @pytest.mark.asyncio
+    async def test_failure_reaches_every_waiter_and_the_next_call_retries(self):
+        single_flight = SingleFlight()
+
+        async def fail():
+            await asyncio.sleep(0)
+            raise RuntimeError("database unavailable")
+
+        results = await asyncio.gather(
+            single_flight.do("key", fail), single_flight.do("key", fail), return_exceptions=True
+        )
+        assert [type(r) for r in results] == [RuntimeError, RuntimeError]
+
+        async def load():
+            return 1
+        assert await single_flight.do("key", load) == 1
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_does_not_cancel_the_load(self):
+        single_flight = SingleFlight()
+        release = asyncio.Event()
+
+        async def load():
+            await release.wait()
+            return "rule"
+
+        first = asyncio.create_task(single_flight.do("key", load))
+        second = asyncio.create_task(single_flight.do("key", load))
+        await asyncio.sleep(0)
+        first.cancel()
+        release.set()
+
+        assert await second == "rule"
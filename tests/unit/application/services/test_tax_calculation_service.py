@@ -0,0 +1,298 @@
+import asyncio
+import threading
+import pytest
+from unittest.mock import AsyncMock, Mock
+
+from src.application.services.tax_calculation_service import TaxCalculationService
+from src.application.services.tax_rule_index import TaxRuleIndex
+from src.domain.value_objects.residency_status import ResidencyStatus
+from src.presentation.api.v1.schemas.request.scenario_request import TaxScenarioRequest
+from src.shared.exceptions.base_exceptions import BusinessException, ServiceUnavailableException, ValidationException
+
+
+def _rule(country_code, version, rate):
+    return {
+        "id": 1,
+        "country_code": country_code,
+        "rule_type": "income_tax",
+        "version": version,
+        "tax_rule": {"brackets": [{"min_amount": 0, "max_amount": None, "rate": rate}]},
+        "is_active": True,
+    }
+
+
+class TestTaxCalculationService:
+
+    @pytest.fixture
+    def mock_repository(self):
+        repository = Mock()
+        rules = {"US": _rule("US", "2024.1", 10), "GB": _rule("GB", "2024.2", 20)}
+        repository.get_active_tax_rule.side_effect = lambda rule_type, country: rules.get(country)
+        repository.get_active_tax_rules.side_effect = lambda rule_type, countries: {
+            c: rules[c] for c in countries if c in rules
+        }
+        return repository
+
+    @pytest.fixture
+    def service(self, mock_repository):
+        return TaxCalculationService(mock_repository, default_country_code="US", rule_index=TaxRuleIndex())
+
+    @pytest.mark.asyncio
+    async def test_calculate_tax_uses_default_country(self, service, mock_repository):
+        result = await service.calculate_tax(1000.0, "income_tax")
+
+        assert result.tax_amount == 100.0
+        assert result.country_code == "US"
+        mock_repository.get_active_tax_rule.assert_called_once_with("income_tax", "US")
+
+    @pytest.mark.asyncio
+    async def test_calculate_tax_is_served_from_index(self, service, mock_repository):
+        await service.calculate_tax(1000.0, "income_tax", country_code="gb")
+        result = await service.calculate_tax(1000.0, "income_tax", country_code="GB")
+
+        assert result.tax_amount == 200.0
+        assert result.rule_version == "2024.2"
+        assert mock_repository.get_active_tax_rule.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_calculate_tax_rejects_invalid_country(self, service):
+        with pytest.raises(ValidationException):
+            await service.calculate_tax(1000.0, "income_tax", country_code="USA")
+
+    @pytest.mark.asyncio
+    async def test_multi_jurisdiction_loads_misses_in_one_query(self, service, mock_repository):
+        await service.calculate_tax(1000.0, "income_tax", country_code="US")
+
+        results = await service.calculate_tax_multi_jurisdiction(1000.0, "income_tax", ["US", "GB", "us"])
+
+        assert [(r.country_code, r.tax_amount) for r in results] == [("US", 100.0), ("GB", 200.0)]
+        mock_repository.get_active_tax_rules.assert_called_once_with("income_tax", ["GB"])
+
+    @pytest.mark.asyncio
+    async def test_multi_jurisdiction_missing_rule(self, service):
+        with pytest.raises(BusinessException) as exc_info:
+            await service.calculate_tax_multi_jurisdiction(1000.0, "income_tax", ["US", "FR"])
+
+        assert "FR" in exc_info.value.detail
+
+    @pytest.mark.asyncio
+    async def test_partial_resident_requires_days_resident(self, service):
+        with pytest.raises(ValidationException):
+            await service.calculate_tax(
+                1000.0, "income_tax", residency=ResidencyStatus.partial_resident()
+            )
+
+    @pytest.mark.asyncio
+    async def test_partial_resident_is_prorated(self, service, mock_repository):
+        mock_repository.get_active_tax_rule.side_effect = lambda rule_type, country: {
+            **_rule(country, "2024.1", 0),
+            "tax_rule": {"brackets": [{"min_amount": 0, "max_amount": 730, "rate": 0},
+                                      {"min_amount": 730, "max_amount": None, "rate": 10}]},
+        }
+
+        result = await service.calculate_tax(
+            1000.0, "income_tax", residency=ResidencyStatus.partial_resident(), days_resident=73
+        )
+
+        # 73 days is a fifth of the year, so the tax-free threshold drops to 146
+        assert result.tax_amount == 85.4
+        assert result.residency == "partial_resident"
+
+    @pytest.mark.asyncio
+    async def test_calculate_scenarios(self, service, mock_repository):
+        mock_repository.get_active_tax_rule.side_effect = lambda rule_type, country: {
+            **_rule(country, "2024.1", 0),
+            "tax_rule": {"brackets": [{"min_amount": 0, "max_amount": 1000, "rate": 10},
+                                      {"min_amount": 1000, "max_amount": None, "rate": 20}]},
+        }
+        amounts = TaxScenarioRequest(start=500, stop=1500, step=500).amounts()
+
+        result = await service.calculate_scenarios(amounts, "income_tax")
+
+        assert [(p.amount, p.tax_amount, p.marginal_rate, p.effective_rate) for p in result.points] == [
+            (500.0, 50.0, 10.0, 10.0),
+            (1000.0, 100.0, 20.0, 10.0),
+            (1500.0, 200.0, 20.0, 13.33),
+        ]
+        assert mock_repository.get_active_tax_rule.call_count == 1
+
+    def test_scenario_request_requires_one_form(self):
+        with pytest.raises(ValueError):
+            TaxScenarioRequest(base_amount=1000, deltas=[1], start=0, stop=10, step=1)
+
+        assert TaxScenarioRequest(base_amount=1000, deltas=[100, -100]).amounts() == [1000.0, 1100.0, 900.0]
+
+    @pytest.mark.asyncio
+    async def test_calculate_gross_from_net(self, service, mock_repository):
+        mock_repository.get_active_tax_rule.side_effect = lambda rule_type, country: {
+            **_rule(country, "2024.1", 0),
+            "tax_rule": {"brackets": [{"min_amount": 0, "max_amount": 500, "rate": 10},
+                                      {"min_amount": 501, "max_amount": 700, "rate": 12},
+                                      {"min_amount": 701, "max_amount": None, "rate": 15}]},
+        }
+
+        result = await service.calculate_gross_from_net([450.0, 450.5, 1234.56], "income_tax")
+
+        for item in result.results:
+            forward = await service.calculate_tax(item.gross_amount, "income_tax")
+            assert forward.tax_amount == item.tax_amount
+            assert round(item.gross_amount - item.tax_amount, 2) == item.net_amount
+        assert [r.gross_amount for r in result.results][:2] == [500.0, 500.5]
+
+    @pytest.mark.asyncio
+    async def test_calculations_are_audited(self, mock_repository):
+        audit_log = Mock(record=AsyncMock())
+        service = TaxCalculationService(mock_repository, rule_index=TaxRuleIndex(), audit_log=audit_log)
+
+        await service.calculate_tax(1000.0, "income_tax")
+        await service.calculate_batch([100.0, 200.0], "income_tax", country_code="GB")
+
+        entries = [call.args[0] for call in audit_log.record.call_args_list]
+        assert [(e.operation, e.country_code, e.rule_version, list(e.amounts), list(e.tax_amounts))
+                for e in entries] == [
+            ("calculate", "US", "2024.1", [1000.0], [100.0]),
+            ("batch", "GB", "2024.2", [100.0, 200.0], [20.0, 40.0]),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_active_rule_etag_is_served_from_index(self, service, mock_repository):
+        await service.calculate_tax(1000.0, "income_tax", country_code="GB")
+
+        assert await service.get_active_rule_etag("income_tax", "gb") == 'W/"GB-1-2024.2"'
+        assert mock_repository.get_active_tax_rule.call_count == 1
+        assert await service.get_active_rule_etag("income_tax", "FR") is None
+
+    @pytest.mark.asyncio
+    async def test_rule_listing_projection_is_pushed_to_repository(self, service, mock_repository):
+        mock_repository.get_all_versions.return_value = [
+            {"country_code": "US", "version": "2024.1", "id": 1, "is_active": True}
+        ]
+
+        rules = await service.get_available_rules_projection(["country_code", "version"])
+
+        assert rules == [{"country_code": "US", "version": "2024.1"}]
+        mock_repository.get_all_versions.assert_called_once_with(
+            fields=["country_code", "version", "id", "is_active"]
+        )
+        assert service.get_rules_catalog_etag().startswith('W/"rules-')
+
+        with pytest.raises(ValidationException):
+            await service.get_available_rules_projection(["country_code", "secret"])
+
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_share_one_query(self, service, mock_repository):
+        results = await asyncio.gather(*[
+            service.calculate_tax(1000.0, "income_tax", country_code="US") for _ in range(20)
+        ])
+
+        assert {r.tax_amount for r in results} == {100.0}
+        assert mock_repository.get_active_tax_rule.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_batch_lookup_after_rule_creation_does_not_join_older_load(self, service, mock_repository):
+        released = threading.Event()
+        rules = {"GB": _rule("GB", "2024.2", 20)}
+
+        def get_active_tax_rules(rule_type, countries):
+            if mock_repository.get_active_tax_rules.call_count == 1:
+                released.wait(5)
+                return {"GB": _rule("GB", "2024.2", 20)}
+            return {c: rules[c] for c in countries if c in rules}
+
+        mock_repository.get_active_tax_rules.side_effect = get_active_tax_rules
+        before = asyncio.create_task(service.calculate_tax_multi_jurisdiction(1000.0, "income_tax", ["GB"]))
+        while mock_repository.get_active_tax_rules.call_count == 0:
+            await asyncio.sleep(0.01)
+
+        rules["GB"] = _rule("GB", "2025.1", 25)
+        mock_repository.create_rule.return_value = rules["GB"]
+        await service.create_tax_rule("income_tax", "2025.1", None, rules["GB"]["tax_rule"], True, "admin", "GB")
+        after = await service.calculate_tax_multi_jurisdiction(1000.0, "income_tax", ["GB"])
+        released.set()
+
+        assert [r.tax_amount for r in after] == [250.0]
+        assert [r.tax_amount for r in await before] == [200.0]
+        # The older load finished last but did not overwrite the new rule
+        assert (await service.calculate_tax(1000.0, "income_tax", country_code="GB")).tax_amount == 250.0
+        assert mock_repository.get_active_tax_rules.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_batch_load_drops_deactivated_rules_from_the_index(self, service, mock_repository):
+        compiled = service.rule_compiler.compile(_rule("GB", "2024.2", 20))
+
+        def deactivated_while_loading(rule_type, countries):
+            # A single-rule load cached GB before the batch query saw it deactivated
+            service.rule_index.put("GB", rule_type, compiled)
+            return {}
+
+        mock_repository.get_active_tax_rules.side_effect = deactivated_while_loading
+
+        with pytest.raises(BusinessException):
+            await service.calculate_tax_multi_jurisdiction(1000.0, "income_tax", ["GB"])
+        assert service.rule_index.get("GB", "income_tax") is None
+
+    def test_rule_dtos_ignore_the_environment(self, monkeypatch):
+        from pydantic import ValidationError
+        from src.application.mappers.tax_rule_mapper import TaxRuleMapper
+        from src.presentation.api.v1.schemas.request.rule_creation_request import TaxRuleCreateRequest
+
+        monkeypatch.setenv("VERSION", "from-env")
+        response = TaxRuleMapper.to_tax_rule_response(TaxRuleMapper.from_dict(_rule("US", "2024.1", 10)))
+        assert (response.id, response.version, response.country_code) == (1, "2024.1", "US")
+
+        with pytest.raises(ValidationError):
+            TaxRuleCreateRequest(rule_type="income_tax", tax_date="2024-01-01T00:00:00", tax_rule={})
+        with pytest.raises(ValidationError):
+            TaxRuleCreateRequest(
+                rule_type="income_tax", version="2024.1", tax_date="2024-01-01T00:00:00", tax_rule={}, is_active="yes"
+            )
+
+    @pytest.mark.asyncio
+    async def test_warmed_index_serves_without_queries(self, service, mock_repository):
+        mock_repository.get_all_active_rules.return_value = [_rule("US", "2024.1", 10), _rule("GB", "2024.2", 20)]
+
+        assert service.warm_rule_index() == 2
+        result = await service.calculate_tax(1000.0, "income_tax", country_code="GB")
+
+        assert result.tax_amount == 200.0
+        mock_repository.get_active_tax_rule.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_columns_match_batch(self, service):
+        np = pytest.importorskip("numpy")
+        amounts = [0.0, 100.004, 2500.0, 123456.78]
+
+        batch = await service.calculate_batch(amounts, "income_tax", country_code="GB")
+        columns = await service.calculate_columns(np.array(amounts), "income_tax", country_code="GB")
+
+        assert columns["tax_amount"].tolist() == batch.tax_amounts
+        assert columns["effective_rate"].tolist() == [0.0, 20.0, 20.0, 20.0]
+        assert columns["rule_version"] == "2024.2"
+        with pytest.raises(ValidationException):
+            await service.calculate_columns(np.array([1.0, np.nan]), "income_tax")
+
+    @pytest.mark.asyncio
+    async def test_expired_rule_is_served_stale_while_revalidating(self, mock_repository):
+        rule_index = TaxRuleIndex(ttl_seconds=0.0, max_stale_seconds=60.0)
+        service = TaxCalculationService(mock_repository, rule_index=rule_index)
+        await service.calculate_tax(1000.0, "income_tax", country_code="GB")
+        mock_repository.get_active_tax_rule.side_effect = ServiceUnavailableException("database is unavailable")
+
+        result = await service.calculate_tax(1000.0, "income_tax", country_code="GB")
+        while service.rule_cache_stats()["revalidations_running"]:
+            await asyncio.sleep(0.01)
+
+        assert result.tax_amount == 200.0
+        assert result.rule_stale_seconds is not None
+        assert mock_repository.get_active_tax_rule.call_count == 2
+        assert service.rule_cache_stats()["revalidation_failures"] == 1
+
+    @pytest.mark.asyncio
+    async def test_stale_window_bounds_staleness(self, mock_repository):
+        rule_index = TaxRuleIndex(ttl_seconds=0.0, max_stale_seconds=0.0)
+        service = TaxCalculationService(mock_repository, rule_index=rule_index)
+        await service.calculate_tax(1000.0, "income_tax", country_code="GB")
+        mock_repository.get_active_tax_rule.side_effect = ServiceUnavailableException("database is unavailable")
+
+        with pytest.raises(ServiceUnavailableException):
+            await service.calculate_tax(1000.0, "income_tax", country_code="GB")
@@ -0,0 +1,152 @@
+import asyncio
+import io
+import json
+
+import pytest
+
+from src.application.services.tracing import (
+    STATUS_ERROR,
+    ConsoleSpanExporter,
+    FileSpanExporter,
+    SpanContext,
+    Tracer,
+    format_traceparent,
+    parse_traceparent
+)
+
+TRACEPARENT = "00-4bf92f3577b34da6a3ce929d0e0e4736-00f067aa0ba902b7-01"
+
+
+class RecordingExporter:
+    def __init__(self):
+        self.batches = []
+
+    def export(self, spans):
+        self.batches.append(list(spans))
+
+    def shutdown(self):
+        pass
+
+
+class TestTraceparent:
+
+    def test_round_trip(self):
+        context = parse_traceparent(TRACEPARENT)
+
+        assert context == SpanContext(0x4bf92f3577b34da6a3ce929d0e0e4736, 0x00f067aa0ba902b7, True)
+        assert format_traceparent(context) == TRACEPARENT
+
+    @pytest.mark.parametrize("value", [
+        None,
+        "",
+        "00-4bf92f3577b34da6a3ce929d0e0e4736-00f067aa0ba902b7",
+        "00-00000000000000000000000000000000-00f067aa0ba902b7-01",
+        "ff-4bf92f3577b34da6a3ce929d0e0e4736-00f067aa0ba902b7-01",
+        "00-4bf92f3577b34da6a3ce929d0e0e473g-00f067aa0ba902b7-01",
+    ])
+    def test_malformed_headers_are_ignored(self, value):
+        assert parse_traceparent(value) is None
+
+
+class TestTracer:
+
+    @pytest.fixture
+    def exporter(self):
+        return RecordingExporter()
+
+    def _tracer(self, exporter, sample_ratio):
+        tracer = Tracer()
+        tracer.configure(exporter, sample_ratio)
+        return tracer
+
+    def test_trace_is_exported_when_its_root_ends(self, exporter):
+        tracer = self._tracer(exporter, 1.0)
+
+        with tracer.start_span("request") as root:
+            with tracer.start_span("service") as service:
+                with tracer.start_span("repository") as repository:
+                    pass
+            assert exporter.batches == []
+
+        [batch] = exporter.batches
+        assert [span.name for span in batch] == ["repository", "service", "request"]
+        assert repository.parent_span_id == service.context.span_id
+        assert service.parent_span_id == root.context.span_id
+        assert {span.context.trace_id for span in batch} == {root.context.trace_id}
+
+    def test_unsampled_traces_create_no_spans(self, exporter):
+        tracer = self._tracer(exporter, 0.0)
+
+        with tracer.start_span("request") as root:
+            with tracer.start_span("service") as service:
+                assert root is None and service is None
+        assert exporter.batches == []
+
+    def test_caller_decides_sampling(self, exporter):
+        tracer = self._tracer(exporter, 0.0)
+        parent = parse_traceparent(TRACEPARENT)
+
+        with tracer.start_span("request", parent=parent) as span:
+            pass
+
+        assert span.context.trace_id == parent.trace_id
+        assert span.parent_span_id == parent.span_id
+
+        with tracer.start_span("request", parent=parent._replace(sampled=False)) as span:
+            assert span is None
+
+    @pytest.mark.asyncio
+    async def test_spans_follow_work_into_threads(self, exporter):
+        tracer = self._tracer(exporter, 1.0)
+
+        def query():
+            with tracer.start_span("repository") as span:
+                return span
+
+        with tracer.start_span("service") as service:
+            repository = await asyncio.to_thread(query)
+
+        assert repository.parent_span_id == service.context.span_id
+        assert len(exporter.batches) == 1
+
+    def test_exceptions_mark_the_span_as_failed(self, exporter):
+        tracer = self._tracer(exporter, 1.0)
+
+        with pytest.raises(ValueError):
+            with tracer.start_span("calculator.calculate"):
+                raise ValueError("no brackets")
+
+        [[span]] = exporter.batches
+        assert span.status == STATUS_ERROR
+        assert span.attributes["exception.type"] == "ValueError"
+
+
+class TestExporters:
+
+    def test_spans_are_written_as_otlp_json(self, tmp_path):
+        tracer = Tracer()
+        tracer.configure(FileSpanExporter(str(tmp_path / "traces.jsonl"), service_name="tax"), 1.0)
+
+        with tracer.start_span("request", parent=parse_traceparent(TRACEPARENT), attributes={"http.response.status_code": 200}):
+            pass
+        tracer.shutdown()
+
+        [line] = (tmp_path / "traces.jsonl").read_text().splitlines()
+        resource_spans = json.loads(line)["resourceSpans"][0]
+        [span] = resource_spans["scopeSpans"][0]["spans"]
+        assert resource_spans["resource"]["attributes"] == [{"key": "service.name", "value": {"stringValue": "tax"}}]
+        assert span["traceId"] == "4bf92f3577b34da6a3ce929d0e0e4736"
+        assert span["parentSpanId"] == "00f067aa0ba902b7"
+        assert span["attributes"] == [{"key": "http.response.status_code", "value": {"intValue": "200"}}]
+
+    def test_console_exporter_writes_one_line_per_trace(self):
+        stream = io.StringIO()
+        tracer = Tracer()
+        tracer.configure(ConsoleSpanExporter(stream), 1.0)
+
+        with tracer.start_span("request"):
+            with tracer.start_span("service"):
+                pass
+
+        [line] = stream.getvalue().splitlines()
+        assert len(json.loads(line)["resourceSpans"][0]["scopeSpans"][0]["spans"]) == 2
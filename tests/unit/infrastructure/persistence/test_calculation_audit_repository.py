@@ -0,0 +1,91 @@
+from contextlib import contextmanager
+from datetime import datetime
+from unittest.mock import Mock
+
+import pytest
+
+from src.application.services.audit_log import AuditEntry
+from src.infrastructure.persistence.database.repositories.calculation_audit_repository_impl import (
+    CalculationAuditRepositoryImpl
+)
+
+
+def _entry(calculated_at):
+    return AuditEntry(calculated_at, "calculate", "income_tax", "US", "tax_resident", None, "2024.1", [100.0], [10.0])
+
+
+class FakePostgres:
+    """Transactional stand-in for PostgreSQL: partition DDL and copied rows are kept only on commit."""
+
+    def __init__(self, driver="psycopg2"):
+        self.driver = driver
+        self.partitions = set()
+        self.rows = []
+        self.copy_failures = 0
+
+    @contextmanager
+    def get_session(self):
+        pending_partitions, pending_rows = set(), []
+        session = Mock()
+        session.execute.side_effect = lambda statement: pending_partitions.add(str(statement).split()[5])
+        connection = session.connection.return_value
+        connection.dialect.name = "postgresql"
+        connection.dialect.driver = self.driver
+        connection.connection.dbapi_connection.cursor.side_effect = lambda: self._cursor(
+            pending_partitions, pending_rows
+        )
+        yield session
+        self.partitions |= pending_partitions
+        self.rows += pending_rows
+
+    def _cursor(self, pending_partitions, pending_rows):
+        def copy(data):
+            if self.copy_failures:
+                self.copy_failures -= 1
+                raise RuntimeError("connection reset during COPY")
+            if not (self.partitions | pending_partitions):
+                raise RuntimeError("no partition of relation found for row")
+            pending_rows.extend(data.splitlines())
+
+        if self.driver == "psycopg":
+            @contextmanager
+            def copy_writer(statement):
+                writer = Mock(spec=["write"])
+                writer.write.side_effect = copy
+                yield writer
+
+            cursor = Mock(spec=["copy", "close"])
+            cursor.copy.side_effect = copy_writer
+            return cursor
+
+        cursor = Mock(spec=["copy_expert", "close"])
+        cursor.copy_expert.side_effect = lambda statement, buffer: copy(buffer.read())
+        return cursor
+
+
+class TestCalculationAuditRepository:
+
+    @pytest.fixture
+    def database(self):
+        return FakePostgres()
+
+    def test_partition_of_a_failed_copy_is_created_again_on_retry(self, database):
+        repository = CalculationAuditRepositoryImpl(database)
+        entries = [_entry(datetime(2024, 3, 5))]
+        database.copy_failures = 1
+
+        with pytest.raises(RuntimeError):
+            repository.insert_entries(entries)
+        assert database.partitions == set()
+
+        assert repository.insert_entries(entries) == 1
+        assert database.partitions == {"calculation_audit_log_y2024m03"}
+        assert len(database.rows) == 1
+
+    def test_rows_are_copied_with_psycopg_3(self):
+        database = FakePostgres(driver="psycopg")
+        repository = CalculationAuditRepositoryImpl(database)
+
+        assert repository.insert_entries([_entry(datetime(2024, 3, 5)), _entry(datetime(2024, 4, 1))]) == 2
+        assert database.partitions == {"calculation_audit_log_y2024m03", "calculation_audit_log_y2024m04"}
+        assert [row.split(",")[-2:] for row in database.rows] == [["100.0", "10.0"], ["100.0", "10.0"]]
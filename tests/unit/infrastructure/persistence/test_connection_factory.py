@@ -0,0 +1,62 @@
+import pytest
+from unittest.mock import Mock
+from sqlalchemy import exc
+
+from src.application.services.circuit_breaker import CircuitBreaker, STATE_OPEN
+from src.infrastructure.persistence.database.config.connection_factory import ConnectionFactory
+from src.shared.exceptions.base_exceptions import ServiceUnavailableException
+
+
+class TestConnectionFactoryCircuitBreaker:
+
+    @pytest.fixture
+    def factory(self):
+        factory = ConnectionFactory(circuit_breaker=CircuitBreaker("database", failure_threshold=2))
+        factory.db_config = Mock()
+        return factory
+
+    def _query(self, factory, error):
+        with pytest.raises(type(error)):
+            with factory.get_session():
+                raise error
+
+    def test_connection_failures_open_the_circuit(self, factory):
+        lost = exc.OperationalError("SELECT 1", {}, Exception("server closed the connection"))
+        self._query(factory, lost)
+        self._query(factory, lost)
+
+        assert factory.circuit_breaker.state == STATE_OPEN
+        with pytest.raises(ServiceUnavailableException):
+            with factory.get_session():
+                pass
+        assert factory.db_config.SessionLocal.call_count == 2
+
+    def test_statement_errors_do_not_count(self, factory):
+        duplicate = exc.IntegrityError("INSERT", {}, Exception("duplicate key"))
+        for _ in range(3):
+            self._query(factory, duplicate)
+
+        assert factory.circuit_breaker.stats()["consecutive_failures"] == 0
+
+    def test_read_connection_failures_open_the_circuit(self, factory):
+        primary = factory.db_config.router.primary
+        factory.db_config.router.engine_for_read.return_value = primary
+        primary.connect.side_effect = exc.OperationalError("SELECT 1", {}, Exception("connection refused"))
+        for _ in range(2):
+            with pytest.raises(exc.OperationalError):
+                with factory.get_read_connection():
+                    pass
+
+        assert factory.circuit_breaker.state == STATE_OPEN
+
+    def test_failing_replica_is_skipped_without_opening_the_circuit(self, factory):
+        replica = Mock()
+        replica.connect.side_effect = exc.OperationalError("SELECT 1", {}, Exception("connection refused"))
+        factory.db_config.router.engine_for_read.return_value = replica
+        for _ in range(2):
+            with pytest.raises(exc.OperationalError):
+                with factory.get_read_connection():
+                    pass
+
+        factory.db_config.router.mark_unavailable.assert_called_with(replica)
+        assert factory.circuit_breaker.stats()["consecutive_failures"] == 0
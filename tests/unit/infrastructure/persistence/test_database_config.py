@@ -0,0 +1,49 @@
+import os
+import pytest
+
+from src.infrastructure.configuration.app_settings import settings
+from src.infrastructure.persistence.database.config.database_config import DatabaseConfig
+
+
+class TestDatabaseConfig:
+
+    def test_engine_is_created_on_first_use(self):
+        config = DatabaseConfig()
+        assert config._engine is None
+
+        session_factory = config.SessionLocal
+        assert config._engine is not None
+        assert session_factory.kw["bind"] is config.engine
+
+    def test_fork_replaces_the_inherited_pool(self):
+        config = DatabaseConfig()
+        inherited_pool = config.engine.pool
+
+        config.reset_after_fork()
+
+        assert config.engine.pool is not inherited_pool
+
+    @pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork")
+    def test_forked_child_resets_pools(self):
+        config = DatabaseConfig()
+        inherited_pool = config.engine.pool
+
+        read_fd, write_fd = os.pipe()
+        pid = os.fork()
+        if pid == 0:  # pragma: no cover - child process
+            os.write(write_fd, b"1" if config.engine.pool is not inherited_pool else b"0")
+            os._exit(0)
+        os.waitpid(pid, 0)
+        assert os.read(read_fd, 1) == b"1"
+        assert config.engine.pool is inherited_pool
+
+    def test_reads_go_to_the_primary_without_replicas(self):
+        config = DatabaseConfig()
+
+        assert config.router.engine_for_read() is config.engine
+
+    def test_replica_engines_follow_the_settings(self, monkeypatch):
+        monkeypatch.setattr(settings, "db_replica_urls", "sqlite:///replica-a.db, sqlite:///replica-b.db")
+        config = DatabaseConfig()
+
+        assert [str(e.url) for e in config.router.replica_engines] == ["sqlite:///replica-a.db", "sqlite:///replica-b.db"]
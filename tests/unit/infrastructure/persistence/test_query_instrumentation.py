@@ -0,0 +1,76 @@
+import logging
+
+import pytest
+from sqlalchemy import create_engine, text
+
+from src.application.services.query_metrics import QueryCost, QueryMetrics, current_query_cost
+from src.infrastructure.persistence.database.config.query_instrumentation import (
+    instrument_engine,
+    instrumented_repository,
+    redact_parameters
+)
+
+
+@instrumented_repository
+class NumberRepository:
+
+    def __init__(self, engine):
+        self.engine = engine
+
+    def numbers(self, limit):
+        with self.engine.connect() as connection:
+            return connection.execute(text("SELECT value FROM numbers LIMIT :limit"), {"limit": limit}).all()
+
+    def stream(self):
+        with self.engine.connect() as connection:
+            for row in connection.execute(text("SELECT value FROM numbers")):
+                yield row.value
+
+
+class TestQueryInstrumentation:
+
+    @pytest.fixture
+    def metrics(self):
+        return QueryMetrics()
+
+    @pytest.fixture
+    def engine(self, metrics):
+        engine = create_engine("sqlite://")
+        with engine.begin() as connection:
+            connection.execute(text("CREATE TABLE numbers (value INTEGER)"))
+            connection.execute(text("INSERT INTO numbers VALUES (1), (2), (3)"))
+        instrument_engine(engine, metrics, slow_query_seconds=None)
+        return engine
+
+    def test_queries_are_attributed_to_the_repository_method(self, engine, metrics):
+        repository = NumberRepository(engine)
+        cost = QueryCost()
+        token = current_query_cost.set(cost)
+        try:
+            repository.numbers(2)
+            assert list(repository.stream()) == [1, 2, 3]
+        finally:
+            current_query_cost.reset(token)
+
+        assert cost.queries == 2
+        assert set(cost.stats()["methods"]) == {"NumberRepository.numbers", "NumberRepository.stream"}
+        assert metrics.stats()["methods"]["NumberRepository.numbers"]["queries"] == 1
+        assert cost.server_timing().startswith('db;dur=')
+        assert 'db.' not in cost.server_timing()
+        assert 'db.NumberRepository.stream;dur=' in cost.server_timing(detailed=True)
+
+    def test_slow_queries_are_logged_with_redacted_parameters(self, metrics, caplog):
+        engine = create_engine("sqlite://")
+        instrument_engine(engine, metrics, slow_query_seconds=1e-9)
+
+        with caplog.at_level(logging.WARNING), engine.connect() as connection:
+            connection.execute(text("SELECT :country, :amount"), {"country": "US", "amount": 85000.0})
+
+        assert metrics.stats()["slow_queries"] == 1
+        assert "85000" not in caplog.text and "'US'" not in caplog.text
+        assert "<float>" in caplog.text
+
+    def test_redact_parameters(self):
+        assert redact_parameters({"codes": ["US", "GB"], "limit": 5}) == {"codes": "<list[2]>", "limit": "<int>"}
+        assert redact_parameters(("US", None)) == ["<str>", "None"]
+        assert redact_parameters([{"a": 1}, {"a": 2}], executemany=True) == "2 x {'a': '<int>'}"
@@ -0,0 +1,82 @@
+import pytest
+from unittest.mock import Mock
+
+from src.infrastructure.persistence.database.config.replica_router import ReplicaRouter, database_client
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestReplicaRouter:
+
+    @pytest.fixture
+    def clock(self):
+        return FakeClock()
+
+    @pytest.fixture
+    def lags(self, monkeypatch):
+        lags = {}
+        monkeypatch.setattr(ReplicaRouter, "_measure_lag", staticmethod(lambda engine: lags.get(engine, 0.0)))
+        return lags
+
+    @pytest.fixture
+    def router(self, clock, lags):
+        return ReplicaRouter(
+            Mock(name="primary"), [Mock(name="replica-a"), Mock(name="replica-b")],
+            max_lag_seconds=5.0, lag_check_interval_seconds=5.0, read_your_writes_seconds=10.0, clock=clock
+        )
+
+    def test_reads_rotate_over_the_replicas(self, router):
+        engines = [router.engine_for_read() for _ in range(4)]
+
+        assert engines == router.replica_engines * 2
+        assert router.stats()["replica_reads"] == 4
+
+    def test_lagging_replica_is_skipped_after_the_next_check(self, router, clock, lags):
+        replica_a, replica_b = router.replica_engines
+        router.engine_for_read()
+        lags[replica_a] = 30.0
+        clock.now += 5.0
+
+        assert {router.engine_for_read() for _ in range(3)} == {replica_b}
+
+        lags[replica_b] = None
+        clock.now += 5.0
+        assert router.engine_for_read() is router.primary
+
+    def test_writer_reads_from_the_primary(self, router, clock):
+        token = database_client.set("user:1")
+        try:
+            router.record_write("user:1")
+            clock.now += 6.0  # Past the lag bound every client waits out
+            assert router.engine_for_read() is router.primary
+
+            database_client.set("user:2")
+            assert router.engine_for_read() in router.replica_engines
+
+            database_client.set("user:1")
+            clock.now += 5.0
+            assert router.engine_for_read() in router.replica_engines
+        finally:
+            database_client.reset(token)
+
+    def test_any_write_pins_reads_for_the_lag_bound(self, router, clock):
+        router.record_write()
+
+        assert router.engine_for_read() is router.primary
+        clock.now += 5.0
+        assert router.engine_for_read() in router.replica_engines
+
+    def test_unavailable_replica_waits_for_its_next_check(self, router, clock):
+        replica_a, replica_b = router.replica_engines
+        router.engine_for_read()
+        router.mark_unavailable(replica_a)
+
+        assert {router.engine_for_read() for _ in range(3)} == {replica_b}
+        clock.now += 5.0
+        assert {router.engine_for_read() for _ in range(4)} == {replica_a, replica_b}
@@ -0,0 +1,25 @@
+from sqlalchemy import create_engine, inspect, text
+
+from src.infrastructure.configuration.app_settings import settings
+from src.infrastructure.persistence.database.config.schema_upgrades import upgrade_schema
+
+
+class TestSchemaUpgrades:
+
+    def test_rules_without_a_country_are_backfilled(self):
+        engine = create_engine("sqlite://")
+        with engine.begin() as connection:
+            connection.execute(text(
+                "CREATE TABLE tax_rules (id INTEGER PRIMARY KEY, rule_type VARCHAR(50), is_active BOOLEAN)"
+            ))
+            connection.execute(text("INSERT INTO tax_rules (rule_type, is_active) VALUES ('income_tax', 1)"))
+
+        assert upgrade_schema(engine) == ["tax_rules.country_code"]
+
+        with engine.connect() as connection:
+            assert connection.execute(text("SELECT country_code FROM tax_rules")).scalar() == settings.default_country_code
+        assert "ix_tax_rules_country_type_active" in {i["name"] for i in inspect(engine).get_indexes("tax_rules")}
+        assert upgrade_schema(engine) == []
+
+    def test_missing_tables_are_left_to_create_all(self):
+        assert upgrade_schema(create_engine("sqlite://")) == []
@@ -0,0 +1,61 @@
+from contextlib import contextmanager
+from unittest.mock import Mock
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from src.infrastructure.persistence.database.repositories import tax_rule_repository_impl
+from src.infrastructure.persistence.database.repositories.tax_rule_repository_impl import TaxRuleRepositoryImpl
+
+
+def _row(country, rule_type="income_tax", version="2024.1"):
+    return {
+        "id": 1, "country_code": country, "rule_type": rule_type,
+        "version": version, "tax_rule": {"brackets": []}, "is_active": True
+    }
+
+
+class TestTaxRuleRepositoryReadPath:
+
+    @pytest.fixture
+    def connection(self):
+        return Mock()
+
+    @pytest.fixture
+    def repository(self, connection):
+        factory = Mock()
+
+        @contextmanager
+        def read_connection():
+            yield connection
+
+        factory.get_read_connection = read_connection
+        return TaxRuleRepositoryImpl(factory)
+
+    def test_lookup_selects_only_the_columns_the_calculators_read(self):
+        sql = str(tax_rule_repository_impl._ACTIVE_RULE.compile(dialect=postgresql.dialect()))
+        columns = sql.split(" FROM ")[0]
+
+        assert "tax_rule" in columns and "tax_date" not in columns and "rule_definition" not in columns
+        assert "LIMIT" in sql
+
+    def test_active_rule_uses_the_prebuilt_statement_on_a_read_connection(self, repository, connection):
+        connection.execute.return_value.mappings.return_value.first.return_value = _row("US")
+
+        rule = repository.get_active_tax_rule("income_tax", "US")
+
+        assert rule == _row("US")
+        connection.execute.assert_called_once_with(
+            tax_rule_repository_impl._ACTIVE_RULE, {"country_code": "US", "rule_type": "income_tax"}
+        )
+        repository.connection_factory.get_session.assert_not_called()
+
+    def test_active_rules_keep_the_newest_per_country(self, repository, connection):
+        connection.execute.return_value.mappings.return_value = [
+            _row("US", version="2024.2"), _row("GB"), _row("US", version="2024.1")
+        ]
+
+        rules = repository.get_active_tax_rules("income_tax", ["US", "GB"])
+
+        assert rules["US"]["version"] == "2024.2"
+        assert set(rules) == {"US", "GB"}
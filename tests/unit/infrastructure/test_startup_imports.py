@@ -0,0 +1,12 @@
+import subprocess
+import sys
+
+# Loaded on first use or in the lifespan, never by importing the app
+LAZY_MODULES = ("sqlalchemy", "psycopg2", "jwt", "multiprocessing", "numpy", "pyarrow")
+
+
+def test_importing_the_app_defers_heavy_modules():
+    probe = f"import sys, src.main; print(','.join(m for m in {LAZY_MODULES!r} if m in sys.modules))"
+    completed = subprocess.run([sys.executable, "-c", probe], capture_output=True, text=True, check=True)
+
+    assert completed.stdout.strip() == ""
@@ -0,0 +1,121 @@
+import subprocess
+import sys
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from src.application.services.rule_compiler import RuleCompiler
+from src.domain.value_objects.residency_status import ResidencyType
+from src.library import TaxEngine
+
+
+RULE = {
+    "id": 1,
+    "country_code": "US",
+    "rule_type": "income_tax",
+    "version": "2024.1",
+    "tax_rule": {
+        "brackets": [
+            {"min_amount": 0, "max_amount": 500, "rate": 10},
+            {"min_amount": 501, "max_amount": 700, "rate": 12},
+            {"min_amount": 701, "max_amount": None, "rate": 15},
+        ],
+        "residency_variants": {"non_resident": {"calculation_type": "flat", "rate": 25}},
+    },
+}
+
+AMOUNTS = [0, 120.5, 500, 500.5, 600, 701, 1000, 123456.78]
+
+
+class TestTaxEngine:
+
+    @pytest.fixture
+    def engine(self):
+        return TaxEngine.from_rules([RULE])
+
+    @pytest.fixture
+    def compiled(self):
+        return RuleCompiler.default().compile(RULE)
+
+    def test_matches_compiled_rule(self, engine, compiled):
+        table = compiled.variants[ResidencyType.TAX_RESIDENT].table
+
+        result = engine.calculate(np.array(AMOUNTS), "income_tax")
+
+        assert result.tolist() == [round(table.tax_for(a), 2) for a in AMOUNTS]
+
+    def test_residency_variants(self, engine, compiled):
+        flat = compiled.variants[ResidencyType.NON_RESIDENT].table
+        prorated = compiled.variants[ResidencyType.PARTIAL_RESIDENT].table_for(73 / 365)
+
+        assert engine.calculate(AMOUNTS, "income_tax", residency="non_resident").tolist() == [
+            round(flat.tax_for(a), 2) for a in AMOUNTS
+        ]
+        assert engine.calculate(AMOUNTS, "income_tax", residency="partial_resident", days_resident=73).tolist() == [
+            round(prorated.tax_for(a), 2) for a in AMOUNTS
+        ]
+        with pytest.raises(ValueError):
+            engine.calculate(AMOUNTS, "income_tax", residency="partial_resident")
+
+    def test_missing_values_and_marginal_rates(self, engine):
+        result = engine.calculate([float("nan"), -10, 1000], "income_tax")
+
+        assert np.isnan(result[0])
+        assert result[1:].tolist() == [0.0, 118.73]
+        assert engine.marginal_rates([-10, 100, 500.5, 5000], "income_tax").tolist() == [0.0, 0.10, 0.0, 0.15]
+
+    def test_unknown_rule(self, engine):
+        with pytest.raises(LookupError):
+            engine.calculate(AMOUNTS, "income_tax", country_code="GB")
+
+    def test_snapshot_round_trip(self, engine, tmp_path):
+        path = tmp_path / "rules.json"
+        engine.write_snapshot(str(path))
+
+        loaded = TaxEngine.from_snapshot(str(path))
+
+        assert loaded.rule_version("income_tax") == "2024.1"
+        assert loaded.calculate(AMOUNTS, "income_tax").tolist() == engine.calculate(AMOUNTS, "income_tax").tolist()
+
+    def test_pandas_series_keeps_index(self, engine):
+        pd = pytest.importorskip("pandas")
+        incomes = pd.Series([1000.0, None], index=["a", "b"])
+
+        result = engine.calculate(incomes, "income_tax")
+
+        assert list(result.index) == ["a", "b"]
+        assert result["a"] == 118.73 and pd.isna(result["b"])
+
+    def test_arrow_nulls_stay_null(self, engine):
+        pa = pytest.importorskip("pyarrow")
+
+        result = engine.calculate(pa.array([1000.0, None]), "income_tax")
+
+        assert result.to_pylist() == [118.73, None]
+
+
+def test_importing_the_library_skips_the_web_stack():
+    probe = "import sys, src.library; print(','.join(m for m in ('fastapi', 'pydantic') if m in sys.modules))"
+    completed = subprocess.run([sys.executable, "-c", probe], capture_output=True, text=True, check=True)
+
+    assert completed.stdout.strip() == ""
+
+
+def test_cli_calculates_parquet_files(tmp_path):
+    pa = pytest.importorskip("pyarrow")
+    from src.application.services import columnar_io
+    from src.library.__main__ import main
+
+    TaxEngine.from_rules([RULE]).write_snapshot(str(tmp_path / "rules.json"))
+    columnar_io.write_table(pa.table({"amount": [1000.0, None]}), "parquet", str(tmp_path / "in.parquet"))
+
+    assert main([
+        "calculate", "--rules", str(tmp_path / "rules.json"), "--rule-type", "income_tax",
+        str(tmp_path / "in.parquet"), str(tmp_path / "out.arrow")
+    ]) == 0
+
+    result = columnar_io.read_table(str(tmp_path / "out.arrow"), "arrow").to_pydict()
+    assert result["tax_amount"] == [118.73, None]
+    assert result["effective_rate"] == [11.87, None]
+    assert result["rule_version"] == ["2024.1", "2024.1"]